@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Mede tempo e pico de memória do ASOKeywordAnalyzer em catálogos sintéticos de vários tamanhos.
+
+Os resultados são salvos em JSON e podem ser comparados com uma execução anterior
+(`--baseline`), falhando quando algum benchmark fica mais lento que a tolerância.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_corpus import generate_catalog, write_catalog
+from text_processing import AppDescriptionOptimizer
+from text_processing.AppDescriptionOptimizer import ASOKeywordAnalyzer
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(RAIZ, 'benchmarks', 'results')
+
+# Tamanhos de catálogo medidos por padrão (use --sizes para ir até 100000)
+DEFAULT_SIZES = (10, 100, 1000)
+
+# Aumento de tempo, em relação à linha de base, considerado regressão
+DEFAULT_TOLERANCE = 0.2
+
+# Versão do formato do arquivo de resultados
+RESULTS_FORMAT_VERSION = 1
+
+
+def bench_word_density(analyzer, apps):
+    for _, data in apps:
+        analyzer.analyze_word_density(data['descrição'])
+
+
+def bench_extract_keywords(analyzer, apps):
+    for _, data in apps:
+        analyzer.extract_keywords(data['descrição'])
+
+
+def bench_analyze_app(analyzer, apps):
+    for app_name, data in apps:
+        analyzer.analyze_app(app_name, data)
+
+
+# Benchmarks por função do analisador, executados sobre o catálogo em memória
+BENCHMARKS = {
+    'analyze_word_density': bench_word_density,
+    'extract_keywords': bench_extract_keywords,
+    'analyze_app': bench_analyze_app,
+}
+
+
+def measure(func, repeat):
+    """Melhor tempo (s) em `repeat` execuções e pico de memória (MB) de uma execução extra com tracemalloc."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    # O tracemalloc deixa a execução mais lenta, então a memória é medida à parte
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak / (1 << 20)
+
+
+def run_main(directory):
+    """Executa o `main()` completo (sem cache) com o catálogo salvo em `directory`/data/stores.json."""
+    previous = os.getcwd()
+    os.chdir(directory)
+    try:
+        AppDescriptionOptimizer.main(use_cache=False)
+    finally:
+        os.chdir(previous)
+
+
+def run_suite(sizes, benchmarks, repeat, seed):
+    """Executa os benchmarks pedidos em cada tamanho de catálogo, gerando um resultado por medição."""
+    analyzer = ASOKeywordAnalyzer()
+    for size in sizes:
+        apps = list(generate_catalog(size, seed))
+        characters = sum(len(data['descrição']) for _, data in apps)
+        # Aquece stopwords, tokenizador e NLTK antes de medir
+        bench_analyze_app(analyzer, apps[:1])
+
+        for name in benchmarks:
+            if name == 'main':
+                with tempfile.TemporaryDirectory() as directory:
+                    write_catalog(os.path.join(directory, 'data', 'stores.json'), size, seed)
+                    seconds, peak = measure(lambda: run_main(directory), repeat)
+            else:
+                seconds, peak = measure(lambda: BENCHMARKS[name](analyzer, apps), repeat)
+            result = {
+                'benchmark': name,
+                'apps': size,
+                'characters': characters,
+                'seconds': seconds,
+                'per_app_ms': seconds / size * 1000,
+                'peak_memory_mb': peak,
+            }
+            print(f"- {name:>20} | {size:>6} apps | {seconds * 1000:10.1f} ms | "
+                  f"{result['per_app_ms']:8.3f} ms/app | {peak:8.1f} MB")
+            yield result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results, path, seed, repeat):
+    """Salva os resultados com os metadados da máquina e do código medidos."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    payload = {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'metadata': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+    return path
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Compara os tempos com a linha de base, retornando os benchmarks que ficaram mais lentos que a tolerância."""
+    previous = {(item['benchmark'], item['apps']): item for item in baseline['results']}
+    regressions = []
+    for item in results:
+        base = previous.get((item['benchmark'], item['apps']))
+        if base is None:
+            continue
+        ratio = item['seconds'] / base['seconds'] if base['seconds'] else float('inf')
+        status = "REGRESSÃO" if ratio > 1 + tolerance else "ok"
+        print(f"- {item['benchmark']:>20} | {item['apps']:>6} apps | {ratio:6.2f}x da linha de base | {status}")
+        if ratio > 1 + tolerance:
+            regressions.append((item['benchmark'], item['apps'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="Tamanhos dos catálogos sintéticos (de 10 a 100000 apps)")
+    parser.add_argument("--benchmarks", nargs='+', choices=[*BENCHMARKS, 'main'], default=[*BENCHMARKS, 'main'])
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções por medição (vale o melhor tempo)")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do gerador de catálogos")
+    parser.add_argument("--output", help="Arquivo JSON de resultados (padrão: benchmarks/results/<data>.json)")
+    parser.add_argument("--baseline", help="Resultados anteriores para comparação")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Aumento de tempo tolerado em relação à linha de base (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    print(f"Benchmarks: {', '.join(args.benchmarks)} | tamanhos: {args.sizes} | semente: {args.seed}")
+    results = list(run_suite(args.sizes, args.benchmarks, args.repeat, args.seed))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    save_results(results, output, args.seed, args.repeat)
+    print(f"Resultados salvos em {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        print(f"Comparação com {args.baseline} (tolerância de {args.tolerance:.0%}):")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regressões encontradas")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
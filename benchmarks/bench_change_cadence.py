@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Compara a cadência de atualizações calculada app a app (listas de datas) e por grupos na tabela de eventos."""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from statistics import mean
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from changeslog.change_events import daily_update_counts, update_cadence
+
+
+def generate_events(n_apps, years, events_per_app, seed=42):
+    """Tabela de eventos sintética (app_id, date) com datas espalhadas por `years` anos."""
+    rng = np.random.default_rng(seed)
+    total = n_apps * events_per_app
+    span = int(years * 365 * 86400 * 1_000_000)
+    apps = [f"app.{index}" for index in range(n_apps)]
+    return pd.DataFrame({
+        'app_id': pd.Categorical(np.array(apps, dtype=object)[rng.integers(0, n_apps, total)], categories=apps),
+        'date': pd.Timestamp('2020-01-01', tz='UTC') + pd.to_timedelta(rng.integers(0, span, total), unit='us'),
+    })
+
+
+def per_app(events):
+    """Caminho anterior: listas de datas por app, ordenadas e percorridas em Python."""
+    dates = {}
+    for app_id, date in zip(events['app_id'], events['date']):
+        dates.setdefault(app_id, []).append(date)
+    result = {}
+    for app_id, app_dates in dates.items():
+        app_dates.sort()
+        intervals = [(app_dates[i] - app_dates[i - 1]).days for i in range(1, len(app_dates))]
+        result[app_id] = (mean(intervals) if intervals else 0, Counter(date.date() for date in app_dates))
+    return result
+
+
+def grouped(events):
+    return update_cadence(events), daily_update_counts(events)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=300)
+    parser.add_argument("--years", type=float, default=3)
+    parser.add_argument("--events-per-app", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    events = generate_events(args.apps, args.years, args.events_per_app)
+    print(f"{len(events)} eventos de {args.apps} apps em {args.years:g} anos")
+    timings = {}
+    for name, func in (("app a app", per_app), ("por grupos", grouped)):
+        start = time.perf_counter()
+        func(events)
+        timings[name] = time.perf_counter() - start
+        print(f"- {name:>10}: {timings[name] * 1000:9.1f} ms")
+    print(f"Aceleração por grupos: {timings['app a app'] / timings['por grupos']:.1f}x "
+          "(o caminho por grupos calcula também mediana, p90 e janelas móveis)")
+
+
+if __name__ == "__main__":
+    main()
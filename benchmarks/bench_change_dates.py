@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Compara a conversão de datas do changeslog uma a uma (`parse_date`) e em coluna (`parse_dates`)."""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from changeslog.change_events import parse_date
+from changeslog.timestamps import parse_dates
+
+
+def generate_dates(n, seed=42, millisecond_ratio=0.8):
+    """Datas no formato da API, com e sem milissegundos, espalhadas por dois anos."""
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    dates = []
+    for _ in range(n):
+        date = start + timedelta(seconds=rng.randrange(2 * 365 * 86400))
+        text = date.strftime('%Y-%m-%dT%H:%M:%S')
+        if rng.random() < millisecond_ratio:
+            text += f".{rng.randrange(1000):03d}"
+        dates.append(text + 'Z')
+    return dates
+
+
+def parse_one_by_one(values):
+    """Caminho anterior: uma chamada de `parse_date` por mudança, convertida depois em coluna."""
+    return pd.to_datetime([parse_date(value) for value in values], utc=True)
+
+
+def best_time(func, values, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(values)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000, help="Quantidade de datas convertidas")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    values = generate_dates(args.records, args.seed)
+    print(f"{len(values)} datas (com e sem milissegundos)")
+
+    one_by_one, expected = best_time(parse_one_by_one, values, args.repeat)
+    vectorized, result = best_time(parse_dates, values, args.repeat)
+    if not (result == expected).all():
+        raise SystemExit("As duas conversões não geraram as mesmas datas")
+    for name, seconds in (("parse_date", one_by_one), ("parse_dates", vectorized)):
+        print(f"- {name:>11}: {seconds * 1000:9.1f} ms ({seconds / len(values) * 1e9:6.0f} ns por data)")
+    print(f"Aceleração da conversão em coluna: {one_by_one / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Compara o relatório do changeslog gerado a partir dos arquivos JSON e a partir do repositório de eventos.
+
+Mede a leitura direta dos JSON, a primeira execução com o repositório (que ingere tudo) e uma segunda
+execução depois de uma nova coleta com poucas mudanças, em que só os eventos novos são processados.
+As tabelas por dia são iguais nos dois caminhos e, no markdown, custam o mesmo (tabulate); por padrão
+são escritas com `to_csv`, para medir só o que muda. Com `--tables`, usa o `to_markdown` (requer tabulate).
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from changeslog.app_change_tracker import CONSUMER, ChangeHistory, generate_reports
+from changeslog.change_events import STORE_FILES
+from changeslog.event_store import ChangeEventStore
+
+# Campos das mudanças sintéticas, com o peso de cada um
+FIELDS = {'version': 5, 'description': 3, 'icon': 1, 'title': 1, 'promotionalText': 1}
+
+
+def generate_changeslog(n_apps, changes_per_app, rng, start, id_prefix='', days=365):
+    """Changeslog sintético de uma loja ({app_id: {'content': [{'changes': [...]}]}}), com datas no formato da API.
+
+    Os `_id`s (`<id_prefix><app>-<índice>`) precisam ser únicos entre as lojas, como os da API.
+    """
+    fields, weights = list(FIELDS), list(FIELDS.values())
+    data = {}
+    for app in range(n_apps):
+        changes = []
+        for index in range(changes_per_app):
+            date = start + timedelta(seconds=rng.randrange(days * 86400))
+            changes.append({
+                '_id': f"{id_prefix}{app}-{index}",
+                'date': date.strftime('%Y-%m-%dT%H:%M:%S.') + f"{rng.randrange(1000):03d}Z",
+                'field': rng.choices(fields, weights)[0],
+                'previousValue': f"valor {index}",
+                'currentValue': f"valor {index + 1}",
+            })
+        data[f"app.{app}"] = {'content': [{'changes': changes}]}
+    return data
+
+
+def write_changeslogs(directory, data):
+    paths = {}
+    for store, store_data in data.items():
+        paths[store] = os.path.join(directory, STORE_FILES[store])
+        with open(paths[store], 'w', encoding='utf-8') as file:
+            json.dump(store_data, file)
+    return paths
+
+
+class _CsvTables:
+    """Troca `DataFrame.to_markdown` por `to_csv` enquanto ativo (as tabelas não dependem da origem dos eventos)."""
+
+    def __enter__(self):
+        self._to_markdown = getattr(pd.DataFrame, 'to_markdown', None)
+        pd.DataFrame.to_markdown = lambda frame: frame.to_csv()
+
+    def __exit__(self, *exc_info):
+        pd.DataFrame.to_markdown = self._to_markdown
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=200, help="Apps por loja")
+    parser.add_argument("--changes-per-app", type=int, default=500)
+    parser.add_argument("--new-changes-per-app", type=int, default=2, help="Mudanças novas na segunda coleta")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tables", action="store_true", help="Escreve as tabelas por dia com tabulate")
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    rng = random.Random(args.seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    data = {store: generate_changeslog(args.apps, args.changes_per_app, rng, start, id_prefix=f'{store}-')
+            for store in STORE_FILES}
+    print(f"{2 * args.apps * args.changes_per_app} mudanças de {2 * args.apps} apps; "
+          f"segunda coleta com {2 * args.apps * args.new_changes_per_app} mudanças novas")
+
+    with tempfile.TemporaryDirectory() as directory, nullcontext() if args.tables else _CsvTables():
+        store_path = os.path.join(directory, 'eventos.sqlite')
+        paths = write_changeslogs(directory, data)
+        timings = {
+            "JSON": timed(lambda: generate_reports(paths, directory)),
+            "repositório, 1ª execução": timed(lambda: generate_reports(paths, directory, store_path=store_path)),
+        }
+
+        # Nova coleta: os arquivos trazem tudo o que já foi visto mais algumas mudanças da última semana
+        later = start + timedelta(days=358)
+        for store, store_data in data.items():
+            new = generate_changeslog(args.apps, args.new_changes_per_app, rng, later,
+                                       id_prefix=f'{store}-novo-', days=7)
+            for app_id, app_data in new.items():
+                store_data[app_id]['content'].extend(app_data['content'])
+        paths = write_changeslogs(directory, data)
+        timings["JSON, nova coleta"] = timed(lambda: generate_reports(paths, directory))
+        timings["repositório, 2ª execução"] = timed(
+            lambda: generate_reports(paths, directory, store_path=store_path))
+
+        # Referência: recalcular as seções de mudanças relendo o repositório inteiro
+        with ChangeEventStore(store_path) as store:
+            timings["releitura do repositório"] = timed(lambda: ChangeHistory.from_events(store.events()))
+            assert store.events(CONSUMER).empty
+
+    for name, seconds in timings.items():
+        print(f"- {name:>25}: {seconds * 1000:9.1f} ms")
+    print(f"Segunda execução com o repositório: "
+          f"{timings['JSON, nova coleta'] / timings['repositório, 2ª execução']:.1f}x mais rápida que a leitura dos JSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Mede a taxa de acerto e o ganho do memo LRU de radicais num corpus de descrições."""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_processing.loader import iter_apps
+from text_processing.locales import DEFAULT_LOCALE, LOCALES, get_profile
+from text_processing.stemming import DEFAULT_MEMO_SIZE, STEMMERS, MemoStemmer
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_PADRAO = os.path.join(RAIZ, 'data', 'stores.json')
+CORPUS_TESTE = os.path.join(RAIZ, 'tests', 'data', 'descricoes_apps.json')
+
+
+def load_words(path, profile):
+    """Palavras (sem stopwords) de todas as descrições do corpus, na ordem em que o analisador as vê."""
+    stop_words = profile.stop_words
+    tokenize = profile.tokenizer.tokenize
+    return [
+        token
+        for _, data in iter_apps(path) if data.get('descrição')
+        for token in tokenize(data['descrição'].lower())
+        if token.isalnum() and token not in stop_words
+    ]
+
+
+def time_stemming(stem, words, repeat):
+    """Retorna o melhor tempo (em segundos) para radicalizar todas as palavras."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for word in words:
+            stem(word)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=CORPUS_PADRAO if os.path.exists(CORPUS_PADRAO) else CORPUS_TESTE)
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=DEFAULT_LOCALE)
+    parser.add_argument("--algorithm", choices=STEMMERS, help="Algoritmo de radicalização (padrão: o do locale)")
+    parser.add_argument("--memo-size", type=int, default=DEFAULT_MEMO_SIZE)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    profile = get_profile(args.locale)
+    words = load_words(args.corpus, profile)
+    print(f"Corpus: {args.corpus} ({len(words)} palavras, {len(set(words))} distintas)")
+
+    algorithm = args.algorithm or profile.stemmer_algorithm
+    raw = MemoStemmer(profile.language, algorithm).stemmer
+    uncached = time_stemming(raw.stem, words, args.repeat)
+
+    # Um memo novo a cada repetição, para medir também o aquecimento
+    timings = []
+    for _ in range(args.repeat):
+        memo = MemoStemmer(profile.language, algorithm, memo_size=args.memo_size)
+        timings.append(time_stemming(memo.stem, words, 1))
+    cached = min(timings)
+
+    info = memo.cache_info()
+    print(f"Radicalizador: {algorithm} ({profile.language}), memo de {args.memo_size} palavras")
+    print(f"- sem memo: {uncached * 1000:9.2f} ms")
+    print(f"- com memo: {cached * 1000:9.2f} ms ({info.currsize} palavras no memo)")
+    print(f"Taxa de acerto do memo: {memo.hit_rate:.1%} ({info.hits} acertos, {info.misses} falhas)")
+    print(f"Aceleração: {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
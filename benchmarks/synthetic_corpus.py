@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Gera catálogos sintéticos no formato do `data/stores.json`, com descrições realistas em português."""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_processing.loader import JSON_LINES_EXTENSIONS
+
+# Tamanho máximo de uma descrição (limite da Google Play)
+MAX_DESCRIPTION_LENGTH = 4000
+
+# Vocabulário de cada categoria: produtos, recursos e benefícios citados nas descrições
+CATEGORIAS = {
+    'finanças': {
+        'nomes': ["Banco", "Conta", "Carteira", "Invest", "Pay", "Cash"],
+        'produtos': ["conta digital", "cartão de crédito", "cartão de débito", "empréstimo pessoal",
+                     "investimentos", "seguro de vida", "previdência privada", "consórcio"],
+        'recursos': ["faça Pix", "pague boletos", "recarregue o celular", "acompanhe seus gastos",
+                     "transfira dinheiro", "invista a partir de R$ 1,00", "antecipe o FGTS",
+                     "parcele suas compras", "peça o cartão virtual", "gerencie seus limites"],
+        'beneficios': ["sem tarifas de manutenção", "cashback em todas as compras", "cartão sem anuidade",
+                       "rendimento diário de 100% do CDI", "aprovação em minutos", "Pix ilimitado",
+                       "limite que cresce com você", "saques gratuitos em todo o Brasil"],
+    },
+    'compras': {
+        'nomes': ["Loja", "Shop", "Mercado", "Oferta", "Compra", "Outlet"],
+        'produtos': ["eletrônicos", "moda", "casa e decoração", "beleza", "supermercado", "livros",
+                     "brinquedos", "esportes"],
+        'recursos': ["compare preços", "acompanhe seus pedidos", "salve produtos favoritos",
+                     "receba alertas de promoção", "pague com Pix", "parcele em até 12x sem juros",
+                     "avalie suas compras", "troque com facilidade"],
+        'beneficios': ["frete grátis", "entrega em 24 horas", "cupons exclusivos", "ofertas relâmpago",
+                       "desconto na primeira compra", "devolução grátis", "compra 100% segura",
+                       "milhões de produtos"],
+    },
+    'delivery': {
+        'nomes': ["Food", "Rango", "Entrega", "Pedido", "Delivery", "Sabor"],
+        'produtos': ["restaurantes", "mercados", "farmácias", "lanches", "pizzarias", "comida japonesa",
+                     "sobremesas", "bebidas"],
+        'recursos': ["peça em poucos cliques", "acompanhe a entrega em tempo real", "agende seu pedido",
+                     "pague pelo app", "salve seus endereços", "avalie os restaurantes",
+                     "repita pedidos anteriores", "divida a conta com amigos"],
+        'beneficios': ["entrega grátis", "cupons todos os dias", "descontos exclusivos",
+                       "entrega rápida", "milhares de restaurantes", "programa de fidelidade",
+                       "cashback em pedidos", "promoções no fim de semana"],
+    },
+    'saúde': {
+        'nomes': ["Saúde", "Vida", "Bem", "Fit", "Clínica", "Med"],
+        'produtos': ["consultas online", "exames", "planos de treino", "receitas saudáveis",
+                     "meditação guiada", "controle de medicamentos", "telemedicina", "nutrição"],
+        'recursos': ["agende consultas", "fale com um médico", "registre seus treinos",
+                     "acompanhe seu sono", "controle sua alimentação", "receba lembretes de remédios",
+                     "veja seus resultados de exames", "monitore seus batimentos"],
+        'beneficios': ["atendimento 24 horas", "médicos especialistas", "planos personalizados",
+                       "primeira consulta grátis", "sem filas", "dados protegidos",
+                       "resultados comprovados", "acompanhamento diário"],
+    },
+    'educação': {
+        'nomes': ["Aprenda", "Edu", "Curso", "Escola", "Estude", "Saber"],
+        'produtos': ["cursos de idiomas", "aulas de reforço", "preparatório para o Enem",
+                     "cursos de programação", "videoaulas", "exercícios", "simulados", "certificados"],
+        'recursos': ["estude no seu ritmo", "tire dúvidas com professores", "baixe aulas offline",
+                     "acompanhe seu progresso", "faça simulados", "pratique todos os dias",
+                     "receba certificados", "crie planos de estudo"],
+        'beneficios': ["aulas gratuitas", "professores qualificados", "conteúdo atualizado",
+                       "metodologia comprovada", "acesso ilimitado", "teste grátis por 7 dias",
+                       "certificado reconhecido", "aprendizado personalizado"],
+    },
+}
+
+ABERTURAS = [
+    "Baixe agora o {app} e descubra {beneficio}.",
+    "O {app} é o jeito mais simples de ter {produto} no seu celular.",
+    "Com o {app}, {recurso} e {recurso2} sem sair de casa.",
+    "Junte-se aos milhões de brasileiros que já usam o {app}.",
+    "Aproveite {beneficio} e {beneficio2} com o {app}.",
+]
+
+FRASES = [
+    "No {app}, {recurso}, {recurso2} e acompanhe tudo em tempo real.",
+    "Aproveite {beneficio} e {beneficio2}.",
+    "Oferecemos {produto} com {beneficio}.",
+    "{Recurso} a qualquer hora, de qualquer lugar.",
+    "Nosso app foi pensado para você: {recurso} com segurança e praticidade.",
+    "Conheça nossos serviços de {produto} e {produto2}.",
+    "Não perca: {beneficio} para novos clientes.",
+    "Segurança em primeiro lugar: biometria, senha e notificações a cada acesso.",
+    "Atendimento humano pelo chat, todos os dias da semana.",
+    "Mais de 10 milhões de downloads e nota 4,8 nas lojas.",
+]
+
+ITENS = [
+    "• {Beneficio};",
+    "• {Produto} com {beneficio};",
+    "• {Recurso} em poucos cliques;",
+]
+
+FECHAMENTOS = [
+    "Baixe agora e comece a usar!",
+    "Não perca tempo, baixe o {app} hoje mesmo.",
+    "Dúvidas? Fale com a gente pelo app.",
+    "Descubra por que o {app} é o favorito do Brasil.",
+]
+
+
+def _fill(template, rng, vocabulary, app):
+    """Preenche um modelo de frase com itens sorteados do vocabulário da categoria."""
+    values = {'app': app}
+    for slot, pool in (('produto', 'produtos'), ('recurso', 'recursos'), ('beneficio', 'beneficios')):
+        first, second = rng.sample(vocabulary[pool], 2)
+        values[slot], values[slot + '2'] = first, second
+        values[slot.capitalize()] = first[0].upper() + first[1:]
+    return template.format(**values)
+
+
+def generate_description(rng, category, app, length):
+    """Gera uma descrição com cerca de `length` caracteres (no máximo MAX_DESCRIPTION_LENGTH)."""
+    vocabulary = CATEGORIAS[category]
+    length = min(length, MAX_DESCRIPTION_LENGTH)
+    paragraphs = [_fill(rng.choice(ABERTURAS), rng, vocabulary, app)]
+    size = len(paragraphs[0])
+    while size < length:
+        if rng.random() < 0.3:
+            block = '\n'.join(_fill(rng.choice(ITENS), rng, vocabulary, app) for _ in range(rng.randint(2, 5)))
+        else:
+            block = ' '.join(_fill(rng.choice(FRASES), rng, vocabulary, app) for _ in range(rng.randint(1, 4)))
+        paragraphs.append(block)
+        size += len(block) + 2
+    paragraphs.append(_fill(rng.choice(FECHAMENTOS), rng, vocabulary, app))
+    return '\n\n'.join(paragraphs)[:MAX_DESCRIPTION_LENGTH]
+
+
+def generate_catalog(n_apps, seed=42, min_length=200, max_length=MAX_DESCRIPTION_LENGTH):
+    """Gera pares (app_name, data) de um catálogo sintético, sempre o mesmo para a mesma semente.
+
+    O tamanho das descrições segue uma distribuição log-normal entre `min_length` e `max_length`
+    caracteres, com a maior parte entre 800 e 2500, como nas lojas.
+    """
+    rng = random.Random(seed)
+    categories = sorted(CATEGORIAS)
+    for index in range(n_apps):
+        category = rng.choice(categories)
+        vocabulary = CATEGORIAS[category]
+        app = f"{rng.choice(vocabulary['nomes'])} {rng.choice(vocabulary['nomes'])} {index}"
+        produto = rng.choice(vocabulary['produtos'])
+        length = int(min(max(rng.lognormvariate(7.2, 0.6), min_length), max_length))
+        yield app, {
+            'titulo': f"{app}: {produto[0].upper()}{produto[1:]}",
+            'store': rng.choice(['google', 'apple']),
+            'lang': 'pt-BR',
+            'country': 'BR',
+            'descrição': generate_description(rng, category, app, length),
+        }
+
+
+def write_catalog(path, n_apps, seed=42, **kwargs):
+    """Salva o catálogo sintético em `path`, em JSON (como o stores.json) ou JSON Lines (.jsonl/.ndjson)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    items = generate_catalog(n_apps, seed, **kwargs)
+    with open(path, 'w', encoding='utf-8') as file:
+        if path.lower().endswith(JSON_LINES_EXTENSIONS):
+            for app_name, data in items:
+                file.write(json.dumps({app_name: data}, ensure_ascii=False) + '\n')
+            return path
+        # Escreve o objeto JSON aos poucos, sem montar o catálogo inteiro em memória
+        file.write('{\n')
+        for index, (app_name, data) in enumerate(items):
+            separator = ',\n' if index else ''
+            file.write(f"{separator}{json.dumps(app_name, ensure_ascii=False)}: {json.dumps(data, ensure_ascii=False)}")
+        file.write('\n}\n')
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", help="Arquivo de saída (.json ou .jsonl)")
+    parser.add_argument("--apps", type=int, default=1000, help="Quantidade de apps (ex.: 10 a 100000)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    write_catalog(args.output, args.apps, args.seed)
+    print(f"Catálogo com {args.apps} apps salvo em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
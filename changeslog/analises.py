@@ -136,6 +136,8 @@ import os
 from datetime import datetime
 from collections import Counter
 
+from changeslog.report_builder import Item, Paragraph, ReportBuilder, Section
+
 def load_data():
     # Função para carregar os dados
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -157,15 +159,14 @@ def load_data():
     return apple_data, google_data
 
 def analyze_versions(data):
-    analyses = []
-    frequencies = {}
-    history = {}
+    """Seção com o número de atualizações e o histórico de alterações de cada aplicativo.
 
-    for app_id, changes in data.items():
-        frequencies[app_id] = len(changes['content'])
-        
-        # Criar histórico de versões
-        history[app_id] = []
+    Os blocos são gerados conforme a seção é escrita, sem acumular o texto de todos os apps.
+    """
+    def app_history(changes):
+        yield Paragraph(f"Número de atualizações: {len(changes['content'])}")
+        yield Paragraph("Histórico de versões:")
+        empty = True
         for change in changes['content']:
             # Verifica se 'alteracoes' está presente e é uma lista
             if 'alteracoes' in change and isinstance(change['alteracoes'], list):
@@ -173,27 +174,17 @@ def analyze_versions(data):
                     # Extrai data e campo, se disponíveis
                     date = alteration.get('date', 'Data não disponível')
                     field = alteration.get('field', 'Campo não especificado')
-                    history[app_id].append({"date": date, "field": field})
-
-        # Adiciona informações sobre o aplicativo
-        analyses.append(f"### Aplicativo: {app_id}")
-        analyses.append(f"Número de atualizações: {frequencies[app_id]}")
-        
-        # Adiciona linha do tempo
-        analyses.append("Histórico de versões:")
-        if history[app_id]:  # Verifica se há entradas no histórico
-            for entry in history[app_id]:
-                analyses.append(f"- **Data**: {entry['date']} | **Campo**: {entry['field']}")
-        else:
-            analyses.append("- Nenhuma alteração registrada.")
-    
-    return "\n".join(analyses)
-
+                    empty = False
+                    yield Item(f"**Data**: {date} | **Campo**: {field}", {'date': date, 'field': field})
+        if empty:
+            yield Item("Nenhuma alteração registrada.")
 
+    apps = (Section(f"Aplicativo: {app_id}", app_history(changes), level=3) for app_id, changes in data.items())
+    return Section("Histórico de Versões", apps)
 
 
 def analyze_changes(data):
-    analyses = []
+    """Seção com a quantidade de mudanças por tipo (bugs, features, improvements), acumulada app a app."""
     change_types = {
         'bugs': 0,
         'features': 0,
@@ -201,45 +192,49 @@ def analyze_changes(data):
     }
     total_changes = 0
 
-    for app_id, changes in data.items():
-        for change in changes['content']:
-            # Supondo que 'changes' é uma lista de dicionários ou strings
-            if 'changes' in change:
-                # Verifica se 'changes' é uma lista
-                if isinstance(change['changes'], list):
-                    for change_description in change['changes']:
-                        # Se for um dicionário, talvez tenhamos que acessar uma chave específica
-                        if isinstance(change_description, dict):
-                            # Aqui você deve modificar 'description' para a chave correta que contém o texto
-                            description = change_description.get('description', '')
-                        else:
-                            description = change_description
+    def apps():
+        nonlocal total_changes
+        for app_id, changes in data.items():
+            for change in changes['content']:
+                # Supondo que 'changes' é uma lista de dicionários ou strings
+                if 'changes' in change:
+                    # Verifica se 'changes' é uma lista
+                    if isinstance(change['changes'], list):
+                        for change_description in change['changes']:
+                            # Se for um dicionário, talvez tenhamos que acessar uma chave específica
+                            if isinstance(change_description, dict):
+                                # Aqui você deve modificar 'description' para a chave correta que contém o texto
+                                description = change_description.get('description', '')
+                            else:
+                                description = change_description
 
-                        total_changes += 1
-                        # Verifica se a descrição menciona 'bug'
-                        if 'bug' in description.lower():
-                            change_types['bugs'] += 1
-                        elif 'feature' in description.lower():
-                            change_types['features'] += 1
-                        elif 'improvement' in description.lower():
-                            change_types['improvements'] += 1
+                            total_changes += 1
+                            # Verifica se a descrição menciona 'bug'
+                            if 'bug' in description.lower():
+                                change_types['bugs'] += 1
+                            elif 'feature' in description.lower():
+                                change_types['features'] += 1
+                            elif 'improvement' in description.lower():
+                                change_types['improvements'] += 1
 
-        analyses.append(f"### Aplicativo: {app_id}")
-        analyses.append(f"Número total de mudanças: {total_changes}")
-        analyses.append("Tipos de mudanças:")
-        for change_type, count in change_types.items():
-            analyses.append(f"- {change_type.capitalize()}: {count} ({(count / total_changes * 100) if total_changes > 0 else 0:.2f}%)")
+            blocks = [Paragraph(f"Número total de mudanças: {total_changes}"), Paragraph("Tipos de mudanças:")]
+            for change_type, count in change_types.items():
+                share = (count / total_changes * 100) if total_changes > 0 else 0
+                blocks.append(Item(f"{change_type.capitalize()}: {count} ({share:.2f}%)",
+                                   {'type': change_type, 'count': count, 'share': share}))
+            yield Section(f"Aplicativo: {app_id}", blocks, level=3)
 
-    return "\n".join(analyses)
+    return Section("Tipos de Mudanças", apps())
 
 
-def save_to_markdown(content):
+def save_to_markdown(sections):
+    """Escreve as seções em analyses.md conforme são geradas (veja `ReportBuilder`)."""
     current_dir = os.path.dirname(os.path.abspath(__file__))
     output_path = os.path.join(current_dir, 'analyses.md')
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+
+    with ReportBuilder(markdown_path=output_path) as builder:
+        builder.write_all(sections)
+
     print(f"Resultados da análise salvos em: {output_path}")
 
 def main():
@@ -252,14 +247,8 @@ def main():
     if google_data:
         combined_data.update(google_data)
 
-    analysis_results = []
-    
     if combined_data:
-        analysis_results.append(analyze_versions(combined_data))
-        analysis_results.append(analyze_changes(combined_data))
-    
-    if analysis_results:
-        save_to_markdown("\n".join(analysis_results))
+        save_to_markdown([analyze_versions(combined_data), analyze_changes(combined_data)])
     
     print("\nAnálise concluída.")
 
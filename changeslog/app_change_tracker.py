@@ -1,234 +1,450 @@
-import json
+import argparse
 import os
+import pickle
 from datetime import datetime
 import pandas as pd
 from collections import Counter, defaultdict
-from statistics import mean
-from typing import Dict, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 import logging
 
+import numpy as np
+
+from changeslog.change_events import (CADENCE_WINDOW, changes_per_app, count_change_types, daily_update_counts,
+                                      default_store_paths, get_update_frequency, last_change_per_app,
+                                      load_change_events, update_cadence)
+# Reexportados para quem ainda usa `app_change_tracker.load_data` e `app_change_tracker.parse_date`,
+# que eram definidos neste módulo antes de irem para `change_events`
+from changeslog.change_events import load_store_data as load_data, parse_date  # noqa: F401
+from changeslog.event_store import DEFAULT_STORE_PATH, ChangeEventStore
+from changeslog.report_builder import Item, Paragraph, ReportBuilder, Section, Table, render_markdown
+
+# Nome deste rastreador nas marcas do repositório de eventos
+CONSUMER = 'app_change_tracker'
+
 # Configuração do logging
 logging.basicConfig(level=logging.INFO)
 
-def parse_date(date_str: str) -> datetime:
-    """Converte string de data para datetime."""
-    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+# Título e visão geral do relatório
+REPORT_TITLE = "Relatório de Análise de Changeslog de Aplicativos Bancários"
+OVERVIEW = ("Este relatório apresenta uma análise detalhada das mudanças nos aplicativos bancários, abordando "
+            "atualizações de versão, mudanças de título, textos promocionais e ícones.")
+
+# Título e visão geral do relatório dos eventos novos (`--incremental`)
+INCREMENTAL_TITLE = "Relatório de Mudanças Novas nos Aplicativos Bancários"
+INCREMENTAL_OVERVIEW = ("Este relatório lista só as mudanças que chegaram desde a execução anterior. A cadência, a "
+                        "frequência de atualizações e as tabelas por dia, que dependem do histórico completo, ficam "
+                        "no relatório principal.")
+
+# Versão do estado (`ChangeHistory`) guardado no repositório de eventos; estados de outra versão são descartados
+STATE_FORMAT_VERSION = 1
+
+
+def _day(date: datetime) -> str:
+    """Data no formato AAAA-MM-DD (bem mais barato que `strftime` em Timestamps)."""
+    return date.date().isoformat()
+
+
+def _last_change_items(changes: dict, label: str, quoted: bool = False):
+    """Itens "Em <data>, de <label> X para Y" da última mudança de cada app, gerados sob demanda."""
+    for app_id, (date, previous, current) in changes.items():
+        values = f"'{previous}' para '{current}'" if quoted else f"{previous} para {current}"
+        yield Item(f"**{app_id}**: Em {_day(date)}, de {label} {values}",
+                   {'app_id': app_id, 'date': date, 'previous': previous, 'current': current})
+
 
 class VersionUpdateAnalysis:
     def __init__(self):
         """Inicializa a classe VersionUpdateAnalysis."""
         self.version_updates = {}
 
+    @classmethod
+    def from_events(cls, events: pd.DataFrame) -> "VersionUpdateAnalysis":
+        """Cria a análise a partir da tabela de eventos, com a última mudança de 'version' de cada app."""
+        analysis = cls()
+        analysis.version_updates = last_change_per_app(events, 'version')
+        return analysis
+
     def process(self, app_id: str, change_date: datetime, previous_version: str, current_version: str):
         """Processa uma atualização de versão."""
         self.version_updates[app_id] = (change_date, previous_version, current_version)
 
+    def section(self) -> Section:
+        """Seção do relatório com as atualizações de versão (itens gerados conforme são escritos)."""
+        return Section("Análise de Atualizações de Versão", _last_change_items(self.version_updates, 'versão'))
+
     def generate_report(self) -> str:
         """Gera um relatório em Markdown com as atualizações de versão."""
-        report = "\n## Análise de Atualizações de Versão\n"
-        for app_id, (date, prev_version, curr_version) in self.version_updates.items():
-            report += f"- **{app_id}**: Em {date.strftime('%Y-%m-%d')}, de versão {prev_version} para {curr_version}\n"
-        return report
+        return render_markdown(self.section())
 
 class TitleChangeAnalysis:
     def __init__(self):
         """Inicializa a classe TitleChangeAnalysis."""
         self.title_changes = {}
 
+    @classmethod
+    def from_events(cls, events: pd.DataFrame) -> "TitleChangeAnalysis":
+        """Cria a análise a partir da tabela de eventos, com a última mudança de 'title' de cada app."""
+        analysis = cls()
+        analysis.title_changes = last_change_per_app(events, 'title')
+        return analysis
+
     def process(self, app_id: str, change_date: datetime, previous_title: str, current_title: str):
         """Processa uma mudança de título."""
         self.title_changes[app_id] = (change_date, previous_title, current_title)
 
+    def section(self) -> Section:
+        """Seção do relatório com as mudanças de título."""
+        return Section("Análise de Mudanças de Título", _last_change_items(self.title_changes, 'título', quoted=True))
+
     def generate_report(self) -> str:
         """Gera um relatório em Markdown com as mudanças de título."""
-        report = "\n## Análise de Mudanças de Título\n"
-        for app_id, (date, prev_title, curr_title) in self.title_changes.items():
-            report += f"- **{app_id}**: Em {date.strftime('%Y-%m-%d')}, de título '{prev_title}' para '{curr_title}'\n"
-        return report
+        return render_markdown(self.section())
 
 class PromotionalTextChangeAnalysis:
     def __init__(self):
         """Inicializa a classe PromotionalTextChangeAnalysis."""
         self.promo_text_changes = {}
 
+    @classmethod
+    def from_events(cls, events: pd.DataFrame) -> "PromotionalTextChangeAnalysis":
+        """Cria a análise a partir da tabela de eventos, com a última mudança de 'promotionalText' de cada app."""
+        analysis = cls()
+        analysis.promo_text_changes = last_change_per_app(events, 'promotionalText')
+        return analysis
+
     def process(self, app_id: str, change_date: datetime, previous_promo: str, current_promo: str):
         """Processa uma mudança de texto promocional."""
         self.promo_text_changes[app_id] = (change_date, previous_promo, current_promo)
 
+    def section(self) -> Section:
+        """Seção do relatório com as mudanças de texto promocional."""
+        return Section("Análise de Mudanças em Texto Promocional",
+                       _last_change_items(self.promo_text_changes, 'texto promocional', quoted=True))
+
     def generate_report(self) -> str:
         """Gera um relatório em Markdown com as mudanças de texto promocional."""
-        report = "\n## Análise de Mudanças em Texto Promocional\n"
-        for app_id, (date, prev_promo, curr_promo) in self.promo_text_changes.items():
-            report += f"- **{app_id}**: Em {date.strftime('%Y-%m-%d')}, de texto promocional '{prev_promo}' para '{curr_promo}'\n"
-        return report
+        return render_markdown(self.section())
 
 class IconChangeAnalysis:
     def __init__(self):
         """Inicializa a classe IconChangeAnalysis."""
         self.icon_changes = defaultdict(list)
 
+    @classmethod
+    def from_events(cls, events: pd.DataFrame) -> "IconChangeAnalysis":
+        """Cria a análise a partir da tabela de eventos, com todas as mudanças de ícone de cada app."""
+        analysis = cls()
+        analysis.icon_changes.update(changes_per_app(events, 'icon'))
+        return analysis
+
     def process(self, app_id: str, change_date: datetime, previous_icon: str, current_icon: str):
         """Processa uma mudança de ícone."""
         self.icon_changes[app_id].append((change_date, previous_icon, current_icon))
 
+    def section(self) -> Section:
+        """Seção do relatório com as mudanças de ícone, uma subseção por app."""
+        def apps():
+            for app_id, changes in self.icon_changes.items():
+                yield Section(f"{app_id}:", (
+                    Item(f"**Data**: {_day(date)}",
+                         {'app_id': app_id, 'date': date, 'previous': prev_icon, 'current': curr_icon})
+                    for date, prev_icon, curr_icon in changes
+                ), level=3)
+        return Section("Análise de Mudanças de Ícone", apps())
+
     def generate_report(self) -> str:
         """Gera um relatório em Markdown com as mudanças de ícone."""
-        report = "\n## Análise de Mudanças de Ícone\n"
-        for app_id, changes in self.icon_changes.items():
-            report += f"\n### {app_id}:\n"
-            for date, prev_icon, curr_icon in changes:
-                report += f"- **Data**: {date.strftime('%Y-%m-%d')}\n"
-        return report
+        return render_markdown(self.section())
 
 class UpdateFrequencyAnalysis:
-    def __init__(self):
-        """Inicializa a classe UpdateFrequencyAnalysis."""
+    def __init__(self, window: str = CADENCE_WINDOW):
+        """Inicializa a classe UpdateFrequencyAnalysis, com a janela móvel usada na cadência (ex.: '30D')."""
+        self.window = window
         self.update_frequency = defaultdict(list)
+        # Tabela com app_id e date; montada a partir de update_frequency se vier de `process`
+        self.events = None
+
+    @classmethod
+    def from_events(cls, events: pd.DataFrame, window: str = CADENCE_WINDOW) -> "UpdateFrequencyAnalysis":
+        """Cria a análise a partir da tabela de eventos, usando as datas de todas as mudanças de cada app."""
+        analysis = cls(window)
+        analysis.events = events[['app_id', 'date']]
+        return analysis
 
     def process(self, app_id: str, change_date: datetime):
         """Processa uma atualização de frequência."""
         self.update_frequency[app_id].append(change_date)
+        self.events = None
+
+    def dates_table(self) -> pd.DataFrame:
+        """Tabela (app_id, date) das mudanças, montada uma vez a partir das datas processadas."""
+        if self.events is None:
+            app_ids = list(self.update_frequency)
+            lengths = [len(dates) for dates in self.update_frequency.values()]
+            self.events = pd.DataFrame({
+                'app_id': pd.Categorical(np.repeat(np.array(app_ids, dtype=object), lengths), categories=app_ids),
+                'date': pd.to_datetime([date for dates in self.update_frequency.values() for date in dates], utc=True),
+            })
+        return self.events
 
     def calculate_intervals(self, dates: List[datetime]) -> Tuple[float, List[float]]:
-        """Calcula os intervalos entre as datas de atualização."""
-        dates.sort()
-        intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-        avg_interval = mean(intervals) if intervals else 0
+        """Calcula os intervalos (em dias inteiros) entre as datas de atualização."""
+        stamps = pd.DatetimeIndex(pd.to_datetime(dates, utc=True)).sort_values()
+        intervals = (stamps[1:] - stamps[:-1]).days.tolist()
+        avg_interval = float(np.mean(intervals)) if intervals else 0
         return avg_interval, intervals
 
+    def cadence(self) -> pd.DataFrame:
+        """Intervalo médio, mediano e p90 e mudanças em janelas móveis de cada app (veja `update_cadence`)."""
+        return update_cadence(self.dates_table(), self.window)
+
+    def section(self) -> Section:
+        """Seção do relatório com a cadência e as atualizações por dia de cada app."""
+        events = self.dates_table()
+        daily = daily_update_counts(events)
+        window_days = pd.Timedelta(self.window).days
+        cadence = update_cadence(events, self.window)
+
+        def app_blocks(app_id, stats):
+            yield Item(f"**Intervalo médio entre atualizações**: {stats.mean_interval_days:.2f} dias",
+                       {'mean_interval_days': stats.mean_interval_days})
+            yield Item(f"**Intervalo mediano**: {stats.median_interval_days:.2f} dias, "
+                       f"**p90**: {stats.p90_interval_days:.2f} dias",
+                       {'median_interval_days': stats.median_interval_days,
+                        'p90_interval_days': stats.p90_interval_days})
+            yield Item(f"**Atualizações em {window_days} dias**: até {stats.max_window_updates} numa janela móvel, "
+                       f"{stats.recent_window_updates} na janela mais recente",
+                       {'window_days': window_days, 'max_window_updates': stats.max_window_updates,
+                        'recent_window_updates': stats.recent_window_updates})
+            for date, count in daily[app_id]:
+                yield Item(f"**Data**: {date}, **Atualizações**: {count}", {'date': date, 'updates': count})
+
+        apps = (Section(f"{app_id}:", app_blocks(app_id, stats), level=3)
+                for app_id, stats in zip(cadence.index, cadence.itertuples(index=False)))
+        return Section("Frequência de Atualizações", apps)
+
     def generate_report(self) -> str:
         """Gera um relatório em Markdown com a frequência de atualizações."""
-        report = "\n## Frequência de Atualizações\n"
-        for app_id, dates in self.update_frequency.items():
-            avg_interval, intervals = self.calculate_intervals(dates)
-            report += f"\n### {app_id}:\n"
-            report += f"- **Intervalo médio entre atualizações**: {avg_interval:.2f} dias\n"
-            for date, count in Counter([d.date() for d in dates]).items():
-                report += f"- **Data**: {date}, **Atualizações**: {count}\n"
-        return report
-
-def load_data(file_path: str) -> Dict:
-    """Carrega dados do arquivo JSON."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        logging.error(f"Arquivo não encontrado: {file_path}")
-        return {}
-    except json.JSONDecodeError:
-        logging.error(f"Erro ao decodificar JSON: {file_path}")
-        return {}
-
-def count_change_types(data: Dict) -> Counter:
-    """Conta a frequência de cada tipo de mudança."""
-    change_counter = Counter()
-    for app_id, app_data in data.items():
-        for entry in app_data.get('content', []):
-            for change in entry.get('changes', []):
-                change_counter[change['field']] += 1
-    return change_counter
-
-def get_update_frequency(data: Dict) -> pd.DataFrame:
-    """Obtém a frequência de atualizações usando Pandas."""
-    update_dates = defaultdict(list)
-    for app_id, app_data in data.items():
-        for entry in app_data.get('content', []):
-            for change in entry.get('changes', []):
-                date_obj = datetime.strptime(change['date'], "%Y-%m-%dT%H:%M:%S.%fZ")
-                update_dates[app_id].append(date_obj.date())
-    # Construir DataFrame para série temporal
-    freq_df = pd.DataFrame([(app_id, date) for app_id, dates in update_dates.items() for date in dates],
-                           columns=['App ID', 'Date'])
-    freq_df['Date'] = pd.to_datetime(freq_df['Date'])
-    return freq_df.groupby(['App ID', 'Date']).size().unstack(fill_value=0)
-
-def generate_markdown_report(analyses: List[str], output_path: str):
-    """Gera um relatório em Markdown com as análises."""
-    report = "# Relatório de Análise de Changeslog de Aplicativos Bancários\n"
-    report += "## Visão Geral\n"
-    report += "Este relatório apresenta uma análise detalhada das mudanças nos aplicativos bancários, abordando atualizações de versão, mudanças de título, textos promocionais e ícones.\n"
-
-    for analysis in analyses:
-        report += analysis
-
-    with open(output_path, 'w', encoding='utf-8') as file:
-        file.write(report)
-
-def main():
-    # Caminhos dos arquivos
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    apple_path = os.path.join(current_dir, 'data', 'changeslog_apple_results.json')
-    google_path = os.path.join(current_dir, 'data', 'changeslog_google_results.json')
-    output_path = os.path.join(current_dir, 'data', 'relatorio_analise_changeslog.md')
-
-    # Carregar dados
-    apple_data = load_data(apple_path)
-    google_data = load_data(google_path)
-    all_data = {**apple_data, **google_data}
-
-    # Instanciar classes de análise
-    version_analysis = VersionUpdateAnalysis()
-    title_analysis = TitleChangeAnalysis()
-    promo_text_analysis = PromotionalTextChangeAnalysis()
-    icon_analysis = IconChangeAnalysis()
-    frequency_analysis = UpdateFrequencyAnalysis()
-
-    # Processar dados
-    for app_id, app_data in all_data.items():
-        for entry in app_data.get('content', []):
-            for change in entry.get('changes', []):
-                change_date = parse_date(change['date'])
-                field = change['field']
-
-                if field == 'version':
-                    version_analysis.process(app_id, change_date, change.get('previousValue'), change.get('currentValue'))
-                elif field == 'title':
-                    title_analysis.process(app_id, change_date, change.get('previousValue'), change.get('currentValue'))
-                elif field == 'promotionalText':
-                    promo_text_analysis.process(app_id, change_date, change.get('previousValue'), change.get('currentValue'))
-                elif field == 'icon':
-                    icon_analysis.process(app_id, change_date, change.get('previousValue', ''), change.get('currentValue', ''))
-
-                frequency_analysis.process(app_id, change_date)
-
-    # Contagem de tipos de mudanças
-    apple_change_types = count_change_types(apple_data)
-    google_change_types = count_change_types(google_data)
-
-    # Frequência de atualizações com Pandas
-    apple_update_freq = get_update_frequency(apple_data)
-    google_update_freq = get_update_frequency(google_data)
+        return render_markdown(self.section())
+
+
+def generate_markdown_report(sections: Iterable[Section], output_path: str, json_path: Optional[str] = None,
+                             title: str = REPORT_TITLE, overview: str = OVERVIEW):
+    """Gera o relatório com as seções em Markdown (e em JSON, se `json_path` for dado), numa única passada.
+
+    Cada seção é escrita assim que é produzida (veja `ReportBuilder`), sem montar o relatório em memória.
+    """
+    with ReportBuilder(markdown_path=output_path, json_path=json_path, title=title) as builder:
+        builder.write(Section("Visão Geral", [Paragraph(overview)]))
+        builder.write_all(sections)
+
+
+def incremental_path(path: Optional[str]) -> Optional[str]:
+    """Caminho do relatório dos eventos novos: `relatorio.md` → `relatorio_incremental.md`."""
+    if path is None:
+        return None
+    root, extension = os.path.splitext(path)
+    return f"{root}_incremental{extension}"
+
+
+def change_types_section(apple_change_types: Counter, google_change_types: Counter) -> Section:
+    """Seção com a quantidade de mudanças de cada tipo por loja."""
+    def stores():
+        for name, change_types in (("Apple Store:", apple_change_types), ("Google Play:", google_change_types)):
+            yield Section(name, [Item(f"{field}: {count} mudanças", {'field': field, 'changes': count})
+                                 for field, count in change_types.items()], level=4)
+    return Section("2. Impacto no Posicionamento nas Lojas de Apps",
+                   [Section("Mudanças mais comuns por tipo", stores(), level=3)])
+
+def parse_args(argv=None):
+    """Lê as opções de linha de comando do rastreador."""
+    parser = argparse.ArgumentParser(description="Gera o relatório de mudanças dos apps a partir do changeslog.")
+    parser.add_argument("--store", nargs='?', const=DEFAULT_STORE_PATH, default=None,
+                        help="Acumula os eventos num repositório SQLite sem duplicatas e processa só os que "
+                             f"chegaram depois da última execução (padrão: {DEFAULT_STORE_PATH})")
+    parser.add_argument("--json", dest="json_path",
+                        help="Salva também o relatório em JSON, com as mesmas seções do markdown")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Salva também um relatório só com as mudanças que chegaram depois da última "
+                             "execução com o repositório (implica --store)")
+    return parser.parse_args(argv)
+
+
+def _plain_change(change: tuple) -> tuple:
+    """Mudança (data, anterior, atual) com a data como `datetime`, que o pickle lê bem mais rápido que `Timestamp`."""
+    date, previous, current = change
+    if isinstance(date, pd.Timestamp):
+        date = date.to_pydatetime()
+    return date, previous, current
+
+
+class ChangeHistory:
+    """Mudanças já analisadas: a última de versão, título e texto promocional, os ícones e as contagens por tipo.
+
+    `update` acrescenta só os eventos novos (na ordem de ingestão) ao que já foi calculado, com o mesmo
+    resultado de analisar o histórico inteiro de uma vez. Com o repositório de eventos, o estado é salvo
+    junto com as marcas, e cada execução processa só o que chegou depois da anterior.
+    """
+
+    def __init__(self):
+        self.icon_analysis = IconChangeAnalysis()
+        self.version_analysis = VersionUpdateAnalysis()
+        self.title_analysis = TitleChangeAnalysis()
+        self.promo_text_analysis = PromotionalTextChangeAnalysis()
+        self.change_types = {'apple': Counter(), 'google': Counter()}
+
+    @classmethod
+    def from_events(cls, events: pd.DataFrame) -> "ChangeHistory":
+        """Cria o histórico a partir de uma tabela de eventos."""
+        history = cls()
+        history.update(events)
+        return history
+
+    def update(self, events: pd.DataFrame):
+        """Acrescenta eventos posteriores aos já processados (apps novos entram no fim de cada seção)."""
+        for app_id, changes in changes_per_app(events, 'icon').items():
+            self.icon_analysis.icon_changes[app_id].extend(changes)
+        self.version_analysis.version_updates.update(last_change_per_app(events, 'version'))
+        self.title_analysis.title_changes.update(last_change_per_app(events, 'title'))
+        self.promo_text_analysis.promo_text_changes.update(last_change_per_app(events, 'promotionalText'))
+        for store, change_types in self.change_types.items():
+            change_types.update(count_change_types(events, store=store))
+
+    def sections(self) -> List[Section]:
+        """Seções que listam as mudanças (ícones, versões, títulos e textos promocionais)."""
+        return [
+            self.icon_analysis.section(),
+            self.version_analysis.section(),
+            self.title_analysis.section(),
+            self.promo_text_analysis.section(),
+        ]
+
+    def change_types_section(self) -> Section:
+        """Seção com a contagem de tipos de mudança de cada loja."""
+        return change_types_section(self.change_types['apple'], self.change_types['google'])
+
+    def dumps(self) -> bytes:
+        """Serializa o histórico (pickle de dicionários simples) para guardar no repositório de eventos.
+
+        Só os dados vão para o pickle, não as classes, para que o estado salvo por `python -m` (em que o
+        módulo é `__main__`) possa ser lido ao importar o módulo, e vice-versa.
+        """
+        state = {
+            'icon': {app_id: [_plain_change(change) for change in changes]
+                     for app_id, changes in self.icon_analysis.icon_changes.items()},
+            'version': {app_id: _plain_change(change) for app_id, change in self.version_analysis.version_updates.items()},
+            'title': {app_id: _plain_change(change) for app_id, change in self.title_analysis.title_changes.items()},
+            'promotionalText': {app_id: _plain_change(change)
+                                for app_id, change in self.promo_text_analysis.promo_text_changes.items()},
+            'change_types': self.change_types,
+        }
+        return pickle.dumps((STATE_FORMAT_VERSION, state), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def loads(cls, data: bytes) -> "ChangeHistory":
+        """Lê um histórico serializado com `dumps`."""
+        version, state = pickle.loads(data)
+        if version != STATE_FORMAT_VERSION:
+            raise ValueError(f"Versão do estado incompatível: {version} (esperada {STATE_FORMAT_VERSION})")
+        history = cls()
+        history.icon_analysis.icon_changes.update(state['icon'])
+        history.version_analysis.version_updates = state['version']
+        history.title_analysis.title_changes = state['title']
+        history.promo_text_analysis.promo_text_changes = state['promotionalText']
+        history.change_types = state['change_types']
+        return history
+
+
+def load_history(store: ChangeEventStore) -> ChangeHistory:
+    """Histórico guardado pelo rastreador no repositório; sem estado válido, as marcas voltam ao início."""
+    data = store.state(CONSUMER)
+    if data is not None:
+        try:
+            return ChangeHistory.loads(data)
+        except (ValueError, KeyError, EOFError, pickle.UnpicklingError) as e:
+            logging.warning(f"Estado do rastreador descartado: {e}")
+    # Marcas sem o estado correspondente (de uma versão anterior) fariam o histórico perder eventos
+    store.reset(CONSUMER)
+    return ChangeHistory()
+
+
+def generate_reports(paths, output_dir, store_path=None, incremental=False, json_path=None):
+    """Gera o relatório principal e as tabelas de frequência em `output_dir` a partir dos arquivos de changeslog.
+
+    Sem `store_path`, os arquivos são lidos e analisados por inteiro. Com `store_path`, os eventos são
+    acumulados no repositório e só os que chegaram depois da execução anterior são processados: as seções
+    de mudanças combinam esses eventos com o histórico guardado, e a cadência e as tabelas por dia, que
+    precisam de todas as datas, leem só app, loja e data de cada evento. Com `incremental`, as mudanças
+    novas vão também para um relatório separado (veja `incremental_path`).
+    """
+    output_path = os.path.join(output_dir, 'relatorio_analise_changeslog.md')
+    store = None
+    if store_path:
+        # Só os arquivos que mudaram são lidos; eventos já guardados (mesmo `_id`) são ignorados
+        store = ChangeEventStore(store_path)
+        store.ingest_files(paths)
+        history = load_history(store)
+        new_events = store.events(CONSUMER)
+        logging.info(f"{len(new_events)} eventos novos de {len(store)} no repositório {store.path}")
+        history.update(new_events)
+        dates = store.dates()
+    else:
+        # Carregar os dois arquivos numa única tabela de eventos, da qual saem todas as análises
+        dates = new_events = load_change_events(paths)
+        history = ChangeHistory.from_events(new_events)
+
+    frequency_analysis = UpdateFrequencyAnalysis.from_events(dates)
+
+    # Frequência de atualizações por app e dia
+    apple_update_freq = get_update_frequency(dates, store='apple')
+    google_update_freq = get_update_frequency(dates, store='google')
 
     # Salvar as tabelas de frequência em CSV
-    apple_update_freq.to_csv(os.path.join(current_dir, 'data', 'apple_update_freq.csv'))
-    google_update_freq.to_csv(os.path.join(current_dir, 'data', 'google_update_freq.csv'))
+    apple_update_freq.to_csv(os.path.join(output_dir, 'apple_update_freq.csv'))
+    google_update_freq.to_csv(os.path.join(output_dir, 'google_update_freq.csv'))
 
     # Gerar e salvar relatório
     generate_markdown_report(
         [
-            icon_analysis.generate_report(),
-            version_analysis.generate_report(),
-            title_analysis.generate_report(),
-            promo_text_analysis.generate_report(),
-            frequency_analysis.generate_report(),
-            f"\n## 2. Impacto no Posicionamento nas Lojas de Apps\n",
-            f"### Mudanças mais comuns por tipo\n",
-            f"#### Apple Store:\n",
-            "\n".join([f"- {field}: {count} mudanças" for field, count in apple_change_types.items()]),
-            f"\n#### Google Play:\n",
-            "\n".join([f"- {field}: {count} mudanças" for field, count in google_change_types.items()]),
-            f"\n## 3. Frequência de Atualizações\n",
-            f"### Apple Store\n",
-            apple_update_freq.to_markdown(),
-            f"\n### Google Play\n",
-            google_update_freq.to_markdown(),
-            f"\n## 4. Conclusão\n",
-            f"As análises sugerem que mudanças frequentes em ícones e descrições podem ter impacto nas lojas de apps.\n"
+            *history.sections(),
+            frequency_analysis.section(),
+            history.change_types_section(),
+            Section("3. Frequência de Atualizações", [
+                Section("Apple Store", [Table(apple_update_freq)], level=3),
+                Section("Google Play", [Table(google_update_freq)], level=3),
+            ]),
+            Section("4. Conclusão", [Paragraph(
+                "As análises sugerem que mudanças frequentes em ícones e descrições podem ter impacto nas lojas de apps."
+            )]),
         ],
-        output_path
+        output_path,
+        json_path,
     )
 
     logging.info(f"Relatório gerado com sucesso em: {output_path}")
 
+    if store is not None:
+        if incremental:
+            # As mudanças novas vão para um relatório separado, sem sobrescrever o principal
+            delta = ChangeHistory.from_events(new_events)
+            delta_path = incremental_path(output_path)
+            generate_markdown_report([*delta.sections(), delta.change_types_section()],
+                                     delta_path, incremental_path(json_path),
+                                     title=INCREMENTAL_TITLE, overview=INCREMENTAL_OVERVIEW)
+            logging.info(f"Relatório das mudanças novas gerado em: {delta_path}")
+        # As marcas (e o histórico) só avançam depois que os relatórios foram salvos
+        store.advance(CONSUMER, new_events, state=history.dumps())
+        store.close()
+    return output_path
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Caminhos dos arquivos
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+    store_path = args.store or (DEFAULT_STORE_PATH if args.incremental else None)
+    generate_reports(default_store_paths(data_dir), data_dir, store_path=store_path,
+                     incremental=args.incremental, json_path=args.json_path)
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,221 @@
+import json
+import logging
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from changeslog.timestamps import parse_dates
+
+# Arquivos gerados pelo rankmyapp_data_collector.py para cada loja
+STORE_FILES = {
+    'apple': 'changeslog_apple_results.json',
+    'google': 'changeslog_google_results.json',
+}
+
+# Colunas da tabela de eventos de mudança, na ordem em que aparecem no DataFrame
+EVENT_COLUMNS = ['app_id', 'store', 'change_id', 'date', 'field', 'previous_value', 'current_value']
+
+# Colunas com poucos valores distintos, guardadas como categóricas
+CATEGORICAL_COLUMNS = ('app_id', 'store', 'field')
+
+# Janela móvel usada na cadência de atualizações
+CADENCE_WINDOW = '30D'
+
+# Colunas de `update_cadence`
+CADENCE_COLUMNS = ['updates', 'mean_interval_days', 'median_interval_days', 'p90_interval_days',
+                   'max_window_updates', 'recent_window_updates']
+
+logger = logging.getLogger(__name__)
+
+
+def parse_date(date_str: str) -> datetime:
+    """Converte string de data para datetime (uma por vez; para colunas inteiras, use `parse_dates`)."""
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
+def load_store_data(file_path: str) -> Dict:
+    """Carrega o JSON de changeslog de uma loja ({app_id: {'content': [...]}}); vazio se faltar ou for inválido."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        logger.error(f"Arquivo não encontrado: {file_path}")
+        return {}
+    except json.JSONDecodeError:
+        logger.error(f"Erro ao decodificar JSON: {file_path}")
+        return {}
+
+
+def default_store_paths(data_dir: str) -> Dict[str, str]:
+    """Caminhos dos arquivos de changeslog de cada loja dentro de `data_dir`."""
+    return {store: os.path.join(data_dir, file_name) for store, file_name in STORE_FILES.items()}
+
+
+def _categorical(values: List) -> pd.Categorical:
+    """Categórica com as categorias na ordem da primeira ocorrência (a mesma ordem dos arquivos)."""
+    return pd.Categorical(values, categories=pd.unique(pd.Series(values, dtype=object)))
+
+
+def build_change_events(store_data: Dict[str, Dict]) -> pd.DataFrame:
+    """Achata o changeslog de cada loja ({loja: {app_id: {'content': [{'changes': [...]}]}}}) numa tabela.
+
+    A estrutura aninhada é percorrida uma única vez, acumulando uma lista por coluna. O resultado
+    tem um evento por linha, na ordem dos arquivos, com `app_id`, `store` e `field` categóricos
+    e `date` em UTC, convertida de uma só vez por `parse_dates`.
+    """
+    columns = {name: [] for name in EVENT_COLUMNS}
+    app_ids, stores, change_ids = columns['app_id'], columns['store'], columns['change_id']
+    dates, fields = columns['date'], columns['field']
+    previous_values, current_values = columns['previous_value'], columns['current_value']
+    for store, data in store_data.items():
+        for app_id, app_data in data.items():
+            for entry in app_data.get('content', []):
+                for change in entry.get('changes', []):
+                    app_ids.append(app_id)
+                    stores.append(store)
+                    change_ids.append(change.get('_id'))
+                    dates.append(change['date'])
+                    fields.append(change['field'])
+                    previous_values.append(change.get('previousValue'))
+                    current_values.append(change.get('currentValue'))
+
+    columns['date'] = parse_dates(dates)
+    return events_from_columns(columns)
+
+
+def events_from_columns(columns: Dict[str, list]) -> pd.DataFrame:
+    """Monta a tabela de eventos a partir de uma lista por coluna, com `date` já convertida para UTC."""
+    columns = dict(columns)
+    for name in CATEGORICAL_COLUMNS:
+        columns[name] = _categorical(columns[name])
+    for name in ('change_id', 'previous_value', 'current_value'):
+        columns[name] = pd.Series(columns[name], dtype=object)
+    return pd.DataFrame(columns, columns=EVENT_COLUMNS)
+
+
+def load_change_events(paths: Dict[str, str]) -> pd.DataFrame:
+    """Carrega os arquivos de changeslog ({loja: caminho}) numa única tabela de eventos (veja `build_change_events`)."""
+    events = build_change_events({store: load_store_data(path) for store, path in paths.items()})
+    logger.info(f"Tabela de mudanças carregada: {len(events)} eventos de {events['app_id'].nunique()} apps")
+    return events
+
+
+def events_for(events: pd.DataFrame, field: Optional[str] = None, store: Optional[str] = None) -> pd.DataFrame:
+    """Eventos de um campo e/ou de uma loja, na ordem original."""
+    mask = pd.Series(True, index=events.index)
+    if field is not None:
+        mask &= events['field'] == field
+    if store is not None:
+        mask &= events['store'] == store
+    return events[mask]
+
+
+def last_change_per_app(events: pd.DataFrame, field: str) -> Dict[str, tuple]:
+    """Última mudança de `field` de cada app, como {app_id: (data, valor anterior, valor atual)}.
+
+    Os apps aparecem na ordem da primeira mudança do campo, e "última" é a que vem por último no
+    arquivo, como no processamento evento a evento.
+    """
+    selected = events_for(events, field)
+    app_ids = selected['app_id'].astype(object)
+    last = selected[~app_ids.duplicated(keep='last')]
+    changes = dict(zip(last['app_id'].astype(object), zip(last['date'], last['previous_value'], last['current_value'])))
+    return {app_id: changes[app_id] for app_id in pd.unique(app_ids)}
+
+
+def changes_per_app(events: pd.DataFrame, field: str) -> Dict[str, List[tuple]]:
+    """Todas as mudanças de `field` de cada app, como {app_id: [(data, valor anterior, valor atual), ...]}."""
+    selected = events_for(events, field)
+    grouped = selected.groupby(selected['app_id'].astype(object), sort=False)
+    return {
+        app_id: list(zip(group['date'], group['previous_value'], group['current_value']))
+        for app_id, group in grouped
+    }
+
+
+def count_change_types(events: pd.DataFrame, store: Optional[str] = None) -> Counter:
+    """Conta a frequência de cada tipo de mudança (campo), opcionalmente de uma única loja."""
+    fields = events_for(events, store=store)['field'].astype(object)
+    return Counter({field: int(count) for field, count in fields.value_counts(sort=False).items()})
+
+
+def get_update_frequency(events: pd.DataFrame, store: Optional[str] = None) -> pd.DataFrame:
+    """Quantidade de mudanças por app (linhas) e por dia em UTC (colunas)."""
+    selected = events_for(events, store=store)
+    days = selected['date'].dt.tz_localize(None).dt.normalize().rename('Date')
+    app_ids = selected['app_id'].astype(object).rename('App ID')
+    return selected.groupby([app_ids, days]).size().unstack(fill_value=0)
+
+
+def _utc_values(dates: pd.Series) -> np.ndarray:
+    """Datas da coluna como datetime64 sem fuso, em UTC."""
+    return dates.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+
+
+def _sorted_dates(events: pd.DataFrame) -> pd.DataFrame:
+    """Colunas `app_id` e `date` ordenadas por app (na ordem das categorias) e por data."""
+    order = np.lexsort((_utc_values(events['date']), events['app_id'].cat.codes.to_numpy()))
+    return events[['app_id', 'date']].take(order)
+
+
+def update_cadence(events: pd.DataFrame, window: str = CADENCE_WINDOW) -> pd.DataFrame:
+    """Estatísticas da cadência de mudanças de cada app, calculadas por grupo sobre as datas ordenadas.
+
+    Os intervalos são os dias inteiros entre mudanças consecutivas do app (diferenças por grupo,
+    sem laço por app), resumidos em média, mediana e percentil 90 (0 quando há uma só mudança).
+    `max_window_updates` é a maior quantidade de mudanças numa janela móvel de `window`, e
+    `recent_window_updates`, a quantidade na janela que termina na última data da tabela.
+    O índice é o `app_id`, na ordem da primeira ocorrência.
+    """
+    dates = _sorted_dates(events)
+    if dates.empty:
+        return pd.DataFrame(columns=CADENCE_COLUMNS, index=pd.Index([], name='app_id'))
+    apps = dates['app_id']
+    # Diferenças entre datas consecutivas; a primeira mudança de cada app não tem intervalo
+    stamps = _utc_values(dates['date'])
+    codes = apps.cat.codes.to_numpy()
+    gaps = np.diff(stamps, prepend=stamps[:1]) // np.timedelta64(1, 'D')
+    first = np.r_[True, codes[1:] != codes[:-1]]
+    intervals = pd.Series(np.where(first, np.nan, gaps), index=dates.index)
+    by_app = intervals.groupby(apps, observed=True)
+    window_counts = (dates.assign(updates=1).groupby('app_id', observed=True)
+                     .rolling(window, on='date')['updates'].sum())
+    recent = dates['date'] > dates['date'].max() - pd.Timedelta(window)
+
+    cadence = pd.DataFrame({
+        'updates': apps.value_counts(sort=False),
+        'mean_interval_days': by_app.mean(),
+        'median_interval_days': by_app.median(),
+        'p90_interval_days': by_app.quantile(0.9),
+        'max_window_updates': window_counts.groupby(level='app_id', observed=True).max(),
+        'recent_window_updates': recent.groupby(apps, observed=True).sum(),
+    })
+    cadence = cadence[cadence['updates'] > 0].fillna(0)
+    cadence[['max_window_updates', 'recent_window_updates']] = (
+        cadence[['max_window_updates', 'recent_window_updates']].astype(np.int64))
+    cadence.index = cadence.index.astype(object).rename('app_id')
+    return cadence
+
+
+def daily_update_counts(events: pd.DataFrame) -> Dict[str, List[tuple]]:
+    """Quantidade de mudanças de cada app por dia (UTC), como {app_id: [(dia, quantidade), ...]} em ordem de data."""
+    if events.empty:
+        return {}
+    days = _utc_values(events['date']).astype('datetime64[D]').astype(np.int64)
+    codes = events['app_id'].cat.codes.to_numpy().astype(np.int64)
+    # Cada par (app, dia) vira uma chave inteira, ordenada por app e depois por dia
+    first_day = days.min()
+    span = days.max() - first_day + 1
+    keys, counts = np.unique(codes * span + (days - first_day), return_counts=True)
+    app_codes, day_offsets = np.divmod(keys, span)
+    dates = (day_offsets + first_day).astype('datetime64[D]').tolist()
+
+    categories = list(events['app_id'].cat.categories)
+    daily = {}
+    for code, date, count in zip(app_codes.tolist(), dates, counts.tolist()):
+        daily.setdefault(categories[code], []).append((date, count))
+    return daily
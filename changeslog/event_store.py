@@ -0,0 +1,291 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from changeslog.change_events import build_change_events, events_from_columns
+
+# Arquivo padrão do repositório local de eventos
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'change_events.sqlite')
+
+# Identificadores por consulta ao verificar quais eventos já estão guardados
+KNOWN_IDS_BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+
+def _event_id(store, app_id, date, field, previous, current):
+    """Identificador de um evento sem `_id`, calculado a partir do conteúdo."""
+    content = json.dumps([store, app_id, date, field, previous, current], ensure_ascii=False, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class ChangeEventStore:
+    """Repositório local (SQLite) de eventos de mudança, só de acréscimo e sem duplicatas.
+
+    Cada evento é guardado uma única vez, pelo `_id` da mudança; coletas com janelas sobrepostas
+    não geram duplicatas. Cada evento recebe um número de sequência na ingestão, e cada consumidor
+    (uma análise) guarda por app a maior sequência já processada, então `events(consumer)` devolve
+    só o que chegou depois da última execução, inclusive eventos com datas antigas coletados tarde.
+    O consumidor pode guardar junto com as marcas o estado da sua análise (`advance(..., state=...)`),
+    para combinar os eventos novos com o que já foi calculado sem reler o histórico.
+    Arquivos de changeslog que não mudaram desde a última ingestão não são lidos de novo.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " change_id TEXT NOT NULL UNIQUE,"
+            " app_id TEXT NOT NULL,"
+            " store TEXT NOT NULL,"
+            " date INTEGER NOT NULL,"
+            " field TEXT NOT NULL,"
+            " previous_value TEXT,"
+            " current_value TEXT);"
+            "CREATE INDEX IF NOT EXISTS events_app_seq ON events (store, app_id, seq);"
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " consumer TEXT NOT NULL,"
+            " store TEXT NOT NULL,"
+            " app_id TEXT NOT NULL,"
+            " last_seq INTEGER NOT NULL,"
+            " last_date INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (consumer, store, app_id));"
+            "CREATE TABLE IF NOT EXISTS states ("
+            " consumer TEXT PRIMARY KEY,"
+            " state BLOB NOT NULL,"
+            " updated_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS sources ("
+            " path TEXT PRIMARY KEY,"
+            " store TEXT NOT NULL,"
+            " mtime REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " ingested_at REAL NOT NULL);"
+        )
+
+    def ingest(self, events: pd.DataFrame) -> int:
+        """Acrescenta os eventos da tabela (veja `build_change_events`), ignorando `_id`s já guardados.
+
+        Os `_id`s já guardados são descartados antes de serializar os valores, então reingerir um
+        arquivo que só cresceu custa pouco mais que ler os eventos novos. Retorna a quantidade de eventos novos.
+        """
+        if events.empty:
+            return 0
+        dates = events['date'].dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+        microseconds = dates.astype('datetime64[us]').astype(np.int64).tolist()
+        candidates = []
+        for change_id, app_id, store, date, field, previous, current in zip(
+                events['change_id'], events['app_id'], events['store'], microseconds, events['field'],
+                events['previous_value'], events['current_value']):
+            if change_id is None:
+                change_id = _event_id(store, app_id, date, field, previous, current)
+            candidates.append((change_id, app_id, store, date, field, previous, current))
+
+        known = self._known_ids([candidate[0] for candidate in candidates])
+        rows = [(change_id, app_id, store, date, field,
+                 json.dumps(previous, ensure_ascii=False), json.dumps(current, ensure_ascii=False))
+                for change_id, app_id, store, date, field, previous, current in candidates
+                if change_id not in known]
+
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO events (change_id, app_id, store, date, field, previous_value, current_value)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.commit()
+        added = self._conn.total_changes - before
+        logger.info(f"{added} eventos novos de {len(candidates)} recebidos ({len(candidates) - added} duplicados)")
+        return added
+
+    def _known_ids(self, change_ids, batch_size=KNOWN_IDS_BATCH_SIZE):
+        """Quais dos `change_ids` já estão guardados, consultados em lotes pelo índice de `change_id`."""
+        known = set()
+        for start in range(0, len(change_ids), batch_size):
+            batch = change_ids[start:start + batch_size]
+            placeholders = ', '.join('?' * len(batch))
+            known.update(row[0] for row in self._conn.execute(
+                f"SELECT change_id FROM events WHERE change_id IN ({placeholders})", batch))
+        return known
+
+    def ingest_files(self, paths: Dict[str, str], force: bool = False) -> int:
+        """Acrescenta os arquivos de changeslog ({loja: caminho}) que mudaram desde a última ingestão.
+
+        Com `force`, todos os arquivos são lidos. Arquivos que não puderem ser lidos (JSON inválido,
+        por exemplo) não são registrados e voltam a ser lidos na próxima chamada.
+        Retorna a quantidade de eventos novos.
+        """
+        changed = {}
+        for store, path in paths.items():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                logger.error(f"Arquivo não encontrado: {path}")
+                continue
+            known = self._conn.execute("SELECT mtime, size FROM sources WHERE path = ?",
+                                       (os.path.abspath(path),)).fetchone()
+            if force or known != (stat.st_mtime, stat.st_size):
+                changed[store] = (path, stat)
+            else:
+                logger.info(f"{path} não mudou desde a última ingestão")
+
+        # Só os arquivos lidos com sucesso são registrados; um JSON inválido é lido de novo na próxima execução
+        loaded = {}
+        for store, (path, stat) in list(changed.items()):
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    loaded[store] = self._unseen_changes(store, json.load(file))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Erro ao ler {path}: {e}")
+                del changed[store]
+
+        added = self.ingest(build_change_events(loaded))
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO sources (path, store, mtime, size, ingested_at) VALUES (?, ?, ?, ?, ?)",
+            [(os.path.abspath(path), store, stat.st_mtime, stat.st_size, now)
+             for store, (path, stat) in changed.items()],
+        )
+        self._conn.commit()
+        return added
+
+    def _unseen_changes(self, store: str, data: Dict) -> Dict:
+        """Changeslog da loja sem as mudanças cujo `_id` já está guardado, antes de montar a tabela de eventos.
+
+        Os arquivos do coletor são reescritos inteiros a cada coleta, então quase tudo já foi visto.
+        Mudanças sem `_id` ficam; `ingest` as identifica pelo conteúdo.
+        """
+        known = {row[0] for row in self._conn.execute("SELECT change_id FROM events WHERE store = ?", (store,))}
+        if not known:
+            return data
+        unseen = {}
+        for app_id, app_data in data.items():
+            content = []
+            for entry in app_data.get('content', []):
+                changes = [change for change in entry.get('changes', []) if change.get('_id') not in known]
+                if changes:
+                    content.append({'changes': changes})
+            if content:
+                unseen[app_id] = {'content': content}
+        return unseen
+
+    def events(self, consumer: Optional[str] = None) -> pd.DataFrame:
+        """Eventos guardados, na ordem de ingestão, no formato de `build_change_events` mais a coluna `seq`.
+
+        Com `consumer`, devolve só os eventos de cada app que chegaram depois da marca desse consumidor.
+        """
+        query = "SELECT e.seq, e.change_id, e.app_id, e.store, e.date, e.field, e.previous_value, e.current_value"
+        params = ()
+        if consumer is None:
+            query += " FROM events e"
+        else:
+            # Parte de cada app e busca no índice (store, app_id, seq) só o que vem depois da marca,
+            # sem percorrer a tabela inteira quando há poucos eventos novos
+            query += (" FROM (SELECT DISTINCT store, app_id FROM events) a"
+                      " LEFT JOIN watermarks w ON w.consumer = ? AND w.store = a.store AND w.app_id = a.app_id"
+                      " JOIN events e ON e.store = a.store AND e.app_id = a.app_id"
+                      " AND e.seq > COALESCE(w.last_seq, 0)")
+            params = (consumer,)
+        rows = self._conn.execute(query + " ORDER BY e.seq", params).fetchall()
+        names = ['seq', 'change_id', 'app_id', 'store', 'date', 'field', 'previous_value', 'current_value']
+        columns = dict(zip(names, map(list, zip(*rows)))) if rows else {name: [] for name in names}
+
+        seqs = np.array(columns.pop('seq'), dtype=np.int64)
+        columns['date'] = pd.to_datetime(np.array(columns['date'], dtype=np.int64), unit='us', utc=True)
+        for name in ('previous_value', 'current_value'):
+            columns[name] = [json.loads(value) for value in columns[name]]
+        events = events_from_columns(columns)
+        events['seq'] = seqs
+        return events
+
+    def dates(self) -> pd.DataFrame:
+        """Loja, app e data de todos os eventos guardados, agrupados por app na ordem da primeira mudança de cada um.
+
+        Bem mais barato que `events()`: não decodifica os valores das mudanças e lê as datas de cada app
+        pelo índice (store, app_id, seq) direto para inteiros, sem montar uma tupla por evento com os textos
+        de app e loja. Basta para a cadência e as tabelas por dia, que dependem do histórico completo.
+        """
+        apps = self._conn.execute("SELECT store, app_id, MIN(seq) AS first_seq FROM events"
+                                  " GROUP BY store, app_id ORDER BY first_seq").fetchall()
+        dates = [np.array(self._conn.execute("SELECT date FROM events WHERE store = ? AND app_id = ? ORDER BY seq",
+                                             (store, app_id)).fetchall(), dtype=np.int64).reshape(-1)
+                 for store, app_id, _ in apps]
+        counts = [len(app_dates) for app_dates in dates]
+        columns = {}
+        for position, name in enumerate(('store', 'app_id')):
+            # Categóricas montadas pelos códigos, com as categorias na ordem da primeira ocorrência
+            codes = {}
+            app_codes = [codes.setdefault(app[position], len(codes)) for app in apps]
+            columns[name] = pd.Categorical.from_codes(np.repeat(np.array(app_codes, dtype=np.int32), counts),
+                                                      categories=pd.Index(list(codes), dtype=object))
+        columns['date'] = pd.to_datetime(np.concatenate(dates) if dates else np.array([], dtype=np.int64),
+                                         unit='us', utc=True)
+        return pd.DataFrame(columns, columns=['app_id', 'store', 'date'])
+
+    def advance(self, consumer: str, events: pd.DataFrame, state: Optional[bytes] = None):
+        """Marca os eventos (devolvidos por `events`) como processados pelo consumidor, por app.
+
+        `state`, se dado, substitui o estado guardado do consumidor na mesma transação que as marcas.
+        """
+        now = time.time()
+        if not events.empty:
+            dates = events['date'].dt.tz_convert('UTC').dt.tz_localize(None).to_numpy().astype('datetime64[us]')
+            latest = (pd.DataFrame({'store': events['store'].astype(object),
+                                    'app_id': events['app_id'].astype(object),
+                                    'seq': events['seq'], 'date': dates.astype(np.int64)})
+                      .groupby(['store', 'app_id'], sort=False).max())
+            self._conn.executemany(
+                "INSERT INTO watermarks (consumer, store, app_id, last_seq, last_date, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (consumer, store, app_id) DO UPDATE SET"
+                " last_seq = MAX(last_seq, excluded.last_seq), last_date = MAX(last_date, excluded.last_date),"
+                " updated_at = excluded.updated_at",
+                [(consumer, store, app_id, int(seq), int(date), now) for (store, app_id), (seq, date)
+                 in zip(latest.index, latest[['seq', 'date']].itertuples(index=False))],
+            )
+        if state is not None:
+            self._conn.execute("INSERT OR REPLACE INTO states (consumer, state, updated_at) VALUES (?, ?, ?)",
+                               (consumer, state, now))
+        self._conn.commit()
+
+    def state(self, consumer: str) -> Optional[bytes]:
+        """Estado guardado pelo consumidor na última chamada de `advance`, ou None."""
+        row = self._conn.execute("SELECT state FROM states WHERE consumer = ?", (consumer,)).fetchone()
+        return row[0] if row else None
+
+    def watermarks(self, consumer: str) -> Dict[tuple, pd.Timestamp]:
+        """Data da mudança mais recente já processada pelo consumidor, por (loja, app)."""
+        rows = self._conn.execute("SELECT store, app_id, last_date FROM watermarks WHERE consumer = ?", (consumer,))
+        return {(store, app_id): pd.Timestamp(last_date, unit='us', tz='UTC') for store, app_id, last_date in rows}
+
+    def reset(self, consumer: str):
+        """Apaga as marcas e o estado do consumidor, que volta a receber todos os eventos."""
+        self._conn.execute("DELETE FROM watermarks WHERE consumer = ?", (consumer,))
+        self._conn.execute("DELETE FROM states WHERE consumer = ?", (consumer,))
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def close(self):
+        """Grava as operações pendentes e fecha a conexão."""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,215 @@
+import io
+import json
+import os
+from collections import namedtuple
+from datetime import date, datetime
+
+import numpy as np
+
+# Tamanho do buffer de escrita de cada arquivo do relatório
+BUFFER_SIZE = 1 << 16
+
+# Seção do relatório: título, blocos (itens, parágrafos, tabelas ou subseções) e nível do título.
+# Os blocos podem vir de um gerador, consumido uma única vez enquanto a seção é escrita.
+Section = namedtuple('Section', ['title', 'blocks', 'level'], defaults=((), 2))
+
+# Item de lista; `data` guarda os mesmos valores em campos estruturados para a saída em JSON
+Item = namedtuple('Item', ['text', 'data'], defaults=(None,))
+
+# Parágrafo de texto
+Paragraph = namedtuple('Paragraph', ['text'])
+
+# Tabela (DataFrame); no markdown, `to_markdown` requer o pacote tabulate
+Table = namedtuple('Table', ['frame'])
+
+
+def _json_default(value):
+    """Converte datas e números do numpy/pandas para tipos do JSON."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+class _MarkdownRenderer:
+    """Escreve os blocos de uma seção em markdown assim que chegam."""
+
+    def __init__(self, file):
+        self.file = file
+
+    def title(self, title):
+        self.file.write(f"# {title}\n")
+
+    def start_section(self, section):
+        self.file.write(f"\n{'#' * section.level} {section.title}\n")
+
+    def end_section(self, section):
+        pass
+
+    def block(self, block):
+        if type(block) is Item:
+            self.file.write(f"- {block[0]}\n")
+        elif isinstance(block, Paragraph):
+            self.file.write(f"{block.text}\n")
+        else:
+            self.file.write(f"\n{block.frame.to_markdown()}\n")
+
+    def close(self):
+        pass
+
+
+class _JsonRenderer:
+    """Escreve o relatório como um único objeto JSON, abrindo e fechando as listas conforme as seções.
+
+    Nada é montado em memória: cada bloco é serializado e gravado assim que chega.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.file.write('{')
+        # Se a lista aberta em cada nível ainda está vazia (para saber quando escrever a vírgula)
+        self._first = []
+
+    def _element(self):
+        if self._first[-1]:
+            self._first[-1] = False
+        else:
+            self.file.write(', ')
+
+    def title(self, title):
+        self.file.write(f'"title": {_dumps(title)}, ')
+
+    def start_section(self, section):
+        if not self._first:
+            self.file.write('"sections": [')
+            self._first.append(True)
+        self._element()
+        self.file.write(f'{{"type": "section", "title": {_dumps(section.title)}, "level": {section.level}, "blocks": [')
+        self._first.append(True)
+
+    def end_section(self, section):
+        self.file.write(']}')
+        self._first.pop()
+
+    def block(self, block):
+        self._element()
+        if isinstance(block, Item):
+            record = {'type': 'item', 'text': block.text}
+            if block.data is not None:
+                record['data'] = block.data
+        elif isinstance(block, Paragraph):
+            record = {'type': 'paragraph', 'text': block.text}
+        else:
+            record = {'type': 'table', **block.frame.to_dict(orient='split')}
+        self.file.write(_dumps(record))
+
+    def close(self):
+        if not self._first:
+            self.file.write('"sections": [')
+        self.file.write(']}\n')
+
+
+def _write_section(section, renderers):
+    """Percorre a seção uma única vez, repassando cada bloco a todos os formatos."""
+    for renderer in renderers:
+        renderer.start_section(section)
+    if len(renderers) == 1:
+        # Caso mais comum (só markdown): sem o laço interno por formato
+        write_block = renderers[0].block
+        for block in section.blocks:
+            if type(block) is Section:
+                _write_section(block, renderers)
+            else:
+                write_block(block)
+    else:
+        for block in section.blocks:
+            if type(block) is Section:
+                _write_section(block, renderers)
+            else:
+                for renderer in renderers:
+                    renderer.block(block)
+    for renderer in renderers:
+        renderer.end_section(section)
+
+
+def render_markdown(section):
+    """Formata uma seção (e suas subseções) como markdown."""
+    buffer = io.StringIO()
+    _write_section(section, [_MarkdownRenderer(buffer)])
+    return buffer.getvalue()
+
+
+class ReportBuilder:
+    """Escreve um relatório em markdown e/ou JSON a partir das mesmas seções, numa única passada.
+
+    Cada bloco vai direto para os arquivos (com buffer) assim que é produzido, então nem o
+    relatório inteiro nem uma seção inteira precisam existir como uma string em memória.
+    Só os formatos com caminho definido são gerados.
+    """
+
+    def __init__(self, markdown_path=None, json_path=None, title=None, buffer_size=BUFFER_SIZE):
+        self.markdown_path = markdown_path
+        self.json_path = json_path
+        self.title = title
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._files = []
+        self._renderers = []
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self):
+        """Abre os arquivos de saída configurados e escreve o título do relatório."""
+        try:
+            for path, renderer in ((self.markdown_path, _MarkdownRenderer), (self.json_path, _JsonRenderer)):
+                if path:
+                    file = self._open_text(path)
+                    self._files.append(file)
+                    self._renderers.append(renderer(file))
+        except BaseException:
+            # `__exit__` não roda quando `open` falha: fecha os arquivos que já tinham sido abertos
+            for file in self._files:
+                file.close()
+            self._files = []
+            self._renderers = []
+            raise
+        if self.title is not None:
+            for renderer in self._renderers:
+                renderer.title(self.title)
+        return self
+
+    def _open_text(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return open(path, 'w', encoding='utf-8', buffering=self.buffer_size)
+
+    def write(self, section):
+        """Escreve uma seção em todos os formatos configurados."""
+        _write_section(section, self._renderers)
+        self.count += 1
+
+    def write_all(self, sections):
+        """Escreve as seções conforme o iterável é consumido, retornando a quantidade escrita."""
+        for section in sections:
+            self.write(section)
+        return self.count
+
+    def close(self):
+        """Finaliza os formatos, grava o que estiver em buffer e fecha os arquivos."""
+        for renderer in self._renderers:
+            renderer.close()
+        for file in self._files:
+            file.close()
+        self._files = []
+        self._renderers = []
@@ -0,0 +1,105 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Formatos devolvidos pela API do RankMyApp: 2024-10-01T12:30:00Z e 2024-10-01T12:30:00.123Z
+SHORT_LENGTH = 20
+LONG_LENGTH = 24
+
+# Posições dos dígitos de ano, mês, dia, hora, minuto, segundo e milissegundos
+_DIGIT_POSITIONS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18, 20, 21, 22]
+
+# Quantidade de dígitos de cada parte, na ordem de _DIGIT_POSITIONS
+_PART_WIDTHS = (4, 2, 2, 2, 2, 2, 3)
+
+# Separadores fixos nos dois formatos
+_SEPARATORS = {4: b'-', 7: b'-', 10: b'T', 13: b':', 16: b':'}
+
+# Dias de cada mês (índice 1 a 12) em anos não bissextos
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+# Resolução das datas devolvidas (a mesma de datetime.fromisoformat)
+UNIT = 'us'
+
+
+def _place_values():
+    """Matriz que junta os dígitos de cada parte num número (ex.: 4 dígitos do ano -> ano)."""
+    weights = np.zeros((len(_DIGIT_POSITIONS), len(_PART_WIDTHS)), dtype=np.float32)
+    row = 0
+    for part, width in enumerate(_PART_WIDTHS):
+        for exponent in range(width - 1, -1, -1):
+            weights[row, part] = 10 ** exponent
+            row += 1
+    return weights
+
+
+_PLACE_VALUES = _place_values()
+
+
+def _days_from_civil(year, month, day):
+    """Dias desde 1970-01-01 para datas do calendário gregoriano, em arrays (algoritmo de H. Hinnant)."""
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _parse_fixed_width(values):
+    """Converte os formatos da API por aritmética sobre os bytes, em microssegundos desde a época.
+
+    Retorna None se algum valor não estiver exatamente num dos dois formatos (ou tiver data inválida),
+    para que a conversão genérica trate a coluna.
+    """
+    try:
+        raw = np.array(values, dtype=f'S{LONG_LENGTH + 1}')
+    except (UnicodeEncodeError, TypeError, ValueError):
+        return None
+    if raw.ndim != 1:
+        return None
+    chars = raw.view(np.uint8).reshape(len(raw), LONG_LENGTH + 1)
+
+    short = (chars[:, 19] == ord('Z')) & (chars[:, SHORT_LENGTH] == 0)
+    long = (chars[:, 19] == ord('.')) & (chars[:, 23] == ord('Z')) & (chars[:, LONG_LENGTH] == 0)
+    valid = short | long
+    for position, separator in _SEPARATORS.items():
+        valid &= chars[:, position] == separator[0]
+    # Em uint8, caracteres abaixo de '0' dão a volta e também ficam acima de 9
+    digits = chars[:, _DIGIT_POSITIONS] - np.uint8(ord('0'))
+    # Nos valores curtos, as posições dos milissegundos ficam vazias
+    digits[short, 14:] = 0
+    valid &= (digits <= 9).all(axis=1)
+    if not valid.all():
+        return None
+
+    # Uma multiplicação de matrizes monta todas as partes; em float32 ela é exata (valores < 2**24)
+    parts = np.ascontiguousarray((digits.astype(np.float32) @ _PLACE_VALUES).T).astype(np.int32)
+    year, month, day, hour, minute, second, millisecond = parts
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_length = _DAYS_IN_MONTH[np.clip(month, 0, 12)] + (leap & (month == 2))
+    if not ((month >= 1) & (month <= 12) & (day >= 1) & (day <= month_length)
+            & (hour < 24) & (minute < 60) & (second < 60)).all():
+        return None
+
+    days = _days_from_civil(year, month, day).astype(np.int64)
+    seconds = days * 86400 + (hour * 3600 + minute * 60 + second)
+    return seconds * 1_000_000 + millisecond * 1000
+
+
+def parse_dates(values: Iterable) -> pd.DatetimeIndex:
+    """Converte uma coluna de datas ISO-8601 de uma só vez, devolvendo um DatetimeIndex em UTC.
+
+    Os formatos da API (com ou sem milissegundos, terminados em Z) são convertidos por aritmética
+    vetorizada sobre os bytes; colunas com outros formatos ISO-8601 (fuso explícito, microssegundos)
+    passam pelo `pd.to_datetime`. Valores inválidos levantam ValueError.
+    """
+    if not hasattr(values, '__len__'):
+        values = list(values)
+    if len(values) == 0:
+        return pd.DatetimeIndex([], dtype=f'datetime64[{UNIT}, UTC]')
+    microseconds = _parse_fixed_width(values)
+    if microseconds is None:
+        return pd.DatetimeIndex(pd.to_datetime(values, utc=True, format='ISO8601')).as_unit(UNIT)
+    return pd.DatetimeIndex(microseconds.view(f'datetime64[{UNIT}]')).tz_localize('UTC')
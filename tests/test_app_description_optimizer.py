@@ -0,0 +1,257 @@
+import importlib
+
+import pytest
+
+nltk = pytest.importorskip("nltk")
+
+DESCRICAO = (
+    "Abra sua conta digital grátis. Conta digital sem tarifas, cartão de crédito sem anuidade "
+    "e Pix ilimitado. Faça transferências, pague boletos e acompanhe sua conta digital pelo app. "
+    "Cartão de crédito com cashback e investimentos com rendimento diário."
+)
+
+
+@pytest.fixture
+def modulo():
+    """Importa o AppDescriptionOptimizer, pulando o teste se os recursos do NLTK não estiverem instalados."""
+    try:
+        nltk.data.find('corpora/stopwords')
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        pytest.skip("Recursos do NLTK indisponíveis")
+    return importlib.import_module('text_processing.AppDescriptionOptimizer')
+
+
+@pytest.mark.parametrize("tokenizer", ["regex", "nltk"])
+def test_analyze_app_tokeniza_cada_texto_uma_vez(modulo, monkeypatch, tokenizer):
+    chamadas = []
+    analyzer = modulo.ASOKeywordAnalyzer(tokenizer=tokenizer)
+    original = analyzer.tokenizer.tokenize
+
+    def tokenize_contado(text):
+        chamadas.append(text)
+        return original(text)
+
+    monkeypatch.setattr(analyzer.tokenizer, 'tokenize', tokenize_contado)
+    analyzer.analyze_app("Banco", {"titulo": "Banco Digital", "descrição": DESCRICAO, "store": "google"})
+
+    assert len(chamadas) == 2
+
+
+def test_metodos_publicos_aceitam_texto_bruto(modulo):
+    analyzer = modulo.ASOKeywordAnalyzer()
+    documento = analyzer.tokenize(DESCRICAO)
+
+    assert analyzer.analyze_word_density(DESCRICAO) == analyzer.analyze_word_density(documento)
+    assert analyzer.extract_keywords(DESCRICAO) == analyzer.extract_keywords(documento)
+    assert analyzer.analyze_word_density(DESCRICAO)['densidades']['digital']['contagem'] == 3
+
+
+def test_analyze_apps_paralelo_igual_ao_serial(modulo):
+    analyzer = modulo.ASOKeywordAnalyzer()
+    apps = [
+        (f"App {indice}", {"titulo": f"Banco {indice}", "descrição": DESCRICAO * (indice % 3 + 1), "store": "apple"})
+        for indice in range(20)
+    ]
+
+    serial = list(analyzer.analyze_apps(apps))
+    paralelo = list(analyzer.analyze_apps(iter(apps), workers=2, chunksize=3))
+
+    assert paralelo == serial
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_analyze_apps_reaproveita_cache(modulo, tmp_path, workers):
+    from text_processing.cache import AnalysisCache
+
+    analyzer = modulo.ASOKeywordAnalyzer()
+    apps = [(f"App {indice}", {"titulo": f"Banco {indice}", "descrição": DESCRICAO, "store": "google"})
+            for indice in range(6)]
+    esperado = list(analyzer.analyze_apps(apps))
+
+    with AnalysisCache(str(tmp_path / "cache.sqlite")) as cache:
+        # Primeira execução analisa só metade dos apps e guarda no cache
+        list(analyzer.analyze_apps(apps[::2], cache=cache))
+        # Na segunda, apenas os apps novos são analisados, e a ordem de entrada é mantida
+        resultado = list(analyzer.analyze_apps(apps, workers=workers, chunksize=1, cache=cache))
+
+        assert resultado == esperado
+        assert (cache.hits, cache.misses) == (3, 6)
+
+
+def test_build_keyword_index_usa_saida_do_analisador(modulo):
+    analyzer = modulo.ASOKeywordAnalyzer()
+    apps = [
+        ("Banco", {"titulo": "Banco Digital", "descrição": DESCRICAO}),
+        ("Seguros", {"titulo": "Seguro Auto", "descrição": "Seguro auto com assistência 24 horas e guincho."}),
+    ]
+
+    index = analyzer.build_keyword_index(apps)
+
+    assert index.posting("digital", "Banco").in_title
+    assert index.posting("cashback", "Banco").count == 1
+    assert "cashback" in dict(index.gap("Seguros"))
+
+
+def test_densidade_compacta_equivale_a_completa(modulo):
+    analyzer = modulo.ASOKeywordAnalyzer()
+    texto = DESCRICAO + " Conta conta pix pix pix seguro."
+
+    completa = analyzer.analyze_word_density(texto, full=True)
+    compacta = analyzer.analyze_word_density(texto, top_k=3)
+
+    acima_do_limite = [palavra for palavra, info in completa['densidades'].items()
+                       if info['densidade'] > modulo.HIGH_DENSITY_THRESHOLD]
+    esperadas = list(completa['densidades'])[:max(3, len(acima_do_limite))]
+    assert list(compacta['densidades']) == esperadas
+    assert analyzer.expand_density(compacta) == completa['densidades']
+    assert list(analyzer.expand_density(compacta)) == list(completa['densidades'])
+
+
+def test_analyze_apps_reaproveita_quase_duplicatas(modulo, tmp_path, monkeypatch):
+    from text_processing.cache import AnalysisCache
+    from text_processing.near_duplicates import NearDuplicateIndex
+
+    analyzer = modulo.ASOKeywordAnalyzer()
+    copia = DESCRICAO.replace("rendimento diário", "rendimento diário garantido")
+    apps = [
+        ("Banco", {"titulo": "Banco Digital", "descrição": DESCRICAO, "store": "google"}),
+        ("Clone", {"titulo": "Clone Digital", "descrição": copia, "store": "apple"}),
+    ]
+    esperado = dict(analyzer.analyze_apps(apps))
+
+    chamadas = []
+    original = analyzer.tokenizer.tokenize
+    monkeypatch.setattr(analyzer.tokenizer, 'tokenize', lambda text: chamadas.append(text) or original(text))
+    with AnalysisCache(str(tmp_path / "cache.sqlite")) as cache:
+        resultado = dict(analyzer.analyze_apps(apps, cache=cache, near_duplicates=NearDuplicateIndex(threshold=0.7)))
+
+    # A descrição tokenizada para a assinatura MinHash é a mesma usada na análise
+    assert chamadas.count(DESCRICAO.lower()) == 1
+
+    clone = resultado["Clone"]
+    assert resultado["Banco"] == esperado["Banco"]
+    assert clone["descrição"]["quase_duplicata_de"] == "Banco"
+    assert clone["descrição"]["caracteres"] == len(copia)
+    assert clone["descrição"]["análise_keywords"] == esperado["Banco"]["descrição"]["análise_keywords"]
+    assert clone["título"] == esperado["Clone"]["título"]
+
+
+def test_indice_do_corpus_fica_salvo_entre_execucoes(modulo, tmp_path, monkeypatch):
+    analyzer = modulo.ASOKeywordAnalyzer()
+    analyzer.corpus_index_path = str(tmp_path / "tfidf.pkl")
+    apps = [
+        ("Banco", {"titulo": "Banco Digital", "descrição": DESCRICAO}),
+        ("Corretora", {"titulo": "Corretora", "descrição": "Invista em ações e fundos com taxa zero."}),
+    ]
+    esperado = analyzer.build_corpus_index(apps).all_distinctive_keywords()
+    assert analyzer.update_corpus_index(apps).all_distinctive_keywords() == esperado
+
+    # Na execução seguinte, nenhuma descrição inalterada é tokenizada de novo
+    monkeypatch.setattr(analyzer.tokenizer, "tokenize", lambda text: pytest.fail("tokenizou de novo"))
+    index = analyzer.update_corpus_index(apps)
+    assert len(index) == 2
+    termos, pesos = zip(*index.distinctive_lookup().get("Corretora"))
+    assert list(termos) == [termo for termo, _ in esperado["Corretora"]]
+    assert list(pesos) == pytest.approx([peso for _, peso in esperado["Corretora"]])
+
+
+def test_analyze_by_locale_usa_o_perfil_de_cada_idioma(modulo):
+    try:
+        nltk.data.find('corpora/stopwords/english')
+        nltk.data.find('corpora/stopwords/spanish')
+    except LookupError:
+        pytest.skip("Stopwords em inglês e espanhol indisponíveis")
+    analyzer = modulo.ASOKeywordAnalyzer()
+    texto = "The digital bank with the best digital account. La cuenta digital del banco."
+    apps = [
+        ("Bank", {"titulo": "Digital Bank", "descrição": texto, "store": "apple", "lang": "en-US"}),
+        ("Banco", {"titulo": "Banco Digital", "descrição": texto, "store": "google", "lang": "pt-BR"}),
+        ("Banco MX", {"titulo": "Banco Digital", "descrição": texto, "store": "google", "country": "MX"}),
+    ]
+
+    resultado = dict(analyzer.analyze_by_locale(apps))
+
+    def palavras(nome):
+        return set(resultado[nome]["descrição"]["análise_densidade"]["densidades"])
+
+    assert "the" not in palavras("Bank") and "la" in palavras("Bank")
+    assert "the" in palavras("Banco MX") and "la" not in palavras("Banco MX")
+    assert resultado["Banco"] == analyzer.analyze_app("Banco", apps[1][1])
+
+
+def test_analyze_by_locale_paralelo_usa_um_unico_pool(modulo, monkeypatch):
+    try:
+        nltk.data.find('corpora/stopwords/english')
+    except LookupError:
+        pytest.skip("Stopwords em inglês indisponíveis")
+    import text_processing.parallel as parallel
+
+    pools = []
+
+    class PoolContado(parallel.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", PoolContado)
+    analyzer = modulo.ASOKeywordAnalyzer()
+    apps = [(f"App {indice}", {"titulo": f"Banco {indice}", "descrição": DESCRICAO, "store": "google",
+                               "lang": "en-US" if indice % 2 else "pt-BR"})
+            for indice in range(12)]
+
+    serial = dict(analyzer.analyze_by_locale(apps, batch_size=2))
+    paralelo = dict(analyzer.analyze_by_locale(apps, batch_size=2, workers=2, chunksize=2))
+
+    assert paralelo == serial
+    assert len(pools) == 1
+
+
+def test_densidade_por_radical_soma_as_formas(modulo):
+    try:
+        nltk.data.find('corpora/stopwords/spanish')
+    except LookupError:
+        pytest.skip("Stopwords em espanhol indisponíveis")
+    analyzer = modulo.ASOKeywordAnalyzer(locale="es-MX", stemming=True)
+    texto = "Transferencia gratis. Transferencias ilimitadas y transferencias programadas en la app."
+
+    radicais = analyzer.analyze_stem_density(texto)['densidades']
+    analysis = analyzer.analyze_app("Banco", {"titulo": "Banco", "descrição": texto})
+
+    radical = next(iter(radicais))
+    assert radicais[radical]['contagem'] == 3
+    assert radicais[radical]['formas'] == ["transferencias", "transferencia"]
+    assert analysis["descrição"]["análise_densidade_radicais"]['densidades'] == radicais
+    assert "snowball" in analyzer.cache_version
+
+
+def test_instrumentacao_mede_as_etapas_da_analise(modulo, tmp_path):
+    from text_processing.instrumentation import Instrumentation
+
+    instrumentation = Instrumentation()
+    analyzer = modulo.ASOKeywordAnalyzer(instrumentation=instrumentation)
+    analyzer.report_path = str(tmp_path / 'report.md')
+    analysis = analyzer.analyze_app("Banco", {"titulo": "Banco Digital", "descrição": DESCRICAO})
+    analyzer.save_reports({"Banco": analysis})
+
+    stages = instrumentation.summary()['stages']
+    assert {'tokenize', 'density', 'bigrams', 'recommendations', 'report'} <= set(stages)
+    assert stages['report']['calls'] == 1
+    assert instrumentation.counters == {'apps_analyzed': 1, 'reports_written': 1}
+    assert analysis == modulo.ASOKeywordAnalyzer().analyze_app("Banco", {"titulo": "Banco Digital", "descrição": DESCRICAO})
+
+
+def test_instrumentacao_soma_as_etapas_dos_workers(modulo):
+    from text_processing.instrumentation import Instrumentation
+
+    instrumentation = Instrumentation()
+    analyzer = modulo.ASOKeywordAnalyzer(instrumentation=instrumentation)
+    apps = [(f"App {indice}", {"titulo": f"Banco {indice}", "descrição": DESCRICAO}) for indice in range(5)]
+
+    list(analyzer.analyze_apps(apps, workers=2, chunksize=2))
+
+    stages = instrumentation.summary()['stages']
+    assert instrumentation.counters == {'apps_analyzed': 5}
+    assert stages['density']['calls'] == 5
+    assert stages['tokenize']['calls'] == 10
+    assert {'bigrams', 'recommendations'} <= set(stages)
@@ -0,0 +1,41 @@
+from text_processing.cache import AnalysisCache
+
+APP = {"titulo": "Banco Digital", "descrição": "Conta digital grátis.", "store": "google"}
+
+
+def test_chave_muda_com_conteudo_e_versao():
+    chave = AnalysisCache.make_key(APP, "1:regex")
+
+    assert chave == AnalysisCache.make_key(dict(APP), "1:regex")
+    assert chave != AnalysisCache.make_key({**APP, "descrição": "Conta digital."}, "1:regex")
+    assert chave != AnalysisCache.make_key({**APP, "store": "apple"}, "1:regex")
+    assert chave != AnalysisCache.make_key(APP, "2:regex")
+
+
+def test_cache_persiste_entre_execucoes(tmp_path):
+    caminho = str(tmp_path / "cache.sqlite")
+    analise = {"recomendações": ["Palavras com alta repetição: digital"], "densidade": 12.5}
+
+    with AnalysisCache(caminho) as cache:
+        assert cache.get("app") is None
+        cache.put("app", analise)
+
+    with AnalysisCache(caminho) as cache:
+        assert cache.get("app") == analise
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 0, 1.0)
+        cache.clear()
+        assert cache.get("app") is None
+        assert len(cache) == 0
+
+
+def test_remove_entradas_menos_usadas(tmp_path):
+    with AnalysisCache(str(tmp_path / "cache.sqlite"), max_entries=10) as cache:
+        for indice in range(10):
+            cache.put(f"app{indice}", {"indice": indice})
+        cache.get("app0")  # app0 passa a ser a entrada usada mais recentemente
+        cache.put("app10", {"indice": 10})
+
+        assert len(cache) == 9
+        assert cache.get("app0") == {"indice": 0}
+        assert cache.get("app10") == {"indice": 10}
+        assert cache.get("app1") is None
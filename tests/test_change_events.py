@@ -0,0 +1,99 @@
+from collections import Counter
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from changeslog.app_change_tracker import IconChangeAnalysis, UpdateFrequencyAnalysis, VersionUpdateAnalysis
+from changeslog.change_events import (build_change_events, count_change_types, get_update_frequency,
+                                      last_change_per_app, update_cadence)
+
+
+def mudanca(id_, data, campo, anterior, atual):
+    return {'_id': id_, 'date': data, 'field': campo, 'previousValue': anterior, 'currentValue': atual}
+
+
+STORES = {
+    'apple': {
+        '123': {'content': [
+            {'changes': [mudanca('a1', '2024-10-01T10:00:00.000Z', 'version', '1.0', '1.1'),
+                         mudanca('a2', '2024-10-01T11:00:00.000Z', 'icon', 'x.png', 'y.png')]},
+            {'changes': [mudanca('a3', '2024-10-03T09:30:00Z', 'version', '1.1', '1.2')]},
+        ]},
+    },
+    'google': {
+        'com.banco': {'content': [
+            {'changes': [mudanca('g1', '2024-10-02T23:59:59.999Z', 'title', 'Banco', 'Banco Digital'),
+                         mudanca('g2', '2024-10-02T08:00:00.500Z', 'version', '5.0', '5.1')]},
+        ]},
+        'com.vazio': {'content': []},
+    },
+}
+
+
+@pytest.fixture
+def eventos():
+    return build_change_events(STORES)
+
+
+def test_build_change_events_gera_uma_linha_por_mudanca_com_tipos_colunares(eventos):
+    assert list(eventos['change_id']) == ['a1', 'a2', 'a3', 'g1', 'g2']
+    assert list(eventos['store']) == ['apple', 'apple', 'apple', 'google', 'google']
+    for coluna in ('app_id', 'store', 'field'):
+        assert isinstance(eventos[coluna].dtype, pd.CategoricalDtype)
+    assert str(eventos['date'].dt.tz) == 'UTC'
+    assert eventos['date'].iloc[2] == pd.Timestamp('2024-10-03T09:30:00', tz='UTC')
+
+
+def test_analises_sao_derivadas_da_tabela(eventos):
+    versoes = VersionUpdateAnalysis.from_events(eventos).version_updates
+    icones = IconChangeAnalysis.from_events(eventos).icon_changes
+    cadencia = UpdateFrequencyAnalysis.from_events(eventos).cadence()
+
+    assert {app: (anterior, atual) for app, (_, anterior, atual) in versoes.items()} == {
+        '123': ('1.1', '1.2'), 'com.banco': ('5.0', '5.1')}
+    assert list(icones) == ['123'] and icones['123'][0][1:] == ('x.png', 'y.png')
+    assert cadencia['updates'].to_dict() == {'123': 3, 'com.banco': 2}
+    assert last_change_per_app(eventos, 'promotionalText') == {}
+
+
+def test_contagens_e_frequencia_por_loja(eventos):
+    assert count_change_types(eventos, store='apple') == Counter({'version': 2, 'icon': 1})
+    assert count_change_types(eventos) == Counter({'version': 3, 'icon': 1, 'title': 1})
+
+    frequencia = get_update_frequency(eventos, store='apple')
+    assert list(frequencia.index) == ['123']
+    assert frequencia.loc['123'].tolist() == [2, 1]
+    assert list(frequencia.columns) == [pd.Timestamp('2024-10-01'), pd.Timestamp('2024-10-03')]
+
+
+def test_update_cadence_resume_intervalos_e_janelas_moveis():
+    datas = ['2024-01-01', '2024-01-02', '2024-01-05', '2024-01-06', '2024-03-01', '2024-03-20']
+    eventos = build_change_events({'google': {
+        'com.banco': {'content': [{'changes': [mudanca(str(i), f"{data}T12:00:00Z", 'version', '', '')
+                                               for i, data in enumerate(reversed(datas))]}]},
+        'com.loja': {'content': [{'changes': [mudanca('x', '2024-03-19T00:00:00Z', 'title', '', '')]}]},
+    }})
+
+    cadencia = update_cadence(eventos, window='30D')
+
+    banco = cadencia.loc['com.banco']
+    assert list(cadencia.index) == ['com.banco', 'com.loja']
+    assert banco['updates'] == 6
+    assert banco['mean_interval_days'] == pytest.approx((1 + 3 + 1 + 55 + 19) / 5)
+    assert banco['median_interval_days'] == 3
+    assert banco['p90_interval_days'] == pytest.approx(40.6)
+    assert (banco['max_window_updates'], banco['recent_window_updates']) == (4, 2)
+    assert cadencia.loc['com.loja'].tolist() == [1, 0, 0, 0, 1, 1]
+
+
+def test_relatorio_de_frequencia_igual_para_process_e_tabela(eventos):
+    analise = UpdateFrequencyAnalysis()
+    for app_id, data in zip(eventos['app_id'], eventos['date']):
+        analise.process(app_id, data.to_pydatetime())
+
+    relatorio = UpdateFrequencyAnalysis.from_events(eventos).generate_report()
+
+    assert analise.generate_report() == relatorio
+    assert "- **Intervalo mediano**: 0.50 dias, **p90**: 0.90 dias\n" in relatorio
+    assert "- **Data**: 2024-10-01, **Atualizações**: 2\n" in relatorio
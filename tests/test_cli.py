@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+
+nltk = pytest.importorskip("nltk")
+
+APPS = {
+    "Banco": {"titulo": "Banco Digital", "store": "google",
+              "descrição": "Abra sua conta digital grátis. Conta digital sem tarifas e Pix ilimitado."},
+    "Loja": {"titulo": "Loja Online", "store": "apple",
+             "descrição": "Compre eletrônicos com frete grátis e cupons exclusivos todos os dias."},
+}
+
+
+@pytest.fixture
+def cli():
+    """Importa o módulo da linha de comando, pulando o teste se os recursos do NLTK não estiverem instalados."""
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        pytest.skip("Recursos do NLTK indisponíveis")
+    from text_processing import cli
+    return cli
+
+
+def escreve_catalogo(path, apps=APPS):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(apps, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+def test_run_gera_um_relatorio_por_entrada_e_pula_os_atualizados(cli, tmp_path):
+    escreve_catalogo(tmp_path / 'snapshots' / '2024-01.json')
+    escreve_catalogo(tmp_path / 'snapshots' / 'antigos' / '2023-12.json')
+    saida = tmp_path / 'relatorios'
+
+    primeira = cli.run([str(tmp_path / 'snapshots' / '**' / '*.json')], str(saida), formats=['md', 'jsonl'])
+    segunda = cli.run([str(tmp_path / 'snapshots' / '**' / '*.json')], str(saida), formats=['md', 'jsonl'])
+
+    assert len(primeira['analyzed']) == 2 and not primeira['skipped']
+    assert not segunda['analyzed'] and len(segunda['skipped']) == 2
+    assert sorted(os.listdir(saida)) == ['2023-12.jsonl', '2023-12.md', '2024-01.jsonl', '2024-01.md']
+    with open(saida / '2024-01.jsonl', encoding='utf-8') as file:
+        assert [json.loads(linha)['app'] for linha in file] == ["Banco", "Loja"]
+
+
+def test_run_reanalisa_entradas_modificadas_e_registra_falhas(cli, tmp_path):
+    entrada = escreve_catalogo(tmp_path / 'loja.json')
+    (tmp_path / 'quebrado.json').write_text('{"App": ', encoding='utf-8')
+    saida = tmp_path / 'relatorios'
+    cli.run([str(tmp_path / '*.json')], str(saida))
+
+    escreve_catalogo(entrada, {"Banco": APPS["Banco"]})
+    os.utime(entrada, (os.path.getmtime(saida / 'loja.md') + 10,) * 2)
+    resumo = cli.run([str(tmp_path / '*.json')], str(saida))
+
+    assert resumo['analyzed'] == [str(entrada)]
+    assert resumo['failed'] == [str(tmp_path / 'quebrado.json')]
+    assert "Loja" not in (saida / 'loja.md').read_text(encoding='utf-8')
+    assert sorted(os.listdir(saida)) == ['loja.md']
+
+
+def test_run_registra_como_falha_entrada_com_registro_malformado(cli, tmp_path):
+    escreve_catalogo(tmp_path / 'loja.json')
+    escreve_catalogo(tmp_path / 'sem_descricao.json', {"Banco": {"titulo": "Banco Digital"}})
+    saida = tmp_path / 'relatorios'
+
+    resumo = cli.run([str(tmp_path / '*.json')], str(saida))
+
+    assert resumo['analyzed'] == [str(tmp_path / 'loja.json')]
+    assert resumo['failed'] == [str(tmp_path / 'sem_descricao.json')]
+    assert sorted(os.listdir(saida)) == ['loja.md']
+
+
+def test_run_recusa_entradas_que_gerariam_as_mesmas_saidas(cli, tmp_path):
+    escreve_catalogo(tmp_path / 'a' / 'stores.json')
+    escreve_catalogo(tmp_path / 'b' / 'stores.json')
+
+    with pytest.raises(ValueError, match="mesmas saídas"):
+        cli.run([str(tmp_path / '*' / 'stores.json')], str(tmp_path / 'relatorios'))
@@ -0,0 +1,162 @@
+import json
+import os
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from changeslog.change_events import build_change_events
+from changeslog.event_store import ChangeEventStore
+
+
+def mudanca(id_, data, campo, anterior, atual):
+    return {'_id': id_, 'date': data, 'field': campo, 'previousValue': anterior, 'currentValue': atual}
+
+
+def changeslog(*mudancas):
+    return {'123': {'content': [{'changes': list(mudancas)}]}}
+
+
+def salvar(path, data):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file)
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ChangeEventStore(str(tmp_path / 'eventos.sqlite')) as store:
+        yield store
+
+
+def test_ingest_ignora_mudancas_ja_guardadas(store):
+    primeira = changeslog(mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1'),
+                          mudanca('a2', '2024-10-02T10:00:00Z', 'icon', None, 'y.png'))
+    # Janela de coleta sobreposta: a2 aparece de novo
+    segunda = changeslog(mudanca('a2', '2024-10-02T10:00:00Z', 'icon', None, 'y.png'),
+                         mudanca('a3', '2024-10-03T10:00:00.250Z', 'version', '1.1', '1.2'))
+
+    assert store.ingest(build_change_events({'apple': primeira})) == 2
+    assert store.ingest(build_change_events({'apple': segunda})) == 1
+    assert len(store) == 3
+
+    eventos = store.events()
+    assert list(eventos['change_id']) == ['a1', 'a2', 'a3']
+    assert list(eventos['previous_value']) == ['1.0', None, '1.1']
+    assert str(eventos['date'].dtype) == 'datetime64[us, UTC]'
+    assert eventos['date'].iloc[2] == pd.Timestamp('2024-10-03T10:00:00.250Z')
+    assert eventos['app_id'].dtype == 'category'
+
+
+def test_events_do_consumidor_traz_so_o_que_chegou_depois_da_marca(store):
+    store.ingest(build_change_events({'apple': changeslog(
+        mudanca('a1', '2024-10-05T10:00:00Z', 'version', '1.0', '1.1'))}))
+    pendentes = store.events('relatorio')
+    assert list(pendentes['change_id']) == ['a1']
+    store.advance('relatorio', pendentes)
+    assert store.events('relatorio').empty
+    assert store.watermarks('relatorio') == {('apple', '123'): pd.Timestamp('2024-10-05T10:00:00Z')}
+
+    # Um evento coletado tarde, com data anterior à marca, ainda é entregue
+    store.ingest(build_change_events({'apple': changeslog(
+        mudanca('a0', '2024-09-30T10:00:00Z', 'title', 'Banco', 'Banco Digital'))}))
+    assert list(store.events('relatorio')['change_id']) == ['a0']
+    # Outros consumidores têm marcas próprias
+    assert list(store.events('outro')['change_id']) == ['a1', 'a0']
+
+    store.reset('relatorio')
+    assert len(store.events('relatorio')) == 2
+
+
+def test_ingest_files_pula_arquivos_que_nao_mudaram(store, tmp_path):
+    path = salvar(tmp_path / 'apple.json', changeslog(mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1')))
+    assert store.ingest_files({'apple': path}) == 1
+    assert store.ingest_files({'apple': path}) == 0
+
+    salvar(path, changeslog(mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1'),
+                            mudanca('a2', '2024-10-04T10:00:00Z', 'version', '1.1', '1.2')))
+    os.utime(path, (0, os.path.getmtime(path) + 10))
+    assert store.ingest_files({'apple': path}) == 1
+    assert store.ingest_files({'apple': str(tmp_path / 'faltando.json')}) == 0
+
+
+def test_ingest_files_le_de_novo_arquivo_que_falhou(store, tmp_path):
+    path = tmp_path / 'apple.json'
+    path.write_text('{"123": ', encoding='utf-8')
+    assert store.ingest_files({'apple': str(path)}) == 0
+
+    # Corrigido com o mesmo tamanho e data de modificação: ainda assim é lido, pois a falha não foi registrada
+    stat = os.stat(path)
+    salvar(path, changeslog(mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1')))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert store.ingest_files({'apple': str(path)}) == 1
+    assert store.ingest_files({'apple': str(path)}) == 0
+
+
+def test_main_incremental_separa_os_eventos_novos_do_relatorio_completo(tmp_path, monkeypatch):
+    from changeslog import app_change_tracker
+
+    # `DataFrame.to_markdown` requer o tabulate, que não é dependência do projeto
+    monkeypatch.setattr(pd.DataFrame, 'to_markdown', lambda frame: frame.to_csv(), raising=False)
+    (tmp_path / 'data').mkdir()
+    monkeypatch.setattr(app_change_tracker, '__file__', str(tmp_path / 'app_change_tracker.py'))
+    apple = tmp_path / 'data' / 'changeslog_apple_results.json'
+    salvar(apple, changeslog(mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1')))
+    argv = ['--incremental', '--store', str(tmp_path / 'eventos.sqlite')]
+    app_change_tracker.main(argv)
+
+    salvar(apple, changeslog(mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1'),
+                             mudanca('a2', '2024-10-08T10:00:00Z', 'version', '1.1', '1.2')))
+    os.utime(apple, (0, os.path.getmtime(apple) + 10))
+    app_change_tracker.main(argv)
+
+    completo = (tmp_path / 'data' / 'relatorio_analise_changeslog.md').read_text(encoding='utf-8')
+    novos = (tmp_path / 'data' / 'relatorio_analise_changeslog_incremental.md').read_text(encoding='utf-8')
+    assert "version: 2 mudanças" in completo
+    assert "**Intervalo médio entre atualizações**: 7.00 dias" in completo
+    assert "de versão 1.1 para 1.2" in novos and "version: 1 mudanças" in novos
+    assert "Frequência" not in novos
+    with open(tmp_path / 'data' / 'apple_update_freq.csv', encoding='utf-8') as file:
+        assert file.readline().count('2024-10-') == 2
+
+
+def test_historico_guardado_mais_eventos_novos_igual_ao_historico_inteiro(store):
+    from changeslog.app_change_tracker import CONSUMER, ChangeHistory
+    from changeslog.report_builder import render_markdown
+
+    def secoes(historico):
+        return [render_markdown(secao) for secao in [*historico.sections(), historico.change_types_section()]]
+
+    store.ingest(build_change_events({'apple': changeslog(
+        mudanca('a1', '2024-10-01T10:00:00Z', 'version', '1.0', '1.1'),
+        mudanca('a2', '2024-10-02T10:00:00Z', 'icon', None, 'y.png'))}))
+    novos = store.events(CONSUMER)
+    store.advance(CONSUMER, novos, state=ChangeHistory.from_events(novos).dumps())
+
+    store.ingest(build_change_events({'apple': changeslog(
+        mudanca('a3', '2024-10-05T10:00:00Z', 'version', '1.1', '1.2'),
+        mudanca('a4', '2024-09-30T10:00:00Z', 'icon', 'x.png', 'y.png')),
+        'google': {'com.banco': {'content': [{'changes': [
+            mudanca('g1', '2024-10-03T10:00:00Z', 'title', 'Banco', 'Banco Digital')]}]}}}))
+    historico = ChangeHistory.loads(store.state(CONSUMER))
+    novos = store.events(CONSUMER)
+    assert list(novos['change_id']) == ['a3', 'a4', 'g1']
+    historico.update(novos)
+
+    assert secoes(historico) == secoes(ChangeHistory.from_events(store.events()))
+    assert historico.change_types == {'apple': {'version': 2, 'icon': 2}, 'google': {'title': 1}}
+    # Só loja, app e data, agrupados por app, para a cadência e as tabelas por dia
+    datas = store.dates()
+    assert list(datas.columns) == ['app_id', 'store', 'date']
+    assert list(datas['app_id'].cat.categories) == ['123', 'com.banco']
+    assert [data.day for data in datas['date']] == [1, 2, 5, 30, 3]
+
+    store.reset(CONSUMER)
+    assert store.state(CONSUMER) is None
+
+
+def test_mudancas_sem_id_sao_identificadas_pelo_conteudo(store):
+    sem_id = {'date': '2024-10-01T10:00:00Z', 'field': 'version', 'previousValue': '1.0', 'currentValue': '1.1'}
+    eventos = build_change_events({'google': {'com.banco': {'content': [{'changes': [sem_id, dict(sem_id)]}]}}})
+    assert store.ingest(eventos) == 1
+    assert store.ingest(eventos) == 0
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependências pesadas que só devem ser importadas no primeiro uso
+MODULOS_PESADOS = ('nltk', 'numpy', 'rake_nltk', 'openai', 'dotenv')
+
+# Tempo máximo (cumulativo, em microssegundos) para importar cada módulo
+LIMITE_IMPORTACAO_US = 200_000
+
+SCRIPT = """
+import logging, os, sys
+import {modulo}
+assert not logging.getLogger().handlers, "logging configurado na importação"
+assert not os.listdir('.'), "arquivos criados na importação: %s" % os.listdir('.')
+print(','.join(sorted(nome for nome in {pesados!r} if nome in sys.modules)))
+"""
+
+
+@pytest.mark.parametrize("modulo", [
+    "text_processing.loader",
+    "text_processing.tokenizers",
+    "text_processing.AppDescriptionOptimizer",
+    "text_processing.RakeKeywordExtractor",
+])
+def test_importacao_rapida_e_sem_efeitos_colaterais(modulo, tmp_path):
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT.format(modulo=modulo, pesados=MODULOS_PESADOS)],
+        cwd=tmp_path, env={**os.environ, "PYTHONPATH": RAIZ},
+        capture_output=True, text=True, check=True,
+    )
+
+    assert resultado.stdout.strip() == ""
+
+    # Linhas do -X importtime: "import time: self [us] | cumulative | nome"
+    tempos = {
+        partes[2].strip(): int(partes[1])
+        for partes in (linha.split("|") for linha in resultado.stderr.splitlines())
+        if len(partes) == 3 and partes[1].strip().isdigit()
+    }
+    assert tempos[modulo] < LIMITE_IMPORTACAO_US
+
+
+def test_benchmark_roda_como_modulo_e_como_script():
+    for comando in (["-m", "benchmarks.bench_analyzer"], [os.path.join(RAIZ, "benchmarks", "bench_analyzer.py")]):
+        subprocess.run([sys.executable, *comando, "--help"], cwd=RAIZ, capture_output=True, check=True)
@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+
+import pytest
+
+from text_processing.incremental_density import DensityState, replay_description_changes, text_diff
+from text_processing.tokenizers import get_tokenizer
+
+TRECHOS = ["Conta", "digital", "Pix.", "R$", "10,00", "(grátis)", "“oferta”", "Sr.", "A.", "3.", "...",
+           "--", "can't", "e", ",", "!", "cashback", "\n", " "]
+
+
+def _contagem_completa(texto):
+    return Counter(token for token in get_tokenizer('regex').tokenize(texto.lower()) if token.isalnum())
+
+
+def test_text_diff_isola_o_trecho_editado():
+    assert text_diff("conta digital grátis", "conta digital sem tarifas") == (14, 19, "sem tarifa")
+    assert text_diff("pix pix", "pix pix") == (7, 7, "")
+    assert text_diff("aaa", "aa") == (2, 3, "")
+
+
+def test_edicoes_incrementais_igualam_a_contagem_completa():
+    gerador = random.Random(1)
+    for _ in range(300):
+        estado = DensityState(' '.join(gerador.choice(TRECHOS) for _ in range(gerador.randrange(30))))
+        for _ in range(5):
+            inicio = gerador.randrange(len(estado.text) + 1)
+            fim = gerador.randrange(inicio, min(len(estado.text), inicio + 12) + 1)
+            trecho = ''.join(gerador.choice(TRECHOS) + gerador.choice([' ', '']) for _ in range(gerador.randrange(3)))
+            estado.update(estado.text[:inicio] + trecho + estado.text[fim:])
+
+            esperado = _contagem_completa(estado.text)
+            assert estado.counts == esperado
+            assert estado.total == sum(esperado.values())
+
+
+def test_replay_do_changeslog_igual_a_analise_completa():
+    nltk = pytest.importorskip("nltk")
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        pytest.skip("Recursos do NLTK indisponíveis")
+    from text_processing.AppDescriptionOptimizer import ASOKeywordAnalyzer
+
+    analyzer = ASOKeywordAnalyzer()
+    versoes = [
+        "Conta digital grátis com Pix.",
+        "Conta digital grátis com Pix e cashback. Cashback em todas as compras.",
+        "Conta digital sem tarifas, com Pix e cashback. Cashback cashback em todas as compras.",
+    ]
+    changes = [{"date": f"2024-01-0{indice + 1}", "field": "description",
+                "previousValue": anterior, "currentValue": atual}
+               for indice, (anterior, atual) in enumerate(zip(versoes, versoes[1:]))]
+    changes.insert(1, {"date": "2024-01-01", "field": "title", "previousValue": "A", "currentValue": "B"})
+
+    historico = list(replay_description_changes(changes, analyzer))
+
+    assert [data for data, _, _ in historico] == ["2024-01-01", "2024-01-02"]
+    for (_, densidade, recomendacoes), versao in zip(historico, versoes[1:]):
+        completa = analyzer.analyze_word_density(versao)
+        # Mesmos números; só a ordem entre palavras empatadas pode mudar
+        assert densidade['total_palavras'] == completa['total_palavras']
+        assert analyzer.expand_density(densidade) == analyzer.expand_density(completa)
+        assert recomendacoes == analyzer.density_recommendations(densidade)
+    assert "cashback" in historico[-1][2][0]
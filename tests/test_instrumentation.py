@@ -0,0 +1,68 @@
+import json
+
+from text_processing.instrumentation import NULL_INSTRUMENTATION, Instrumentation
+
+
+def test_stage_acumula_execucoes_tempo_e_maximo():
+    instrumentation = Instrumentation()
+    instrumentation.record('density', 0.25)
+    instrumentation.record('density', 0.75)
+    with instrumentation.stage('tokenize'):
+        pass
+    instrumentation.count('apps_analyzed')
+    instrumentation.count('apps_analyzed', 2)
+
+    summary = instrumentation.summary()
+
+    assert summary['stages']['density'] == {'calls': 2, 'seconds': 1.0, 'mean_ms': 500.0, 'max_ms': 750.0}
+    assert summary['stages']['tokenize']['calls'] == 1
+    assert summary['counters'] == {'apps_analyzed': 3}
+
+
+def test_take_e_merge_somam_as_medidas_de_outro_processo():
+    worker = Instrumentation()
+    worker.record('density', 0.5)
+    worker.count('apps_analyzed', 2)
+    principal = Instrumentation()
+    principal.record('density', 0.75)
+
+    principal.merge(worker.take())
+    principal.merge(worker.take())  # nada novo desde a última coleta
+
+    assert principal.stages == {'density': [2, 1.25, 0.75]}
+    assert principal.counters == {'apps_analyzed': 2}
+    assert worker.stages == {} and worker.counters == {}
+
+
+def test_to_prometheus_gera_metricas_por_etapa_e_contadores():
+    instrumentation = Instrumentation()
+    instrumentation.record('bigrams', 0.5)
+    instrumentation.count('cache-hits', 4)
+
+    linhas = instrumentation.to_prometheus().splitlines()
+
+    assert '# TYPE aso_stage_seconds_total counter' in linhas
+    assert 'aso_stage_calls_total{stage="bigrams"} 1' in linhas
+    assert 'aso_stage_seconds_max{stage="bigrams"} 0.5' in linhas
+    assert 'aso_cache_hits_total 4' in linhas
+
+
+def test_write_escolhe_o_formato_pela_extensao(tmp_path):
+    instrumentation = Instrumentation()
+    instrumentation.record('report', 0.1)
+
+    json_path = instrumentation.write(str(tmp_path / 'metricas' / 'run.json'))
+    prom_path = instrumentation.write(str(tmp_path / 'run.prom'))
+
+    with open(json_path, encoding='utf-8') as file:
+        assert json.load(file)['stages']['report']['calls'] == 1
+    with open(prom_path, encoding='utf-8') as file:
+        assert 'aso_stage_calls_total{stage="report"} 1' in file.read()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['metricas', 'run.prom']
+
+
+def test_instrumentacao_desligada_nao_guarda_nada():
+    with NULL_INSTRUMENTATION.stage('density'):
+        NULL_INSTRUMENTATION.count('apps_analyzed')
+    assert not NULL_INSTRUMENTATION.enabled
+    assert not hasattr(NULL_INSTRUMENTATION, 'stages')
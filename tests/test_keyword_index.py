@@ -0,0 +1,55 @@
+from text_processing.keyword_index import KeywordIndex
+from text_processing.tokens import TokenDocument
+
+
+def documento(texto):
+    return TokenDocument(texto, texto.lower().replace(".", " .").split())
+
+
+def montar_indice():
+    index = KeywordIndex()
+    index.add("Banco A", documento("Conta digital grátis. Conta com cashback."),
+              {"keywords": ["conta", "digital", "grátis", "cashback"], "bigrams": ["conta digital"]},
+              title_keywords=["banco"])
+    index.add("Banco B", documento("Conta digital com investimentos."),
+              {"keywords": ["conta", "digital", "investimentos"], "bigrams": ["conta digital"]},
+              title_keywords=["conta"])
+    index.add("Banco C", documento("Seguro e investimentos com cashback."),
+              {"keywords": ["seguro", "investimentos", "cashback"], "bigrams": []})
+    return index
+
+
+def test_posicoes_e_contagens():
+    index = montar_indice()
+
+    assert index.posting("conta", "Banco A") == (2, (0, 3), False)
+    assert index.posting("conta digital", "Banco A").positions == (0,)
+    assert index.posting("banco", "Banco A").in_title
+    assert index.posting("banco", "Banco B") is None
+    assert index.apps_using("cashback") == {"Banco A", "Banco C"}
+
+
+def test_consultas_de_lacuna_sobreposicao_e_ranking():
+    index = montar_indice()
+
+    assert index.gap("Banco C", competitors=["Banco A", "Banco B"])[:3] == [
+        ("conta", ["Banco A", "Banco B"]),
+        ("conta digital", ["Banco A", "Banco B"]),
+        ("digital", ["Banco A", "Banco B"]),
+    ]
+    assert index.gap("Banco C", limit=3) == index.gap("Banco C", competitors=["Banco A", "Banco B"], limit=3)
+    assert index.overlap("Banco A", "Banco C") == {"cashback"}
+    assert [app for app, _ in index.rank("conta")] == ["Banco B", "Banco A"]
+
+
+def test_indice_salvo_e_recarregado(tmp_path):
+    index = montar_indice()
+    caminho = tmp_path / "indice.pkl"
+    index.save(caminho)
+
+    recarregado = KeywordIndex.load(caminho)
+    recarregado.remove("Banco A")
+
+    assert recarregado.postings["conta"] == {"Banco B": index.postings["conta"]["Banco B"]}
+    assert "grátis" not in recarregado.postings
+    assert index.gap("Banco B", limit=2) == [("cashback", ["Banco A", "Banco C"]), ("banco", ["Banco A"])]
@@ -0,0 +1,47 @@
+import random
+
+from text_processing.lexicon_matcher import DEFAULT_LEXICONS, LexiconMatcher, Match
+
+
+def ocorrencias_ingenuas(lexicons, texto):
+    """Todas as ocorrências (sobrepostas) de cada termo, buscando termo a termo."""
+    texto = texto.lower()
+    encontradas = set()
+    for nome, termos in lexicons.items():
+        for termo in termos:
+            inicio = texto.find(termo)
+            while inicio != -1:
+                encontradas.add(Match(nome, termo, inicio, inicio + len(termo)))
+                inicio = texto.find(termo, inicio + 1)
+    return encontradas
+
+
+def test_mesmo_resultado_da_busca_termo_a_termo():
+    gerador = random.Random(11)
+    alfabeto = "abã "
+    lexicons = {f"lexico{i}": ["".join(gerador.choices(alfabeto, k=gerador.randint(1, 5))) for _ in range(30)]
+                for i in range(3)}
+    matcher = LexiconMatcher(lexicons)
+
+    for _ in range(200):
+        texto = "".join(gerador.choices(alfabeto + "B.", k=gerador.randint(0, 80)))
+        matches = list(matcher.finditer(texto))
+        assert set(matches) == ocorrencias_ingenuas(matcher.lexicons, texto)
+        assert len(matches) == len(set(matches))
+
+
+def test_lexicos_do_notebook():
+    matcher = LexiconMatcher()
+    descricao = "Baixe agora e aproveite FRETE GRÁTIS em todo o Brasil! Oferta exclusiva."
+
+    assert matcher.present(descricao) == {
+        'ctas': ["baixe agora", "aproveite"],
+        'promocoes': ["frete grátis", "oferta"],
+        'locais': ["brasil", "frete", "oferta"],
+    }
+    assert Match('promocoes', 'frete grátis', 24, 36) in matcher.scan(descricao)['promocoes']
+    assert set(matcher.lexicons) == set(DEFAULT_LEXICONS)
+
+
+def test_lexicos_vazios():
+    assert list(LexiconMatcher({'vazio': []}).finditer("qualquer texto")) == []
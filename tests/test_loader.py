@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from text_processing.loader import iter_apps
+
+APPS = {
+    "Nubank": {"titulo": "Nubank: conta e cartão", "descrição": "Conta digital " * 40, "store": "google"},
+    "Itaú": {"titulo": "Itaú", "descrição": "Banco com \"aspas\", {chaves} e números 1.5e3", "store": "apple"},
+    "Vazio": {},
+    "Lista": [1, 2.5, None, True],
+}
+
+
+def test_iter_apps_le_objeto_em_blocos_pequenos(tmp_path):
+    caminho = tmp_path / "stores.json"
+    caminho.write_text(json.dumps(APPS, ensure_ascii=False, indent=4), encoding='utf-8')
+
+    pares = list(iter_apps(str(caminho), chunk_size=7))
+
+    assert pares == list(APPS.items())
+
+
+def test_iter_apps_e_um_gerador(tmp_path):
+    caminho = tmp_path / "stores.json"
+    caminho.write_text(json.dumps(APPS, ensure_ascii=False), encoding='utf-8')
+
+    apps = iter_apps(str(caminho), chunk_size=16)
+
+    assert next(apps) == ("Nubank", APPS["Nubank"])
+
+
+def test_iter_apps_le_json_lines(tmp_path):
+    caminho = tmp_path / "stores.jsonl"
+    linhas = [json.dumps({nome: dados}, ensure_ascii=False) for nome, dados in APPS.items()]
+    caminho.write_text("\n".join(linhas) + "\n\n", encoding='utf-8')
+
+    assert list(iter_apps(str(caminho))) == list(APPS.items())
+
+
+@pytest.mark.parametrize("conteudo", ['{"a": {"b": 1}', '{"a" {"b": 1}}', '["a"]', '{"a": 1,}'])
+def test_iter_apps_rejeita_json_invalido(tmp_path, conteudo):
+    caminho = tmp_path / "stores.json"
+    caminho.write_text(conteudo, encoding='utf-8')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_apps(str(caminho), chunk_size=4))
+
+
+def test_iter_apps_objeto_vazio(tmp_path):
+    caminho = tmp_path / "stores.json"
+    caminho.write_text("  { }  ", encoding='utf-8')
+
+    assert list(iter_apps(str(caminho))) == []
@@ -0,0 +1,41 @@
+import pytest
+
+from text_processing.locales import DEFAULT_LOCALE, get_profile, iter_locale_batches, resolve_locale
+
+
+@pytest.mark.parametrize("data, esperado", [
+    ({"lang": "en-US", "country": "US"}, "en-US"),
+    ({"lang": "es_mx"}, "es-MX"),
+    ({"lang": "pt-PT"}, "pt-BR"),
+    ({"country": "MX"}, "es-MX"),
+    ({"lang": "fr-FR", "country": "US"}, "en-US"),
+    ({}, DEFAULT_LOCALE),
+])
+def test_resolve_locale_pelos_metadados_da_loja(data, esperado):
+    assert resolve_locale(data) == esperado
+
+
+def test_perfil_compartilhado_e_regras_do_tokenizador():
+    perfil = get_profile("pt-BR")
+
+    assert get_profile("pt-BR") is perfil
+    assert get_profile("pt-BR", "nltk") is not perfil
+    assert perfil.store_limits("apple")["titulo"] == 30
+    assert perfil.store_limits("desconhecida")["titulo"] == 50
+    # Abreviações do idioma não encerram a sentença
+    assert perfil.tokenizer.tokenize("fale com o sr. silva") == ["fale", "com", "o", "sr.", "silva"]
+    assert get_profile("en-US").tokenizer.tokenize("fale com o sr. silva") == ["fale", "com", "o", "sr", ".", "silva"]
+    with pytest.raises(ValueError):
+        get_profile("xx-XX")
+
+
+def test_iter_locale_batches_agrupa_mantendo_a_ordem():
+    apps = [(f"App {indice}", {"lang": ["pt-BR", "en-US", "es-MX"][indice % 3]}) for indice in range(10)]
+
+    lotes = list(iter_locale_batches(apps, batch_size=2))
+
+    assert all(len({resolve_locale(data) for _, data in lote}) == 1 for _, lote in lotes)
+    assert all(len(lote) <= 2 for _, lote in lotes)
+    assert sorted(nome for _, lote in lotes for nome, _ in lote) == sorted(nome for nome, _ in apps)
+    assert [nome for locale, lote in lotes if locale == "pt-BR" for nome, _ in lote] == \
+        ["App 0", "App 3", "App 6", "App 9"]
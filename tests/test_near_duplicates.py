@@ -0,0 +1,87 @@
+import random
+
+from text_processing.near_duplicates import NearDuplicateIndex, find_clusters, optimal_bands, shingles
+
+VOCABULARIO = [f"palavra{indice}" for indice in range(2000)]
+
+
+def _texto(gerador, tamanho=120):
+    return [gerador.choice(VOCABULARIO) for _ in range(tamanho)]
+
+
+def _quase_copia(gerador, palavras, trocas=2):
+    copia = list(palavras)
+    for posicao in gerador.sample(range(len(copia)), trocas):
+        copia[posicao] = gerador.choice(VOCABULARIO)
+    return copia
+
+
+def test_shingles_de_palavras():
+    assert shingles("conta digital sem tarifas".split(), 3) == {"conta digital sem", "digital sem tarifas"}
+    assert shingles(["pix"], 3) == {"pix"}
+    assert shingles([], 3) == set()
+
+
+def test_bandas_cobrem_as_permutacoes():
+    bandas, linhas = optimal_bands(0.8, 128)
+    assert bandas * linhas <= 128
+    # O limiar implícito (1/b)^(1/r) fica próximo do pedido
+    assert abs((1 / bandas) ** (1 / linhas) - 0.8) < 0.1
+
+
+def test_similaridade_estimada_pela_assinatura():
+    gerador = random.Random(3)
+    index = NearDuplicateIndex()
+    original = _texto(gerador)
+
+    assert index.similarity(index.signature(original), index.signature(list(original))) == 1.0
+    assert index.similarity(index.signature(original), index.signature(_quase_copia(gerador, original))) > 0.8
+    assert index.similarity(index.signature(original), index.signature(_texto(gerador))) < 0.1
+
+
+def test_encontra_quase_duplicatas_sem_falsos_positivos():
+    gerador = random.Random(5)
+    index = NearDuplicateIndex()
+    originais = {f"App {indice}": _texto(gerador) for indice in range(50)}
+    for nome, palavras in originais.items():
+        index.add(nome, index.signature(palavras))
+
+    encontrados = 0
+    for nome, palavras in originais.items():
+        match = index.find_duplicate(index.signature(_quase_copia(gerador, palavras, trocas=1)))
+        assert match is None or match[0] == nome
+        encontrados += match is not None
+    assert encontrados >= 45
+    assert index.find_duplicate(index.signature(_texto(gerador))) is None
+
+
+def test_find_clusters_agrupa_descricoes_copiadas():
+    base = ("Abra sua conta digital grátis. Conta digital sem tarifas, cartão de crédito sem anuidade "
+            "e Pix ilimitado. Faça transferências, pague boletos e acompanhe sua conta pelo app.")
+    apps = [
+        ("Banco A", {"descrição": base}),
+        ("Banco B", {"descrição": base.replace("ilimitado", "ilimitado e gratuito")}),
+        ("Banco C", {"descrição": base}),
+        ("Seguros", {"descrição": "Seguro auto com assistência 24 horas, guincho e carro reserva."}),
+    ]
+
+    clusters = find_clusters(apps, threshold=0.7)
+
+    assert [sorted(grupo) for grupo in clusters] == [["Banco A", "Banco B", "Banco C"]]
+
+
+def test_remove_e_salva_o_indice(tmp_path):
+    gerador = random.Random(11)
+    index = NearDuplicateIndex()
+    palavras = _texto(gerador)
+    index.add("App", index.signature(palavras), value="chave")
+    index.add("Copia", index.signature(palavras))
+    index.remove("Copia")
+
+    caminho = tmp_path / "quase_duplicatas.pkl"
+    index.save(caminho)
+    carregado = NearDuplicateIndex.load(caminho)
+
+    assert len(carregado) == 1
+    assert carregado.find_duplicate(carregado.signature(palavras)) == ("App", 1.0)
+    assert carregado.entries["App"][1] == "chave"
@@ -0,0 +1,53 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from text_processing.ngrams import ALL_GROUP, CorpusNgramCounter, SpaceSaving
+
+
+def test_space_saving_encontra_itens_frequentes_com_memoria_limitada():
+    gerador = random.Random(7)
+    fluxo = [f"raro{gerador.randrange(5000)}" for _ in range(20000)] + ["pix"] * 900 + ["cashback"] * 600
+    gerador.shuffle(fluxo)
+
+    sketch = SpaceSaving(100)
+    for item in fluxo:
+        sketch.add(item)
+    reais = Counter(fluxo)
+
+    assert len(sketch) == 100
+    assert [item for item, _ in sketch.most_common(2)] == ["pix", "cashback"]
+    for item, contagem in sketch.items():
+        assert reais[item] <= contagem <= reais[item] + sketch.error(item)
+
+
+def test_space_saving_exato_sem_transbordar():
+    sketch = SpaceSaving(10)
+    for item in "abracadabra":
+        sketch.add(item)
+
+    assert sketch.most_common() == [("a", 5), ("b", 2), ("r", 2), ("c", 1), ("d", 1)]
+    assert sketch.error("a") == 0
+
+
+def test_contador_por_loja_e_pmi():
+    contador = CorpusNgramCounter(stop_words={"de", "e", "sem"})
+    contador.add_apps([
+        ("A", {"descrição": "Cartão de crédito sem anuidade. Conta digital.", "store": "google"}),
+        ("B", {"descrição": "Cartão de crédito e conta digital, sem anuidade.", "store": "apple"}),
+        ("C", {"descrição": "Conta digital gratuita, cartão de crédito.", "store": "google"}),
+    ])
+
+    todos = contador.group(ALL_GROUP)
+    assert todos.documents == 3
+    assert todos.top_frequent(2, 1) == [(("conta", "digital"), 3)]
+    assert todos.top_frequent(3, 1) == [(("cartão", "de", "crédito"), 3)]
+    assert ("digital", "cartão") not in todos.ngrams[2]  # a vírgula separa os trechos
+    assert contador.group("apple").top_frequent(2, 1) == [(("conta", "digital"), 1)]
+    assert contador.group("google").documents == 2
+
+    total = todos.unigrams.total
+    assert todos.pmi(("conta", "digital")) == pytest.approx(math.log2(3 * total / (3 * 3)))
+    assert todos.top_pmi(2, 1, min_count=3) == [(("conta", "digital"), todos.pmi(("conta", "digital")))]
@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from text_processing.parallel import chunked, consume_in_thread, imap_ordered, prefetch
+
+
+def _quadrado(valor):
+    return valor * valor
+
+
+def test_chunked_divide_sem_perder_itens():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_imap_ordered_preserva_a_ordem_de_entrada():
+    entrada = (valor for valor in range(500))
+
+    resultado = list(imap_ordered(_quadrado, entrada, workers=3, chunksize=7))
+
+    assert resultado == [valor * valor for valor in range(500)]
+
+
+def test_prefetch_preserva_a_ordem_e_repassa_erros():
+    def itens():
+        yield from range(100)
+        raise ValueError("arquivo inválido")
+
+    recebidos = []
+    with pytest.raises(ValueError, match="arquivo inválido"):
+        for item in prefetch(itens(), maxsize=4):
+            recebidos.append(item)
+
+    assert recebidos == list(range(100))
+
+
+def test_prefetch_encerra_a_thread_se_o_consumo_parar():
+    gerador = prefetch(iter(range(1000)), maxsize=2)
+
+    assert next(gerador) == 0
+    gerador.close()
+
+    assert not any(thread.name == 'prefetch' for thread in threading.enumerate())
+
+
+def test_consume_in_thread_retorna_o_resultado_da_etapa_final():
+    assert consume_in_thread(sum, (valor for valor in range(1000)), maxsize=8) == sum(range(1000))
+
+
+def test_consume_in_thread_interrompe_a_producao_se_a_etapa_final_falhar():
+    produzidos = []
+
+    def produz():
+        for valor in range(10_000):
+            produzidos.append(valor)
+            yield valor
+
+    def falha(itens):
+        next(itens)
+        raise OSError("disco cheio")
+
+    with pytest.raises(OSError, match="disco cheio"):
+        consume_in_thread(falha, produz(), maxsize=4)
+
+    assert len(produzidos) < 10_000
@@ -0,0 +1,47 @@
+import pytest
+
+nltk = pytest.importorskip("nltk")
+pytest.importorskip("rake_nltk")
+
+from text_processing.RakeKeywordExtractor import RakeBatchExtractor, extrair_palavras_chave_rake
+
+DESCRICOES = [
+    "Conta digital sem tarifas. Cartão de crédito sem anuidade e cashback em todas as compras.",
+    "Seguro auto com assistência 24 horas. Guincho e carro reserva para você.",
+    "Investimentos com rendimento diário. Conta digital com Pix ilimitado.",
+]
+
+
+@pytest.fixture
+def extrator():
+    try:
+        nltk.data.find('corpora/stopwords')
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        pytest.skip("Recursos do NLTK indisponíveis")
+    return RakeBatchExtractor()
+
+
+def test_reaproveita_uma_instancia_do_rake(extrator):
+    resultados = list(extrator.extract_many(iter(DESCRICOES)))
+    rake = extrator.rake
+
+    assert list(extrator.extract_many(DESCRICOES)) == resultados
+    assert extrator.rake is rake
+    frases = dict(resultados[0])
+    assert frases["conta digital"] > 0 and frases["cartão"] > 0
+
+
+def test_paralelo_igual_ao_serial(extrator):
+    apps = [(f"App {indice}", {"descrição": descricao}) for indice, descricao in enumerate(DESCRICOES * 4)]
+
+    assert list(extrator.extract_apps(apps, workers=2, chunksize=2)) == list(extrator.extract_apps(apps))
+
+
+def test_formato_compativel_com_extract_keywords(extrator):
+    analise = extrator.to_keyword_analysis(extrator.extract(DESCRICOES[2]))
+
+    assert set(analise) == {'keywords', 'bigrams'}
+    assert "conta digital" in analise['bigrams']
+    assert all(len(palavra) > 3 for palavra in analise['keywords'])
+    assert set(analise['keywords']) <= set(extrair_palavras_chave_rake(DESCRICOES[2]))
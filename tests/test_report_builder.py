@@ -0,0 +1,88 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from changeslog.app_change_tracker import VersionUpdateAnalysis, change_types_section
+from changeslog.report_builder import Item, Paragraph, ReportBuilder, Section, Table, render_markdown
+
+
+def secoes():
+    # Os blocos vêm de geradores: cada seção só pode ser percorrida uma vez
+    apps = (Section(f"{app}:", (Item(f"**Data**: 2024-10-0{dia}", {'dia': dia}) for dia in (1, 2)), level=3)
+            for app in ('123', 'com.banco'))
+    return [
+        Section("Visão Geral", [Paragraph("Resumo.")]),
+        Section("Ícones", apps),
+    ]
+
+
+def test_markdown_e_json_saem_das_mesmas_secoes_numa_unica_passada(tmp_path):
+    markdown_path = tmp_path / 'relatorio.md'
+    json_path = tmp_path / 'relatorio.json'
+    with ReportBuilder(markdown_path=str(markdown_path), json_path=str(json_path), title="Relatório") as builder:
+        assert builder.write_all(secoes()) == 2
+
+    assert markdown_path.read_text(encoding='utf-8') == (
+        "# Relatório\n"
+        "\n## Visão Geral\nResumo.\n"
+        "\n## Ícones\n"
+        "\n### 123:\n- **Data**: 2024-10-01\n- **Data**: 2024-10-02\n"
+        "\n### com.banco:\n- **Data**: 2024-10-01\n- **Data**: 2024-10-02\n"
+    )
+    relatorio = json.loads(json_path.read_text(encoding='utf-8'))
+    assert relatorio['title'] == "Relatório"
+    assert [secao['title'] for secao in relatorio['sections']] == ["Visão Geral", "Ícones"]
+    assert relatorio['sections'][0]['blocks'] == [{'type': 'paragraph', 'text': "Resumo."}]
+    app = relatorio['sections'][1]['blocks'][1]
+    assert (app['type'], app['title'], app['level']) == ('section', 'com.banco:', 3)
+    assert app['blocks'][1] == {'type': 'item', 'text': "**Data**: 2024-10-02", 'data': {'dia': 2}}
+
+
+def test_json_de_relatorio_vazio_e_de_tabela(tmp_path):
+    vazio = tmp_path / 'vazio.json'
+    with ReportBuilder(json_path=str(vazio)):
+        pass
+    assert json.loads(vazio.read_text(encoding='utf-8')) == {'sections': []}
+
+    tabela = pd.DataFrame({pd.Timestamp('2024-10-01'): [1, 0]}, index=['123', 'com.banco'])
+    path = tmp_path / 'tabela.json'
+    with ReportBuilder(json_path=str(path)) as builder:
+        builder.write(Section("Frequência", [Table(tabela)]))
+    bloco = json.loads(path.read_text(encoding='utf-8'))['sections'][0]['blocks'][0]
+    assert bloco == {'type': 'table', 'index': ['123', 'com.banco'], 'columns': ['2024-10-01T00:00:00'],
+                     'data': [[1], [0]]}
+
+
+def test_secoes_do_rastreador_mantem_o_markdown():
+    analise = VersionUpdateAnalysis()
+    analise.process('123', datetime(2024, 10, 3, tzinfo=timezone.utc), '1.1', '1.2')
+    assert analise.generate_report() == (
+        "\n## Análise de Atualizações de Versão\n"
+        "- **123**: Em 2024-10-03, de versão 1.1 para 1.2\n"
+    )
+    assert analise.section().title == "Análise de Atualizações de Versão"
+
+    secao = change_types_section({'version': 2}, {'title': 1})
+    assert render_markdown(secao) == (
+        "\n## 2. Impacto no Posicionamento nas Lojas de Apps\n"
+        "\n### Mudanças mais comuns por tipo\n"
+        "\n#### Apple Store:\n- version: 2 mudanças\n"
+        "\n#### Google Play:\n- title: 1 mudanças\n"
+    )
+
+
+def test_falha_ao_abrir_uma_saida_fecha_as_ja_abertas(tmp_path):
+    (tmp_path / 'arquivo').write_text('', encoding='utf-8')
+    builder = ReportBuilder(markdown_path=str(tmp_path / 'relatorio.md'),
+                            json_path=str(tmp_path / 'arquivo' / 'relatorio.json'))
+    abertos = []
+    abrir = builder._open_text
+    builder._open_text = lambda path: abertos.append(abrir(path)) or abertos[-1]
+
+    with pytest.raises(OSError):
+        with builder:
+            pass
+    assert len(abertos) == 1 and abertos[0].closed
@@ -0,0 +1,87 @@
+import csv
+import json
+
+import pytest
+
+from text_processing.report_writer import TABLE_COLUMNS, ReportWriter, render_markdown
+
+
+def analise(indice):
+    return {
+        "título": {"texto": f"Banco {indice}", "caracteres": 7,
+                   "análise_keywords": {"keywords": ["banco"], "bigrams": []}},
+        "descrição": {
+            "caracteres": 120,
+            "análise_keywords": {"keywords": ["conta", "digital"], "bigrams": ["conta digital"]},
+            "análise_densidade": {"total_palavras": 20, "densidades": {
+                "conta": {"contagem": 3, "densidade": 15.0},
+                "digital": {"contagem": 2, "densidade": 10.0},
+            }},
+        },
+        "recomendações": ["Palavras com alta repetição: conta, digital"],
+    }
+
+
+def resultados(quantidade):
+    for indice in range(quantidade):
+        yield f"App {indice}", analise(indice)
+
+
+def test_escreve_todos_os_formatos_numa_passada(tmp_path):
+    distintivas = {"App 1": [("cashback", 0.8)]}
+    with ReportWriter(str(tmp_path / "r.md"), str(tmp_path / "r.jsonl"), str(tmp_path / "r.csv")) as writer:
+        assert writer.write_all(resultados(3), distintivas) == 3
+
+    markdown = (tmp_path / "r.md").read_text(encoding="utf-8")
+    assert markdown.count("Análise do App:") == 3
+    assert "- conta: 3 ocorrências (15.00%)" in markdown
+    assert "- cashback: 0.800" in markdown
+
+    registros = [json.loads(linha) for linha in (tmp_path / "r.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [registro["app"] for registro in registros] == ["App 0", "App 1", "App 2"]
+    assert registros[0]["análise"] == analise(0)
+    assert registros[1]["palavras_distintivas"] == [["cashback", 0.8]]
+
+    with open(tmp_path / "r.csv", encoding="utf-8", newline="") as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    assert list(linhas[0]) == list(TABLE_COLUMNS)
+    assert linhas[1]["bigramas"] == "conta digital"
+    assert linhas[1]["top_densidade"] == "conta:15.00; digital:10.00"
+    assert linhas[1]["palavras_distintivas"] == "cashback"
+
+
+def test_markdown_mantem_o_formato_do_relatorio():
+    assert render_markdown("App 0", analise(0)) == (
+        "\n==================================================\n"
+        "Análise do App: App 0\n"
+        "==================================================\n"
+        "\n### Análise do Título:\n- Caracteres: 7\n- Palavras-chave: banco\n"
+        "\n### Análise da Descrição:\n- Caracteres: 120\n- Total de palavras: 20\n"
+        "\n### Densidade de Palavras (Top 10):\n"
+        "- conta: 3 ocorrências (15.00%)\n- digital: 2 ocorrências (10.00%)\n"
+        "\n### Recomendações:\n- Palavras com alta repetição: conta, digital\n"
+    )
+
+
+def test_tabela_em_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    with ReportWriter(table_path=str(tmp_path / "r.parquet")) as writer:
+        writer.write_all(resultados(5))
+
+    tabela = pq.read_table(tmp_path / "r.parquet")
+    assert tabela.num_rows == 5
+    assert tabela.column("total_palavras").to_pylist() == [20] * 5
+
+
+def test_falha_ao_abrir_uma_saida_fecha_as_ja_abertas(tmp_path):
+    (tmp_path / 'arquivo').write_text('', encoding='utf-8')
+    writer = ReportWriter(markdown_path=str(tmp_path / 'relatorio.md'),
+                          jsonl_path=str(tmp_path / 'arquivo' / 'relatorio.jsonl'))
+    abertos = []
+    abrir = writer._open_text
+    writer._open_text = lambda path, newline=None: abertos.append(abrir(path, newline)) or abertos[-1]
+
+    with pytest.raises(OSError):
+        with writer:
+            pass
+    assert len(abertos) == 1 and abertos[0].closed
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("nltk")
+
+from text_processing.stemming import MemoStemmer, get_stemmer
+
+
+def test_stem_counts_agrega_formas_do_mesmo_radical():
+    stemmer = MemoStemmer('portuguese', 'snowball')
+
+    radicais = stemmer.stem_counts([("transferência", 2), ("transferências", 3), ("pix", 1)])
+
+    assert radicais[stemmer.stem("transferência")] == [5, {"transferência": 2, "transferências": 3}]
+    assert radicais[stemmer.stem("pix")] == [1, {"pix": 1}]
+
+
+def test_memo_limitado_conta_acertos():
+    stemmer = MemoStemmer('portuguese', 'snowball', memo_size=2)
+    for palavra in ["conta", "conta", "contas", "conta", "cartão", "cartões"]:
+        stemmer.stem(palavra)
+
+    info = stemmer.cache_info()
+    assert info.currsize == 2
+    assert (info.hits, info.misses) == (2, 4)
+    assert stemmer.hit_rate == pytest.approx(2 / 6)
+
+
+def test_get_stemmer_compartilhado_e_algoritmo_desconhecido():
+    assert get_stemmer('english', 'snowball') is get_stemmer('english', 'snowball')
+    with pytest.raises(ValueError):
+        MemoStemmer('portuguese', 'porter')
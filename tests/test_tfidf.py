@@ -0,0 +1,76 @@
+import numpy as np
+
+from text_processing.tfidf import TfidfIndex
+
+APPS = {
+    "Banco A": "Abra sua conta no banco. Conta digital com cashback no cartão.",
+    "Banco B": "Conta digital do banco com investimentos e rendimento diário.",
+    "Banco C": "Banco digital: conta, cartão e seguro de vida para você.",
+}
+
+
+def test_palavras_comuns_ao_corpus_perdem_peso():
+    index = TfidfIndex(stop_words={"com", "e", "no", "do", "sua", "de", "para", "você"})
+    for app_name, descricao in APPS.items():
+        index.add(app_name, descricao)
+
+    palavras = dict(index.distinctive_keywords("Banco A", top_k=3))
+
+    assert list(palavras) == ["abra", "cashback", "cartão"]
+    assert "banco" not in dict(index.distinctive_keywords("Banco A", top_k=100))
+
+
+def test_atualizacao_incremental_igual_a_reconstrucao():
+    incremental = TfidfIndex()
+    for app_name, descricao in APPS.items():
+        incremental.add(app_name, descricao)
+    incremental.add("Banco B", "Pix ilimitado e conta digital sem tarifas.")
+    incremental.add("Banco D", "Seguro de vida e previdência.")
+    incremental.remove("Banco C")
+
+    reconstruido = TfidfIndex.from_apps([
+        ("Banco A", {"descrição": APPS["Banco A"]}),
+        ("Banco B", {"descrição": "Pix ilimitado e conta digital sem tarifas."}),
+        ("Banco D", {"descrição": "Seguro de vida e previdência."}),
+    ])
+
+    assert incremental.all_distinctive_keywords() == reconstruido.all_distinctive_keywords()
+    for app_name in ("Banco A", "Banco B", "Banco D"):
+        assert incremental.distinctive_keywords(app_name) == reconstruido.distinctive_keywords(app_name)
+
+
+def test_matriz_esparsa_em_formato_csr():
+    index = TfidfIndex()
+    for app_name, descricao in APPS.items():
+        index.add(app_name, descricao)
+
+    app_names, indptr, indices, data = index.term_matrix()
+    _, _, _, pesos = index.tfidf_matrix()
+
+    assert app_names == list(APPS)
+    assert indptr[-1] == len(indices) == len(data)
+    assert data[indptr[0]:indptr[1]].sum() == 11  # palavras do "Banco A"
+    normas = [np.linalg.norm(pesos[inicio:fim]) for inicio, fim in zip(indptr[:-1], indptr[1:])]
+    np.testing.assert_allclose(normas, 1.0)
+
+
+def test_sync_so_reindexa_o_que_mudou_e_sobrevive_ao_salvamento(tmp_path, monkeypatch):
+    corpus = [(nome, {"descrição": descricao}) for nome, descricao in APPS.items()]
+    index = TfidfIndex()
+    assert index.sync(corpus) == (3, 0)
+    path = str(tmp_path / "tfidf.pkl")
+    index.save(path)
+
+    carregado = TfidfIndex.load(path)
+    adicionados = []
+    original_add = carregado.add
+    monkeypatch.setattr(carregado, "add", lambda nome, texto: adicionados.append(nome) or original_add(nome, texto))
+    novo_corpus = [corpus[0], ("Banco B", {"descrição": "Pix ilimitado e conta digital sem tarifas."})]
+    assert carregado.sync(novo_corpus) == (1, 1)
+    assert adicionados == ["Banco B"]
+
+    reconstruido = TfidfIndex.from_apps(novo_corpus)
+    assert carregado.all_distinctive_keywords() == reconstruido.all_distinctive_keywords()
+    consulta = carregado.distinctive_lookup()
+    assert len(consulta) == 2 and consulta.get("Banco C") is None
+    assert consulta.get("Banco A") == reconstruido.distinctive_keywords("Banco A")
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from changeslog.timestamps import parse_dates
+
+DATAS = ['2024-10-01T12:30:00.123Z', '2024-10-01T12:30:00Z', '2024-02-29T23:59:59.999Z', '1999-12-31T00:00:00Z']
+
+
+def test_parse_dates_aceita_os_dois_formatos_da_api():
+    resultado = parse_dates(DATAS)
+
+    esperado = [datetime.fromisoformat(valor.replace('Z', '+00:00')) for valor in DATAS]
+    assert str(resultado.dtype) == 'datetime64[us, UTC]'
+    assert list(resultado) == [pd.Timestamp(valor) for valor in esperado]
+
+
+def test_parse_dates_usa_a_conversao_generica_para_outros_formatos_iso():
+    resultado = parse_dates(iter(['2024-10-01T12:30:00-03:00', '2024-10-01T15:30:00.000001Z']))
+
+    assert resultado[0] == pd.Timestamp('2024-10-01T15:30:00', tz='UTC')
+    assert resultado[1].microsecond == 1
+    assert str(resultado.dtype) == 'datetime64[us, UTC]'
+
+
+@pytest.mark.parametrize("valor", ['2023-02-29T00:00:00Z', '2024-13-01T00:00:00Z', 'ontem'])
+def test_parse_dates_rejeita_datas_invalidas(valor):
+    with pytest.raises(ValueError):
+        parse_dates(['2024-10-01T12:30:00Z', valor])
+
+
+def test_parse_dates_vazio():
+    assert len(parse_dates([])) == 0
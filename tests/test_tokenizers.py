@@ -0,0 +1,85 @@
+import os
+import random
+
+import pytest
+
+from text_processing.loader import iter_apps
+from text_processing.tokenizers import NLTKTokenizer, RegexTokenizer, get_tokenizer
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_TESTE = os.path.join(RAIZ, 'tests', 'data', 'descricoes_apps.json')
+CORPUS_LOJAS = os.path.join(RAIZ, 'data', 'stores.json')
+
+
+@pytest.fixture(scope='module')
+def nltk_tokenizer():
+    nltk = pytest.importorskip("nltk")
+    try:
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        pytest.skip("Modelo Punkt do NLTK indisponível")
+    return NLTKTokenizer()
+
+
+def palavras(tokens):
+    return [token for token in tokens if token.isalnum()]
+
+
+def textos_do_corpus(caminho):
+    for app_name, data in iter_apps(caminho):
+        for campo in ('titulo', 'descrição'):
+            if data.get(campo):
+                yield f"{app_name}/{campo}", data[campo].lower()
+
+
+@pytest.mark.parametrize("caminho", [CORPUS_TESTE, CORPUS_LOJAS])
+def test_regex_equivale_ao_nltk_no_corpus(nltk_tokenizer, caminho):
+    if not os.path.exists(caminho):
+        pytest.skip(f"Corpus não encontrado: {caminho}")
+    regex = RegexTokenizer()
+
+    divergencias = [
+        nome for nome, texto in textos_do_corpus(caminho)
+        if palavras(regex.tokenize(texto)) != palavras(nltk_tokenizer.tokenize(texto))
+    ]
+
+    assert divergencias == []
+
+
+def test_regex_equivale_ao_nltk_em_pontuacao_adversarial(nltk_tokenizer):
+    rng = random.Random(2024)
+    vocabulario = ("conta digital grátis pix cartão crédito é você não 2024 10,00 1.000 24h 3º a o sr etc "
+                   "it's don't d'água e-mail www.banco.com.br r$ 100% cannot wanna").split()
+    pontuacao = list(".,;:!?()[]{}\"'«»“”‘’—–-/…*&@#$%`") + ["...", "--", "''", "``"]
+    regex = RegexTokenizer()
+
+    for _ in range(500):
+        partes = []
+        for _ in range(rng.randint(1, 30)):
+            palavra = rng.choice(vocabulario)
+            sorteio = rng.random()
+            if sorteio < 0.3:
+                palavra += rng.choice(pontuacao)
+            elif sorteio < 0.4:
+                palavra = rng.choice(pontuacao) + palavra
+            elif sorteio < 0.45:
+                palavra += rng.choice(pontuacao) + rng.choice(vocabulario)
+            elif sorteio < 0.5:
+                palavra = rng.choice(pontuacao)
+            partes.append(palavra)
+        texto = ' '.join(partes)
+
+        assert palavras(regex.tokenize(texto)) == palavras(nltk_tokenizer.tokenize(texto)), texto
+
+
+def test_regex_separa_pontuacao_e_mantem_palavras_compostas():
+    tokens = RegexTokenizer().tokenize("faça pix, pague boletos (sem tarifas) e use o e-mail: r$ 10,00 por mês. fim")
+
+    assert tokens == ['faça', 'pix', ',', 'pague', 'boletos', '(', 'sem', 'tarifas', ')', 'e', 'use', 'o',
+                      'e-mail', ':', 'r', '$', '10,00', 'por', 'mês', '.', 'fim']
+
+
+def test_get_tokenizer_reaproveita_instancia_e_rejeita_backend_desconhecido():
+    assert get_tokenizer('regex') is get_tokenizer('regex')
+    with pytest.raises(ValueError):
+        get_tokenizer('spacy')
@@ -1,235 +1,737 @@
 #!/usr/bin/env python3
+import argparse
 import json
 import os
+import pickle
+import heapq
 import logging
-from collections import Counter
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.collocations import BigramAssocMeasures, BigramCollocationFinder
-
-# Configuração do logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.FileHandler("logs/app.log", encoding='utf-8')
-    ]
-)
+from collections import deque
+from operator import itemgetter
+from text_processing.cache import AnalysisCache
+from text_processing.instrumentation import NULL_INSTRUMENTATION, Instrumentation
+from text_processing.keyword_index import KeywordIndex
+from text_processing.loader import iter_apps
+from text_processing.locales import (DEFAULT_LOCALE, LOCALE_BATCH_SIZE, LOCALES, STORE_NAMES, get_profile,
+                                    iter_locale_batches)
+from text_processing.parallel import DEFAULT_CHUNKSIZE, imap_ordered
+from text_processing.report_writer import ReportWriter
+from text_processing.tokenizers import DEFAULT_TOKENIZER, TOKENIZERS
+from text_processing.tokens import TokenDocument
+
+# Versão da análise; deve ser incrementada sempre que o resultado de analyze_app mudar,
+# invalidando as entradas antigas do cache
+ANALYZER_VERSION = 3
+
+# Quantidade de palavras mantidas na densidade compacta (as exibidas no relatório)
+DENSITY_TOP_K = 10
+
+# Densidade (%) acima da qual uma palavra é considerada repetida demais
+HIGH_DENSITY_THRESHOLD = 3.0
+
+# Similaridade mínima para reaproveitar a análise de uma descrição quase duplicada
+NEAR_DUPLICATE_THRESHOLD = 0.9
+
+# Arquivo de log usado quando o script é executado diretamente
+LOG_PATH = os.path.join('logs', 'app.log')
+
 logger = logging.getLogger(__name__)
 
+def configure_logging(log_path=LOG_PATH):
+    """Configura o logging em arquivo; chamado apenas na execução do script, nunca na importação."""
+    os.makedirs(os.path.dirname(log_path) or '.', exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=[
+            logging.FileHandler(log_path, encoding='utf-8')
+        ]
+    )
+
 class ASOKeywordAnalyzer:
     """Classe responsável por analisar palavras-chave e densidade em descrições de aplicativos para ASO."""
     
-    def __init__(self):
-        """Inicializa o ASOKeywordAnalyzer, configura NLTK e define caminhos para arquivos de dados."""
+    def __init__(self, tokenizer=DEFAULT_TOKENIZER, full_density=False, locale=DEFAULT_LOCALE, stemming=False,
+                 instrumentation=None):
+        """Inicializa o ASOKeywordAnalyzer e define caminhos para arquivos de dados.
+
+        `tokenizer` escolhe o backend de tokenização: 'regex' (rápido, padrão) ou 'nltk'.
+        `locale` escolhe o perfil de idioma (stopwords, regras do tokenizador e limites das lojas).
+        Com `full_density`, `analyze_app` guarda a densidade de todas as palavras, e não só a compacta.
+        Com `stemming`, `analyze_app` calcula também a densidade por radical (veja `analyze_stem_density`).
+        `instrumentation` (Instrumentation) mede o tempo de cada etapa; desligada por padrão.
+        Os recursos do NLTK só são carregados (e baixados, se faltarem) no primeiro uso.
+        """
         logger.info("Iniciando ASOKeywordAnalyzer")
-        try:
-            # Verifica se os pacotes NLTK necessários estão disponíveis, senão os baixa
-            nltk.data.find('corpora/stopwords')
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            logger.info("Baixando recursos do NLTK...")
-            nltk.download('stopwords')
-            nltk.download('punkt')
+        self.full_density = full_density
+        self.stemming = stemming
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
 
-        # Carregar stopwords em português
-        self.stop_words = set(stopwords.words('portuguese'))
+        # Perfil do locale e backend de tokenização com as regras do idioma
+        self.locale = locale
+        self.profile = get_profile(locale, tokenizer)
+        self.tokenizer = self.profile.tokenizer
 
         # Caminhos dos arquivos
         self.data_path = os.path.join('data', 'stores.json')  # Arquivo JSON com dados dos aplicativos
         self.report_path = os.path.join('data', 'report_aso.md')  # Arquivo de saída em markdown
+        self.cache_path = os.path.join('data', 'aso_cache.sqlite')  # Cache das análises por app
+        self.near_duplicates_path = os.path.join('data', 'near_duplicates.pkl')  # Índice de quase duplicatas
+        self.corpus_index_path = os.path.join('data', 'tfidf_index.pkl')  # Índice TF-IDF do corpus
 
         logger.info("ASOKeywordAnalyzer inicializado com sucesso")
 
-    def analyze_word_density(self, text):
-        """Analisa a densidade de todas as palavras no texto, excluindo stopwords."""
-        logger.info("Iniciando análise de densidade de palavras")
-
-        # Tokenização do texto
-        tokens = word_tokenize(text.lower())
-
-        # Remove pontuação e números
-        words = [word for word in tokens if word.isalnum()]
-
-        # Conta total de palavras
-        total_words = len(words)
-        logger.info(f"Total de palavras encontradas: {total_words}")
+    @property
+    def stop_words(self):
+        """Stopwords do idioma do locale, carregadas no primeiro uso e compartilhadas entre instâncias."""
+        return self.profile.stop_words
+
+    def tokenize(self, text):
+        """Tokeniza o texto uma única vez, devolvendo um TokenDocument reutilizável."""
+        with self.instrumentation.stage('tokenize'):
+            return TokenDocument(text, self.tokenizer.tokenize(text.lower()))
+
+    def _as_document(self, text):
+        """Aceita tanto texto bruto quanto um TokenDocument já tokenizado."""
+        if isinstance(text, TokenDocument):
+            return text
+        return self.tokenize(text)
+
+    def analyze_word_density(self, text, top_k=DENSITY_TOP_K, full=False):
+        """Analisa a densidade das palavras no texto (str ou TokenDocument), excluindo stopwords.
+
+        No modo compacto (padrão), `densidades` traz apenas as `top_k` palavras mais frequentes e
+        as que passam de HIGH_DENSITY_THRESHOLD, escolhidas sem ordenar o vocabulário inteiro, e o
+        vocabulário completo fica em listas paralelas em `vocabulario` (veja `expand_density`).
+        Com `full=True`, `densidades` traz todas as palavras, ordenadas por densidade.
+        """
+        logger.debug("Iniciando análise de densidade de palavras")
+
+        # Tokenização do texto (reaproveitada se já vier tokenizado)
+        document = self._as_document(text)
+
+        # Conta total de palavras (pontuação já removida no documento)
+        total_words = len(document.words)
+        logger.debug("Total de palavras encontradas: %d", total_words)
+
+        with self.instrumentation.stage('density'):
+            return self.density_from_counts(document.word_counts, total_words, top_k=top_k, full=full)
+
+    def density_from_counts(self, counts, total_words, top_k=DENSITY_TOP_K, full=False):
+        """Monta o resultado de `analyze_word_density` a partir da frequência de cada palavra e do total.
+
+        Permite reaproveitar contagens mantidas fora do analisador (por exemplo, atualizadas
+        a cada edição da descrição) sem tokenizar o texto de novo.
+        """
+        # Conta frequência de cada palavra, sem stopwords
+        stop_words = self.stop_words
+        word_counts = [(word, count) for word, count in counts.items() if word not in stop_words]
+
+        if full:
+            # Ordena por densidade (mais frequentes primeiro)
+            sorted_densities = {
+                word: {
+                    'contagem': count,
+                    'densidade': (count / total_words) * 100
+                }
+                for word, count in sorted(word_counts, key=itemgetter(1), reverse=True)
+            }
+            logger.debug("Análise de densidade concluída. Encontradas %d palavras únicas", len(sorted_densities))
+            return {
+                'total_palavras': total_words,
+                'densidades': sorted_densities
+            }
 
-        # Conta frequência de cada palavra
-        word_counts = Counter(words)
+        # Seleção parcial: as top_k mais frequentes e todas acima do limite de densidade
+        above_threshold = sum(
+            1 for _, count in word_counts if (count / total_words) * 100 > HIGH_DENSITY_THRESHOLD
+        )
+        top_words = heapq.nlargest(max(top_k, above_threshold), word_counts, key=itemgetter(1))
 
-        # Calcula densidade para cada palavra
-        densities = {
-            word: {
-                'contagem': count,
-                'densidade': (count / total_words) * 100
+        logger.debug("Análise de densidade concluída. Encontradas %d palavras únicas", len(word_counts))
+        return {
+            'total_palavras': total_words,
+            'densidades': {
+                word: {
+                    'contagem': count,
+                    'densidade': (count / total_words) * 100
+                }
+                for word, count in top_words
+            },
+            'vocabulario': {
+                'palavras': [word for word, _ in word_counts],
+                'contagens': [count for _, count in word_counts],
             }
-            for word, count in word_counts.items()
-            if word not in self.stop_words
         }
 
-        # Ordena por densidade (mais frequentes primeiro)
-        sorted_densities = dict(sorted(
-            densities.items(),
-            key=lambda x: x[1]['densidade'],
-            reverse=True
-        ))
-
-        logger.info(f"Análise de densidade concluída. Encontradas {len(sorted_densities)} palavras únicas")
+    def analyze_stem_density(self, text, top_k=DENSITY_TOP_K):
+        """Densidade por radical (RSLP em português): formas como "transferência" e "transferências" somam juntas.
+
+        Traz os `top_k` radicais mais frequentes e os que passam de HIGH_DENSITY_THRESHOLD, cada
+        um com as formas encontradas no texto, da mais à menos frequente. Os radicais vêm de um
+        memo LRU compartilhado, já que o vocabulário se repete muito entre descrições.
+        """
+        document = self._as_document(text)
+        total_words = len(document.words)
+        stop_words = self.stop_words
+        stems = self.profile.stemmer.stem_counts(
+            (word, count) for word, count in document.word_counts.items() if word not in stop_words
+        )
+
+        above_threshold = sum(
+            1 for count, _ in stems.values() if (count / total_words) * 100 > HIGH_DENSITY_THRESHOLD
+        )
+        top_stems = heapq.nlargest(max(top_k, above_threshold), stems.items(), key=lambda item: item[1][0])
         return {
             'total_palavras': total_words,
-            'densidades': sorted_densities
+            'densidades': {
+                stem: {
+                    'contagem': count,
+                    'densidade': (count / total_words) * 100,
+                    'formas': sorted(forms, key=forms.get, reverse=True)
+                }
+                for stem, (count, forms) in top_stems
+            }
         }
 
-    def load_data(self):
-        """Carrega os dados dos aplicativos de um arquivo JSON."""
+    @staticmethod
+    def expand_density(density):
+        """Reconstrói as densidades de todas as palavras, ordenadas, a partir de um resultado compacto."""
+        if 'vocabulario' not in density:
+            return density['densidades']
+        total_words = density['total_palavras']
+        vocabulary = density['vocabulario']
+        word_counts = sorted(zip(vocabulary['palavras'], vocabulary['contagens']), key=itemgetter(1), reverse=True)
+        return {
+            word: {'contagem': count, 'densidade': (count / total_words) * 100}
+            for word, count in word_counts
+        }
+
+    def iter_data(self):
+        """Gera pares (app_name, data) do arquivo de dados à medida que ele é lido (JSON ou JSON Lines)."""
         logger.info(f"Tentando carregar dados de: {self.data_path}")
+        count = 0
         try:
-            # Carregar dados do arquivo JSON
-            with open(self.data_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                logger.info(f"Dados carregados com sucesso. {len(data)} apps encontrados")
-                return data
+            for app_name, data in iter_apps(self.data_path):
+                count += 1
+                yield app_name, data
         except FileNotFoundError:
             logger.error(f"Arquivo não encontrado: {self.data_path}")
             raise FileNotFoundError(f"Arquivo não encontrado: {self.data_path}")
         except json.JSONDecodeError:
             logger.error("Erro ao decodificar o arquivo JSON")
             raise ValueError("Erro ao decodificar o arquivo JSON")
+        logger.info(f"Dados carregados com sucesso. {count} apps encontrados")
+
+    def load_data(self):
+        """Carrega todos os dados dos aplicativos de uma vez num dicionário."""
+        return dict(self.iter_data())
 
     def extract_keywords(self, text):
-        """Extrai palavras-chave e bigramas de um texto."""
-        logger.info("Iniciando extração de palavras-chave")
+        """Extrai palavras-chave e bigramas de um texto (str ou TokenDocument)."""
+        logger.debug("Iniciando extração de palavras-chave")
 
-        # Tokenização do texto
-        tokens = word_tokenize(text.lower())
+        # Tokenização do texto (reaproveitada se já vier tokenizado)
+        document = self._as_document(text)
 
         # Remove stopwords e palavras curtas
-        keywords = [word for word in tokens if word.isalnum() and word not in self.stop_words and len(word) > 3]
+        keywords = [word for word in document.words if word not in self.stop_words and len(word) > 3]
 
         # Encontra bigramas
-        bigram_measures = BigramAssocMeasures()
-        finder = BigramCollocationFinder.from_words(tokens)
-        finder.apply_freq_filter(2)
-        bigrams = finder.nbest(bigram_measures.pmi, 5)
-
-        logger.info(f"Extração concluída. Encontradas {len(keywords)} palavras-chave e {len(bigrams)} bigramas")
+        with self.instrumentation.stage('bigrams'):
+            from nltk.collocations import BigramAssocMeasures, BigramCollocationFinder
+            bigram_measures = BigramAssocMeasures()
+            finder = BigramCollocationFinder.from_words(document.tokens)
+            finder.apply_freq_filter(2)
+            bigrams = finder.nbest(bigram_measures.pmi, 5)
+
+        logger.debug("Extração concluída. Encontradas %d palavras-chave e %d bigramas", len(keywords), len(bigrams))
         return {
-            'keywords': list(set(keywords)),  # Remove duplicatas
+            'keywords': list(dict.fromkeys(keywords)),  # Remove duplicatas mantendo a ordem
             'bigrams': [' '.join(bigram) for bigram in bigrams]
         }
 
-    def analyze_app(self, app_name, data):
-        """Analisa título e descrição de um aplicativo, gerando recomendações baseadas em limites e densidade."""
-        logger.info(f"Iniciando análise do app: {app_name}")
+    def analyze_app(self, app_name, data, description_analysis=None, description_doc=None):
+        """Analisa título e descrição de um aplicativo, gerando recomendações baseadas em limites e densidade.
+
+        `description_analysis` reaproveita as palavras-chave e a densidade já calculadas para a
+        descrição de outro app (uma quase duplicata), analisando apenas o título.
+        `description_doc` reaproveita a descrição já tokenizada (TokenDocument).
+        """
+        logger.debug("Iniciando análise do app: %s", app_name)
+        self.instrumentation.count('apps_analyzed')
+
+        # Tokeniza título e descrição uma única vez para todas as etapas
+        titulo_doc = self.tokenize(data["titulo"])
+        if description_analysis is None:
+            descricao_doc = description_doc if description_doc is not None else self.tokenize(data["descrição"])
 
-        # Análise de densidade de palavras na descrição do aplicativo
-        densidade_palavras = self.analyze_word_density(data["descrição"])
+            # Análise de densidade de palavras na descrição do aplicativo
+            densidade_palavras = self.analyze_word_density(descricao_doc, full=self.full_density)
+            descricao = {
+                "caracteres": len(data["descrição"]),
+                "análise_keywords": self.extract_keywords(descricao_doc),
+                "análise_densidade": densidade_palavras
+            }
+
+            # Limitar o número de palavras-chave na descrição a 10
+            descricao["análise_keywords"]["keywords"] = descricao["análise_keywords"]["keywords"][:10]
+
+            # Densidade agregada por radical, além da densidade por forma
+            if self.stemming:
+                descricao["análise_densidade_radicais"] = self.analyze_stem_density(descricao_doc)
+        else:
+            descricao = {**description_analysis, "caracteres": len(data["descrição"])}
 
         # Estrutura para armazenar a análise
         analysis = {
             "título": {
                 "texto": data["titulo"],
                 "caracteres": len(data["titulo"]),
-                "análise_keywords": self.extract_keywords(data["titulo"])
-            },
-            "descrição": {
-                "caracteres": len(data["descrição"]),
-                "análise_keywords": self.extract_keywords(data["descrição"]),
-                "análise_densidade": densidade_palavras
+                "análise_keywords": self.extract_keywords(titulo_doc)
             },
+            "descrição": descricao,
             "recomendações": []
         }
 
-        # Limitar o número de palavras-chave na descrição a 10
-        analysis["descrição"]["análise_keywords"]["keywords"] = analysis["descrição"]["análise_keywords"]["keywords"][:10]
-
-        # Verificações de limites para cada loja (Apple/Google)
+        # Verificações de limites para cada loja (Apple/Google), definidos no perfil do locale
         store = data.get("store", "google")  # Loja padrão é Google
-        if store == "apple":
-            max_title_length = 30
-            max_subtitle_length = 30
-        else:  # google
-            max_title_length = 50
-            max_subtitle_length = 80
+        limits = self.profile.store_limits(store)
+        max_title_length = limits["titulo"]
+        max_description_length = limits["descrição"]
 
         # Recomendações sobre o comprimento do título e descrição
         if analysis["título"]["caracteres"] > max_title_length:
             analysis["recomendações"].append(f"O título excede o limite de {max_title_length} caracteres.")
-        if analysis["descrição"]["caracteres"] > 4000 and store == "google":
-            analysis["recomendações"].append("A descrição excede o limite de 4000 caracteres para a Google Play Store.")
+        if max_description_length is not None and analysis["descrição"]["caracteres"] > max_description_length:
+            analysis["recomendações"].append(
+                f"A descrição excede o limite de {max_description_length} caracteres "
+                f"para a {STORE_NAMES.get(store, store)}."
+            )
 
         # Gera recomendações baseadas na densidade das palavras
         self.generate_density_recommendations(analysis)
 
-        logger.info(f"Análise do app {app_name} concluída")
+        logger.debug("Análise do app %s concluída", app_name)
+        return analysis
+
+    @property
+    def cache_version(self):
+        """Versão usada nas chaves do cache: muda com a versão da análise, o locale, o tokenizador e o modo de densidade."""
+        density_mode = 'full' if self.full_density else 'compact'
+        if self.stemming:
+            density_mode += f"+{self.profile.stemmer_algorithm}"
+        return f"{ANALYZER_VERSION}:{self.locale}:{self.tokenizer.name}:{density_mode}"
+
+    def analyze_apps(self, app_items, workers=1, chunksize=DEFAULT_CHUNKSIZE, cache=None, near_duplicates=None):
+        """Analisa pares (app_name, data) em série ou num pool de processos, preservando a ordem de entrada.
+
+        Com um `cache` (AnalysisCache), apps cujo conteúdo não mudou são devolvidos do cache
+        sem passar pela análise, e apenas os demais são analisados e guardados. Com um índice
+        `near_duplicates` (NearDuplicateIndex), apps cuja descrição é quase uma cópia de outra
+        já analisada (e ainda no cache) reaproveitam a análise dessa descrição.
+        """
+        items = ((self, app_name, data) for app_name, data in app_items)
+        return self._analyze_items(items, workers, chunksize, cache, near_duplicates)
+
+    def analyze_by_locale(self, app_items, batch_size=LOCALE_BATCH_SIZE, workers=1, chunksize=DEFAULT_CHUNKSIZE,
+                          cache=None, near_duplicates=None):
+        """Analisa apps de vários locales, cada um com o perfil do seu idioma (veja `analyze_apps`).
+
+        O locale vem dos metadados da loja (`lang` e `country`). Os apps são agrupados em lotes
+        de um mesmo locale, e cada lote é analisado por um analisador desse locale, criado uma
+        única vez. A ordem de entrada é mantida dentro de cada locale; entre locales, os lotes
+        saem à medida que ficam completos. No modo paralelo, todos os lotes passam pelo mesmo
+        pool de processos, e cada worker mantém um analisador por locale.
+        """
+        analyzers = {self.locale: self}
+
+        def items():
+            for locale, batch in iter_locale_batches(app_items, batch_size):
+                analyzer = analyzers.get(locale)
+                if analyzer is None:
+                    analyzer = analyzers[locale] = ASOKeywordAnalyzer(
+                        tokenizer=self.tokenizer.name, full_density=self.full_density, locale=locale,
+                        stemming=self.stemming, instrumentation=self.instrumentation)
+                logger.info(f"Analisando lote de {len(batch)} apps do locale {locale}")
+                for app_name, data in batch:
+                    yield analyzer, app_name, data
+
+        return self._analyze_items(items(), workers, chunksize, cache, near_duplicates)
+
+    def _analyze_items(self, items, workers, chunksize, cache, near_duplicates):
+        """Analisa itens (analisador, app_name, data), cada app com o analisador do seu locale."""
+        if cache is None:
+            to_analyze = ((analyzer, app_name, data, None) for analyzer, app_name, data in items)
+        else:
+            # Entradas (app_name, analisador, chave, análise em cache ou None, assinatura MinHash) na ordem de entrada
+            pending = deque()
+            to_analyze = self._cache_misses(items, cache, pending, near_duplicates)
+
+        if workers == 1:
+            analyzed = ((app_name, analyzer.analyze_app(app_name, data, description_doc=document))
+                        for analyzer, app_name, data, document in to_analyze)
+        else:
+            logger.info(f"Analisando apps em paralelo com {workers or os.cpu_count()} processos")
+            instrumented = self.instrumentation.enabled
+            analyzed = imap_ordered(_analyze_item,
+                                    ((app_name, data, document, analyzer.locale)
+                                     for analyzer, app_name, data, document in to_analyze),
+                                    workers=workers, chunksize=chunksize, initializer=_init_worker,
+                                    initargs=(self.tokenizer.name, self.full_density, self.locale, self.stemming,
+                                              instrumented),
+                                    chunk_summary=_take_worker_metrics if instrumented else None,
+                                    on_summary=self.instrumentation.merge)
+
+        if cache is None:
+            yield from analyzed
+            return
+
+        for app_name, analysis in analyzed:
+            # Devolve os acertos do cache que vieram antes deste app na entrada
+            while pending[0][3] is not None:
+                cached_name, _, _, cached, _ = pending.popleft()
+                yield cached_name, cached
+            _, analyzer, key, _, signature = pending.popleft()
+            cache.put(key, analysis)
+            if signature is not None:
+                near_duplicates.add(app_name, signature, (analyzer.cache_version, key))
+            yield app_name, analysis
+        for cached_name, _, _, cached, _ in pending:
+            yield cached_name, cached
+
+    @staticmethod
+    def _cache_misses(items, cache, pending, near_duplicates=None):
+        """Consulta o cache para cada app, registrando-o em `pending` e gerando apenas os que faltam.
+
+        Os que faltam saem como (analisador, app_name, data, descrição tokenizada ou None): a
+        descrição tokenizada para a assinatura MinHash é reaproveitada na análise.
+        """
+        for analyzer, app_name, data in items:
+            key = cache.make_key(data, analyzer.cache_version)
+            analysis = cache.get(key)
+            signature = document = None
+            if analysis is None and near_duplicates is not None:
+                document = analyzer.tokenize(data["descrição"])
+                signature = near_duplicates.signature(document.words)
+                analysis = analyzer._reuse_near_duplicate(app_name, data, signature, near_duplicates, cache)
+                if analysis is not None:
+                    cache.put(key, analysis)
+            pending.append((app_name, analyzer, key, analysis, signature))
+            if analysis is None:
+                yield analyzer, app_name, data, document
+
+    def _reuse_near_duplicate(self, app_name, data, signature, near_duplicates, cache):
+        """Analisa o app reaproveitando a descrição de uma quase duplicata já analisada, se houver."""
+        match = near_duplicates.find_duplicate(signature)
+        if match is None:
+            return None
+        original_name, similarity = match
+        version, original_key = near_duplicates.entries[original_name][1]
+        # A análise original precisa ser da mesma versão e ainda estar no cache
+        original = cache.get(original_key, record=False) if version == self.cache_version else None
+        if original is None:
+            return None
+        logger.debug("%s é quase duplicata de %s (similaridade %.2f)", app_name, original_name, similarity)
+        self.instrumentation.count('near_duplicates_reused')
+        analysis = self.analyze_app(app_name, data, description_analysis=original["descrição"])
+        analysis["descrição"]["quase_duplicata_de"] = original_name
         return analysis
 
     def generate_density_recommendations(self, analysis):
         """Gera recomendações com base na densidade de palavras repetidas."""
-        logger.info("Gerando recomendações baseadas na densidade")
+        logger.debug("Gerando recomendações baseadas na densidade")
 
-        densidades = analysis["descrição"]["análise_densidade"]["densidades"]
-        total_palavras = analysis["descrição"]["análise_densidade"]["total_palavras"]
+        with self.instrumentation.stage('recommendations'):
+            analysis["recomendações"].extend(self.density_recommendations(analysis["descrição"]["análise_densidade"]))
 
+        logger.debug("Geradas %d recomendações", len(analysis['recomendações']))
+
+    @staticmethod
+    def density_recommendations(density):
+        """Recomendações para o resultado de `analyze_word_density` (palavras repetidas demais)."""
         # Verifica palavras que aparecem com muita frequência (>3% de repetição)
         palavras_alta_densidade = [
-            palavra for palavra, info in densidades.items()
-            if info['densidade'] > 3.0
+            palavra for palavra, info in density["densidades"].items()
+            if info['densidade'] > HIGH_DENSITY_THRESHOLD
         ]
-
         if palavras_alta_densidade:
-            analysis["recomendações"].append(
-                f"Palavras com alta repetição: {', '.join(palavras_alta_densidade)}"
-            )
-
-        logger.info(f"Geradas {len(analysis['recomendações'])} recomendações")
-
-    def save_analysis_to_markdown(self, results):
-        """Salva a análise em um arquivo markdown."""
-        with open(self.report_path, 'w', encoding='utf-8') as file:
-            for app_name, analysis in results.items():
-                file.write(f"\n{'=' * 50}\n")
-                file.write(f"Análise do App: {app_name}\n")
-                file.write(f"{'=' * 50}\n")
-
-                file.write("\n### Análise do Título:\n")
-                file.write(f"- Caracteres: {analysis['título']['caracteres']}\n")
-                file.write(f"- Palavras-chave: {', '.join(analysis['título']['análise_keywords']['keywords'])}\n")
-
-                file.write("\n### Análise da Descrição:\n")
-                file.write(f"- Caracteres: {analysis['descrição']['caracteres']}\n")
-                file.write(f"- Total de palavras: {analysis['descrição']['análise_densidade']['total_palavras']}\n")
-
-                file.write("\n### Densidade de Palavras (Top 10):\n")
-                densidade_items = list(analysis['descrição']['análise_densidade']['densidades'].items())
-                for palavra, info in densidade_items[:10]:
-                    file.write(f"- {palavra}: {info['contagem']} ocorrências ({info['densidade']:.2f}%)\n")
-
-                if analysis['recomendações']:
-                    file.write("\n### Recomendações:\n")
-                    for rec in analysis['recomendações']:
-                        file.write(f"- {rec}\n")
-
-def main():
-    """Função principal que coordena o processo de análise dos aplicativos."""
+            return [f"Palavras com alta repetição: {', '.join(palavras_alta_densidade)}"]
+        return []
+
+    def build_corpus_index(self, app_items):
+        """Monta o índice TF-IDF do corpus com as descrições de todos os apps, sem stopwords."""
+        from text_processing.tfidf import TfidfIndex
+
+        logger.info("Montando o índice TF-IDF do corpus")
+        index = TfidfIndex.from_apps(app_items, tokenizer=self.tokenizer, stop_words=self.stop_words)
+        logger.info(f"Índice TF-IDF montado: {len(index)} apps e {len(index.terms)} termos")
+        return index
+
+    def load_corpus_index(self, reset=False):
+        """Carrega o índice TF-IDF de `corpus_index_path`, ou cria um vazio.
+
+        Um índice salvo com outro tokenizador ou outras stopwords, ou ilegível, é descartado;
+        `reset` sempre começa do zero. Atualize-o com `TfidfIndex.sync` antes de consultar.
+        """
+        from text_processing.tfidf import TfidfIndex
+
+        if not reset and os.path.exists(self.corpus_index_path):
+            try:
+                index = TfidfIndex.load(self.corpus_index_path)
+            except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+                logger.warning(f"Índice TF-IDF descartado: {e}")
+            else:
+                if index.tokenizer.name == self.tokenizer.name and index.stop_words == frozenset(self.stop_words):
+                    logger.info(f"Índice TF-IDF carregado: {len(index)} apps")
+                    return index
+        return TfidfIndex(tokenizer=self.tokenizer, stop_words=self.stop_words)
+
+    def update_corpus_index(self, app_items, reset=False):
+        """Atualiza o índice TF-IDF salvo com o corpus atual e o salva de novo.
+
+        Só as descrições novas ou alteradas desde a última execução são tokenizadas.
+        """
+        index = self.load_corpus_index(reset=reset)
+        updated, removed = index.sync(app_items)
+        logger.info(f"Índice TF-IDF: {updated} apps indexados, {removed} removidos, {len(index)} no total")
+        if updated or removed or not os.path.exists(self.corpus_index_path):
+            os.makedirs(os.path.dirname(self.corpus_index_path) or '.', exist_ok=True)
+            index.save(self.corpus_index_path)
+        return index
+
+    def build_keyword_index(self, app_items):
+        """Monta o índice invertido de palavras-chave e bigramas (título e descrição) de todos os apps."""
+        logger.info("Montando o índice invertido de palavras-chave")
+        index = KeywordIndex()
+        for app_name, data in app_items:
+            titulo_doc = self.tokenize(data["titulo"])
+            descricao_doc = self.tokenize(data["descrição"])
+            titulo_keywords = self.extract_keywords(titulo_doc)
+            index.add(app_name, descricao_doc, self.extract_keywords(descricao_doc),
+                      title_keywords=titulo_keywords['keywords'] + titulo_keywords['bigrams'])
+        logger.info(f"Índice invertido montado: {len(index)} apps e {len(index.postings)} termos")
+        return index
+
+    def build_ngram_counter(self, app_items, **kwargs):
+        """Conta bigramas e trigramas do corpus inteiro e por loja, uma descrição por vez."""
+        from text_processing.ngrams import CorpusNgramCounter
+
+        logger.info("Contando n-gramas do corpus")
+        counter = CorpusNgramCounter(tokenizer=self.tokenizer, stop_words=self.stop_words, **kwargs)
+        return counter.add_apps(app_items)
+
+    def load_near_duplicates(self, threshold=NEAR_DUPLICATE_THRESHOLD, reset=False):
+        """Carrega o índice de quase duplicatas de `near_duplicates_path`, ou cria um novo.
+
+        Um índice salvo com outro limiar, ou ilegível, é descartado; `reset` sempre começa do zero.
+        """
+        from text_processing.near_duplicates import NearDuplicateIndex
+
+        if not reset and os.path.exists(self.near_duplicates_path):
+            try:
+                index = NearDuplicateIndex.load(self.near_duplicates_path)
+            except (OSError, ValueError, pickle.UnpicklingError) as e:
+                logger.warning(f"Índice de quase duplicatas descartado: {e}")
+            else:
+                if index.threshold == threshold:
+                    logger.info(f"Índice de quase duplicatas carregado: {len(index)} descrições")
+                    return index
+        return NearDuplicateIndex(threshold=threshold)
+
+    def save_ngrams_to_markdown(self, counter, path, top=20):
+        """Salva as frases mais frequentes e de maior PMI de cada grupo (corpus e lojas) em markdown."""
+        with open(path, 'w', encoding='utf-8') as file:
+            for group, stats in counter.groups.items():
+                file.write(f"\n## N-gramas: {group} ({stats.documents} descrições)\n")
+                for order in counter.orders:
+                    file.write(f"\n### {order}-gramas mais frequentes:\n")
+                    for gram, count in stats.top_frequent(order, top):
+                        file.write(f"- {' '.join(gram)}: {count}\n")
+                    file.write(f"\n### {order}-gramas por PMI:\n")
+                    for gram, score in stats.top_pmi(order, top):
+                        file.write(f"- {' '.join(gram)}: {score:.2f}\n")
+
+    def save_analysis_to_markdown(self, results, distinctive_keywords=None):
+        """Salva a análise em um arquivo markdown.
+
+        `results` pode ser um dicionário ou um iterável de pares (app_name, analysis),
+        que é escrito conforme é consumido. `distinctive_keywords` (app_name -> pares
+        (termo, peso) do TF-IDF) acrescenta as palavras que distinguem cada app do corpus.
+        """
+        self.save_reports(results, distinctive_keywords=distinctive_keywords)
+
+    def save_reports(self, results, distinctive_keywords=None, jsonl_path=None, table_path=None):
+        """Salva a análise em markdown (`report_path`) e, se pedidos, em JSON Lines e tabela (CSV ou Parquet).
+
+        Todos os formatos são escritos numa única passada sobre `results`.
+        """
+        stage = self.instrumentation.stage
+        items = results.items() if isinstance(results, dict) else results
+        with ReportWriter(self.report_path, jsonl_path=jsonl_path, table_path=table_path) as writer:
+            for app_name, analysis in items:
+                distinctive = distinctive_keywords.get(app_name) if distinctive_keywords else None
+                with stage('report'):
+                    writer.write(app_name, analysis, distinctive)
+        self.instrumentation.count('reports_written', writer.count)
+        logger.info(f"Relatório salvo com {writer.count} apps")
+
+# Analisadores do processo worker, um por locale, e as opções com que são criados (veja _init_worker)
+_worker_analyzers = {}
+_worker_options = {}
+
+def _init_worker(tokenizer, full_density=False, locale=DEFAULT_LOCALE, stemming=False, instrumented=False):
+    """Inicializa o analisador do worker, carregando NLTK e stopwords uma única vez por processo.
+
+    Com `instrumented`, os analisadores do worker medem as etapas numa Instrumentation própria,
+    recolhida ao fim de cada bloco por `_take_worker_metrics`.
+    """
+    _worker_options.update(tokenizer=tokenizer, full_density=full_density, stemming=stemming,
+                           instrumentation=Instrumentation() if instrumented else None)
+    _worker_analyzers.clear()
+    _worker_analyzer(locale).stop_words  # Carrega as stopwords antes da primeira análise
+
+def _worker_analyzer(locale):
+    """Analisador do locale no processo worker, criado no primeiro app desse locale."""
+    analyzer = _worker_analyzers.get(locale)
+    if analyzer is None:
+        analyzer = _worker_analyzers[locale] = ASOKeywordAnalyzer(locale=locale, **_worker_options)
+    return analyzer
+
+def _take_worker_metrics():
+    """Métricas medidas no worker desde o último bloco, enviadas ao processo principal."""
+    return _worker_options['instrumentation'].take()
+
+def _analyze_item(item):
+    """Analisa um item (app_name, data, descrição tokenizada ou None, locale) no processo worker."""
+    app_name, data, document, locale = item
+    return app_name, _worker_analyzer(locale).analyze_app(app_name, data, description_doc=document)
+
+def main(workers=1, chunksize=DEFAULT_CHUNKSIZE, tokenizer=DEFAULT_TOKENIZER, use_cache=True, clear_cache=False,
+         keyword_index_path=None, ngrams_report_path=None, jsonl_path=None, table_path=None, full_density=False,
+         near_duplicate_threshold=None, locale=None, stemming=False, metrics_path=None, distinctive=False):
+    """Função principal que coordena o processo de análise dos aplicativos.
+
+    Com `workers` diferente de 1 a análise é distribuída num pool de processos
+    (`None` usa todos os núcleos disponíveis). Com `use_cache`, apps que não mudaram
+    desde a última execução são lidos do cache; `clear_cache` invalida o cache antes.
+    Com `keyword_index_path`, o índice invertido de palavras-chave também é salvo nesse arquivo,
+    e com `ngrams_report_path`, as colocações do corpus e de cada loja. `jsonl_path` e
+    `table_path` (CSV, ou Parquet se terminar em .parquet) geram o relatório também nesses formatos.
+    Com `full_density`, a densidade de todas as palavras é guardada, e não só a compacta.
+    Com `near_duplicate_threshold` (e o cache ativo), apps cuja descrição é quase uma cópia
+    (similaridade de Jaccard acima do limiar) de outra já analisada reaproveitam essa análise.
+    Com `locale`, todos os apps usam esse perfil de idioma; sem ele, o locale de cada app vem
+    dos metadados `lang`/`country` e os apps são analisados em lotes por locale.
+    Com `stemming`, o relatório traz também a densidade por radical.
+    Com `distinctive`, o relatório traz as palavras distintivas (TF-IDF) de cada app no corpus; o índice
+    fica salvo em `corpus_index_path` e só as descrições que mudaram são tokenizadas de novo.
+    Com `metrics_path`, o tempo de cada etapa e os contadores da execução são salvos nesse arquivo
+    (JSON, ou formato do Prometheus se terminar em .prom), incluindo as etapas executadas nos workers.
+    """
     logger.info("Iniciando programa principal")
+    instrumentation = Instrumentation() if metrics_path else None
     try:
-        analyzer = ASOKeywordAnalyzer()  # Inicializa o analisador
-        app_data = analyzer.load_data()  # Carrega dados dos aplicativos
-
-        # Analisar dados dos apps
-        results = {app_name: analyzer.analyze_app(app_name, data)
-                   for app_name, data in app_data.items()}
-
-        # Salvar os resultados no arquivo markdown
-        analyzer.save_analysis_to_markdown(results)
+        # Inicializa o analisador
+        analyzer = ASOKeywordAnalyzer(tokenizer=tokenizer, full_density=full_density, locale=locale or DEFAULT_LOCALE,
+                                      stemming=stemming, instrumentation=instrumentation)
+        app_data = analyzer.iter_data()  # Lê os dados dos aplicativos sob demanda
+
+        # Palavras que distinguem cada app dos concorrentes, calculadas sobre o corpus inteiro
+        distinctive_keywords = None
+        if distinctive:
+            corpus_index = analyzer.update_corpus_index(analyzer.iter_data(), reset=clear_cache)
+            distinctive_keywords = corpus_index.distinctive_lookup()
+
+        cache = AnalysisCache(analyzer.cache_path) if use_cache else None
+        try:
+            if cache is not None and clear_cache:
+                logger.info("Limpando o cache de análises")
+                cache.clear()
+
+            near_duplicates = None
+            if cache is not None and near_duplicate_threshold is not None:
+                near_duplicates = analyzer.load_near_duplicates(near_duplicate_threshold, reset=clear_cache)
+
+            # Analisar dados dos apps (a ordem de entrada é mantida também no modo paralelo)
+            analyze = analyzer.analyze_apps if locale else analyzer.analyze_by_locale
+            results = analyze(app_data, workers=workers, chunksize=chunksize, cache=cache,
+                              near_duplicates=near_duplicates)
+
+            # Salvar os resultados à medida que as análises ficam prontas
+            analyzer.save_reports(results, distinctive_keywords=distinctive_keywords,
+                                  jsonl_path=jsonl_path, table_path=table_path)
+            if near_duplicates is not None:
+                near_duplicates.save(analyzer.near_duplicates_path)
+            if stemming:
+                logger.info(f"Memo de radicais: taxa de acerto {analyzer.profile.stemmer.hit_rate:.1%}")
+        finally:
+            if cache is not None:
+                cache.close()
+                analyzer.instrumentation.count('cache_hits', cache.hits)
+                analyzer.instrumentation.count('cache_misses', cache.misses)
+                logger.info(
+                    f"Cache de análises: {cache.hits} acertos, {cache.misses} falhas "
+                    f"(taxa de acerto {cache.hit_rate:.1%})"
+                )
+
+        if keyword_index_path:
+            analyzer.build_keyword_index(analyzer.iter_data()).save(keyword_index_path)
+            logger.info(f"Índice invertido salvo em: {keyword_index_path}")
+        if ngrams_report_path:
+            analyzer.save_ngrams_to_markdown(analyzer.build_ngram_counter(analyzer.iter_data()), ngrams_report_path)
+            logger.info(f"Relatório de n-gramas salvo em: {ngrams_report_path}")
+        if instrumentation is not None:
+            instrumentation.write(metrics_path)
+            logger.info(f"Métricas da execução salvas em: {metrics_path}")
         logger.info("Programa concluído com sucesso")
     except Exception as e:
         logger.error(f"Erro durante a execução: {str(e)}")
         raise
 
+def parse_args(argv=None):
+    """Lê as opções de linha de comando da análise."""
+    parser = argparse.ArgumentParser(description="Análise de palavras-chave e densidade para ASO")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Número de processos para a análise (0 usa todos os núcleos)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Quantidade de apps enviada a cada processo por vez")
+    parser.add_argument("--tokenizer", choices=sorted(TOKENIZERS), default=DEFAULT_TOKENIZER,
+                        help="Backend de tokenização")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="Analisa todos os apps sem consultar nem atualizar o cache")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Invalida o cache de análises antes da execução")
+    parser.add_argument("--keyword-index", dest="keyword_index_path",
+                        help="Arquivo em que o índice invertido de palavras-chave será salvo")
+    parser.add_argument("--ngrams-report", dest="ngrams_report_path",
+                        help="Arquivo markdown com bigramas e trigramas do corpus e de cada loja")
+    parser.add_argument("--jsonl", dest="jsonl_path",
+                        help="Arquivo JSON Lines com a análise completa de cada app")
+    parser.add_argument("--table", dest="table_path",
+                        help="Arquivo tabular com uma linha por app (CSV, ou Parquet se terminar em .parquet)")
+    parser.add_argument("--full-density", action="store_true",
+                        help="Guarda a densidade de todas as palavras em vez do resultado compacto (top 10)")
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=None,
+                        help="Perfil de idioma de todos os apps (padrão: detectado pelos campos lang/country de cada app)")
+    parser.add_argument("--stemming", action="store_true",
+                        help="Calcula também a densidade por radical (RSLP em português)")
+    parser.add_argument("--metrics", dest="metrics_path",
+                        help="Arquivo com o tempo de cada etapa e contadores (JSON, ou Prometheus se terminar em .prom)")
+    parser.add_argument("--distinctive", action="store_true",
+                        help="Inclui as palavras distintivas (TF-IDF) de cada app em relação ao corpus")
+    parser.add_argument("--near-duplicates", dest="near_duplicate_threshold", type=float, nargs="?",
+                        const=NEAR_DUPLICATE_THRESHOLD, default=None,
+                        help="Reaproveita a análise de descrições quase duplicadas (similaridade mínima, "
+                             f"padrão {NEAR_DUPLICATE_THRESHOLD}); requer o cache")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    configure_logging()
+    main(workers=args.workers or None, chunksize=args.chunksize, tokenizer=args.tokenizer,
+         use_cache=args.use_cache, clear_cache=args.clear_cache, keyword_index_path=args.keyword_index_path,
+         ngrams_report_path=args.ngrams_report_path, jsonl_path=args.jsonl_path, table_path=args.table_path,
+         full_density=args.full_density, near_duplicate_threshold=args.near_duplicate_threshold,
+         locale=args.locale, stemming=args.stemming, metrics_path=args.metrics_path,
+         distinctive=args.distinctive)
@@ -1,53 +1,168 @@
-from rake_nltk import Rake
-import openai
-from text_processing.loader import apps_data
-from dotenv import load_dotenv
+import argparse
 import os
-import nltk
-from nltk.corpus import stopwords
+from functools import lru_cache
+from text_processing.loader import file_path, iter_apps
+from text_processing.nltk_resources import ensure_nltk_data, get_stopwords
+from text_processing.parallel import DEFAULT_CHUNKSIZE, imap_ordered
 
-# Carregar variáveis do arquivo .env
-load_dotenv()
 
-# Recuperar a chave da API do OpenAI do arquivo .env
-openai_api_key = os.getenv('OPENAI_API_KEY')
+@lru_cache(maxsize=None)
+def get_openai_api_key():
+    """Lê a chave da API do OpenAI do arquivo .env, apenas quando ela for necessária."""
+    from dotenv import load_dotenv
 
-# Baixar stop words do NLTK (se ainda não estiverem baixadas)
-nltk.download('stopwords')
+    # Carregar variáveis do arquivo .env
+    load_dotenv()
+    return os.getenv('OPENAI_API_KEY')
 
-# Obter stop words em português
-stop_words = set(stopwords.words('portuguese'))
+
+class RakeBatchExtractor:
+    """Extrai frases-chave com pontuação RAKE de várias descrições, reaproveitando uma única instância do Rake.
+
+    O Rake (com as stopwords do idioma) é configurado no primeiro uso e reutilizado em todas
+    as descrições. `extract_many` processa um iterável de descrições sob demanda, em série ou
+    num pool de processos, com um Rake por processo.
+    """
+
+    def __init__(self, language='portuguese', min_length=1, max_length=100000):
+        self.language = language
+        self.min_length = min_length
+        self.max_length = max_length
+        self._rake = None
+
+    @property
+    def stop_words(self):
+        """Stopwords do idioma, carregadas no primeiro uso."""
+        return get_stopwords(self.language)
+
+    @property
+    def rake(self):
+        """Instância do Rake, criada uma única vez."""
+        if self._rake is None:
+            from rake_nltk import Rake
+
+            ensure_nltk_data('tokenizers/punkt_tab')
+            self._rake = Rake(stopwords=set(self.stop_words), language=self.language,
+                              min_length=self.min_length, max_length=self.max_length)
+        return self._rake
+
+    def extract(self, text):
+        """Retorna as frases-chave da descrição como pares (frase, pontuação), da mais relevante à menos."""
+        rake = self.rake
+        rake.extract_keywords_from_text(text)
+        return [(phrase, score) for score, phrase in rake.get_ranked_phrases_with_scores()]
+
+    def extract_many(self, texts, workers=1, chunksize=DEFAULT_CHUNKSIZE):
+        """Gera, na ordem de entrada, as frases pontuadas de cada descrição do iterável.
+
+        Com `workers` diferente de 1 as descrições são processadas num pool de processos
+        (`None` usa todos os núcleos disponíveis).
+        """
+        if workers == 1:
+            for text in texts:
+                yield self.extract(text)
+            return
+
+        yield from imap_ordered(_extract_text, texts, workers=workers, chunksize=chunksize,
+                                initializer=_init_worker,
+                                initargs=(self.language, self.min_length, self.max_length))
+
+    def extract_apps(self, app_items, workers=1, chunksize=DEFAULT_CHUNKSIZE):
+        """Gera pares (app_name, frases pontuadas) para pares (app_name, data), na ordem de entrada."""
+        if workers == 1:
+            for app_name, data in app_items:
+                yield app_name, self.extract(data['descrição'])
+            return
+
+        yield from imap_ordered(_extract_item, app_items, workers=workers, chunksize=chunksize,
+                                initializer=_init_worker,
+                                initargs=(self.language, self.min_length, self.max_length))
+
+    def to_keyword_analysis(self, scored_phrases, max_keywords=None):
+        """Converte frases pontuadas no formato de `ASOKeywordAnalyzer.extract_keywords`.
+
+        `keywords` traz as palavras (sem stopwords e com mais de 3 letras) na ordem das frases
+        mais bem pontuadas, e `bigrams` as frases de exatamente duas palavras.
+        """
+        stop_words = self.stop_words
+        keywords = {}
+        bigrams = []
+        for phrase, _ in scored_phrases:
+            words = phrase.split()
+            for word in words:
+                if word not in stop_words and len(word) > 3:
+                    keywords.setdefault(word, None)
+            if len(words) == 2:
+                bigrams.append(phrase)
+        keywords = list(keywords)
+        return {
+            'keywords': keywords[:max_keywords] if max_keywords is not None else keywords,
+            'bigrams': list(dict.fromkeys(bigrams)),
+        }
+
+
+# Extrator do processo worker, criado uma única vez por _init_worker
+_worker_extractor = None
+
+def _init_worker(language, min_length, max_length):
+    """Inicializa o extrator do worker, carregando stopwords e Rake uma única vez por processo."""
+    global _worker_extractor
+    _worker_extractor = RakeBatchExtractor(language, min_length, max_length)
+    _worker_extractor.rake  # Configura o Rake antes da primeira descrição
+
+def _extract_text(text):
+    """Extrai as frases pontuadas de uma descrição no processo worker."""
+    return _worker_extractor.extract(text)
+
+def _extract_item(item):
+    """Extrai as frases pontuadas de um par (app_name, data) no processo worker."""
+    app_name, data = item
+    return app_name, _worker_extractor.extract(data['descrição'])
+
+@lru_cache(maxsize=None)
+def _default_extractor():
+    """Extrator compartilhado por `extrair_palavras_chave_rake`."""
+    return RakeBatchExtractor()
 
 # Função para extrair palavras-chave usando RAKE
 def extrair_palavras_chave_rake(descricao):
-    r = Rake(language='portuguese')  # Configura o Rake para português
-    r.extract_keywords_from_text(descricao)
-    
-    # Obter as palavras-chave ordenadas por relevância
-    palavras_chave = r.get_ranked_phrases()
-    
+    # Reaproveita o mesmo Rake configurado em todas as chamadas
+    extractor = _default_extractor()
+    stop_words = extractor.stop_words
+
     # Filtrar palavras-chave para remover duplicatas e stop words
     palavras_chave_filtradas = set()
-    
-    for frase in palavras_chave:
+
+    for frase, _ in extractor.extract(descricao):
         # Dividir a frase em palavras
         palavras = frase.split()
         # Adicionar palavras que não estão na lista de stop words
         for palavra in palavras:
             if palavra.lower() not in stop_words:
                 palavras_chave_filtradas.add(palavra.lower())
-    
+
     return list(palavras_chave_filtradas)
 
-# Processar as descrições de cada aplicativo e extrair palavras-chave
-for app, data in apps_data.items():
-    descricao = data['descrição']
-    
-    print(f"App: {app}")
-    
-    # Extrair palavras-chave usando RAKE
-    palavras_chave = extrair_palavras_chave_rake(descricao)
-    
-    print("Palavras-chave filtradas:")
-    print(palavras_chave)
-    print()
+def main(path=file_path, workers=1, chunksize=DEFAULT_CHUNKSIZE, top=10):
+    """Processa as descrições de cada aplicativo e imprime as frases-chave mais bem pontuadas."""
+    extractor = RakeBatchExtractor()
+    for app, frases in extractor.extract_apps(iter_apps(path), workers=workers, chunksize=chunksize):
+        print(f"App: {app}")
+        print("Frases-chave (pontuação RAKE):")
+        for frase, pontuacao in frases[:top]:
+            print(f"- {frase}: {pontuacao:.2f}")
+        print()
+
+def parse_args(argv=None):
+    """Lê as opções de linha de comando da extração."""
+    parser = argparse.ArgumentParser(description="Extração de frases-chave com RAKE")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Número de processos para a extração (0 usa todos os núcleos)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Quantidade de descrições enviada a cada processo por vez")
+    parser.add_argument("--top", type=int, default=10, help="Quantidade de frases exibidas por app")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(workers=args.workers or None, chunksize=args.chunksize, top=args.top)
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+# Quantidade máxima de análises mantidas no cache
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Fração de `max_entries` mantida quando o limite é ultrapassado (evita remoções a cada inserção)
+EVICTION_RATIO = 0.9
+
+# Quantidade de operações acumuladas antes de gravar a transação no disco
+COMMIT_EVERY = 1000
+
+
+class AnalysisCache:
+    """Cache em disco (SQLite) de análises por app, indexado por um hash do conteúdo.
+
+    A chave combina título, descrição, loja e versão do analisador, então qualquer mudança
+    no app ou na análise gera uma chave nova. Quando o cache passa de `max_entries`, as
+    entradas usadas há mais tempo são removidas.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses ("
+            " key TEXT PRIMARY KEY,"
+            " analysis TEXT NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS analyses_last_used ON analyses (last_used)")
+        self._size = self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    @staticmethod
+    def make_key(data, version):
+        """Gera a chave do app a partir de título, descrição, loja e versão do analisador."""
+        content = json.dumps(
+            [data.get("titulo"), data.get("descrição"), data.get("store", "google"), version],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def get(self, key, record=True):
+        """Retorna a análise guardada para a chave, ou None se ela não estiver no cache.
+
+        Com `record=False` a consulta não entra nas estatísticas de acertos e falhas.
+        """
+        row = self._conn.execute("SELECT analysis FROM analyses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += record
+            return None
+        self.hits += record
+        self._conn.execute("UPDATE analyses SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._maybe_commit()
+        return json.loads(row[0])
+
+    def put(self, key, analysis):
+        """Guarda a análise da chave, removendo as entradas mais antigas se o limite for atingido."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO analyses (key, analysis, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(analysis, ensure_ascii=False), time.time()),
+        )
+        # Substituições contam como inserções; a contagem exata é refeita na remoção
+        self._size += 1
+        if self._size > self.max_entries:
+            self.evict(int(self.max_entries * EVICTION_RATIO))
+        self._maybe_commit()
+
+    def evict(self, keep):
+        """Mantém apenas as `keep` entradas usadas mais recentemente."""
+        self._conn.execute(
+            "DELETE FROM analyses WHERE key NOT IN"
+            " (SELECT key FROM analyses ORDER BY last_used DESC LIMIT ?)",
+            (keep,),
+        )
+        self._size = self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def clear(self):
+        """Invalida o cache inteiro."""
+        self._conn.execute("DELETE FROM analyses")
+        self._conn.commit()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def hit_rate(self):
+        """Fração das consultas respondidas pelo cache (0.0 se nenhuma consulta foi feita)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _maybe_commit(self):
+        self._pending += 1
+        if self._pending >= COMMIT_EVERY:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self):
+        """Grava as operações pendentes e fecha a conexão."""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Analisa vários catálogos de apps (ex.: snapshots do stores.json) de uma vez, um relatório por arquivo.
+
+    python -m text_processing.cli "snapshots/*.json" "coletas/**/*.jsonl" -o relatorios/ --workers 4
+
+Cada entrada gera `<saída>/<nome do arquivo>.md` (e os demais formatos pedidos em `--formats`).
+Entradas cujas saídas são mais novas que o arquivo de entrada são puladas, a menos que se use `--force`.
+"""
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+
+from text_processing.AppDescriptionOptimizer import LOG_PATH, ASOKeywordAnalyzer, configure_logging
+from text_processing.cache import AnalysisCache
+from text_processing.loader import iter_apps
+from text_processing.locales import DEFAULT_LOCALE, LOCALES
+from text_processing.parallel import DEFAULT_CHUNKSIZE, DEFAULT_QUEUE_SIZE, consume_in_thread, prefetch
+from text_processing.report_writer import ReportWriter
+from text_processing.tokenizers import DEFAULT_TOKENIZER, TOKENIZERS
+
+# Formatos de saída: extensão do arquivo e argumento correspondente do ReportWriter
+OUTPUT_FORMATS = {
+    'md': ('.md', 'markdown_path'),
+    'jsonl': ('.jsonl', 'jsonl_path'),
+    'csv': ('.csv', 'table_path'),
+    'parquet': ('.parquet', 'table_path'),
+}
+
+DEFAULT_FORMATS = ('md',)
+
+logger = logging.getLogger(__name__)
+
+
+def expand_inputs(patterns):
+    """Arquivos de entrada dos padrões glob (aceita `**`), sem repetições e na ordem dos padrões.
+
+    Padrões que não encontram nenhum arquivo geram um aviso no log.
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        if not matches:
+            logger.warning(f"Nenhum arquivo encontrado para: {pattern}")
+        for path in matches:
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def output_paths(input_path, output_dir, formats=DEFAULT_FORMATS):
+    """Caminhos de saída de uma entrada, por formato: `<output_dir>/<nome sem extensão><extensão do formato>`."""
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return {fmt: os.path.join(output_dir, stem + OUTPUT_FORMATS[fmt][0]) for fmt in formats}
+
+
+def is_up_to_date(input_path, outputs):
+    """Indica se todas as saídas existem e foram geradas depois da última modificação da entrada."""
+    try:
+        output_mtime = min(os.path.getmtime(path) for path in outputs.values())
+    except OSError:
+        return False
+    return output_mtime >= os.path.getmtime(input_path)
+
+
+def _temporary_path(path):
+    """Caminho temporário com a mesma extensão, para que o formato da tabela continue sendo reconhecido."""
+    root, extension = os.path.splitext(path)
+    return f"{root}.tmp{extension}"
+
+
+def write_reports(results, outputs, distinctive_keywords=None):
+    """Escreve os pares (app_name, analysis) nos formatos de `outputs`, retornando a quantidade de apps.
+
+    Os arquivos são escritos em temporários e só substituem as saídas no fim, então uma execução
+    interrompida nunca deixa uma saída parcial que pareça atualizada.
+    """
+    temporary = {fmt: _temporary_path(path) for fmt, path in outputs.items()}
+    writer = ReportWriter(**{OUTPUT_FORMATS[fmt][1]: path for fmt, path in temporary.items()})
+    try:
+        with writer:
+            count = writer.write_all(results, distinctive_keywords)
+    except BaseException:
+        for path in temporary.values():
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    for fmt, path in temporary.items():
+        os.replace(path, outputs[fmt])
+    return count
+
+
+def analyze_file(analyzer, input_path, outputs, workers=1, chunksize=DEFAULT_CHUNKSIZE, cache=None,
+                 distinctive=False, by_locale=True, queue_size=DEFAULT_QUEUE_SIZE):
+    """Analisa um catálogo num pipeline limitado, retornando a quantidade de apps escritos.
+
+    A leitura do arquivo roda numa thread, a análise na thread atual (ou em `workers` processos)
+    e a escrita em outra thread, com no máximo `queue_size` apps em trânsito entre as etapas.
+    Com `distinctive`, o arquivo é lido uma vez a mais para calcular as palavras distintivas (TF-IDF).
+    Com `by_locale`, cada app usa o perfil do seu locale (veja `ASOKeywordAnalyzer.analyze_by_locale`).
+    """
+    distinctive_keywords = None
+    if distinctive:
+        distinctive_keywords = analyzer.build_corpus_index(iter_apps(input_path)).distinctive_lookup()
+
+    apps = prefetch(iter_apps(input_path), queue_size)
+    analyze = analyzer.analyze_by_locale if by_locale else analyzer.analyze_apps
+    results = analyze(apps, workers=workers, chunksize=chunksize, cache=cache)
+    return consume_in_thread(lambda items: write_reports(items, outputs, distinctive_keywords), results, queue_size)
+
+
+def run(patterns, output_dir, formats=DEFAULT_FORMATS, workers=1, chunksize=DEFAULT_CHUNKSIZE, force=False,
+        cache_path=None, distinctive=False, tokenizer=DEFAULT_TOKENIZER, locale=None, full_density=False,
+        stemming=False):
+    """Analisa cada arquivo dos padrões `patterns`, salvando os relatórios em `output_dir`.
+
+    Retorna um dicionário com as entradas analisadas, as puladas (saídas já atualizadas) e as que
+    falharam (arquivo ilegível ou JSON inválido), que não interrompem as demais.
+    Sem `locale`, o locale de cada app vem dos metadados `lang`/`country`, como no `main()`.
+    """
+    if 'csv' in formats and 'parquet' in formats:
+        raise ValueError("Escolha apenas um formato de tabela (csv ou parquet)")
+    inputs = expand_inputs(patterns)
+    planned = [(path, output_paths(path, output_dir, formats)) for path in inputs]
+
+    # Duas entradas com o mesmo nome em pastas diferentes escreveriam nas mesmas saídas
+    stems = {}
+    for path, _ in planned:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if stem in stems:
+            raise ValueError(f"As entradas {stems[stem]} e {path} gerariam as mesmas saídas")
+        stems[stem] = path
+
+    analyzer = ASOKeywordAnalyzer(tokenizer=tokenizer, full_density=full_density, locale=locale or DEFAULT_LOCALE,
+                                  stemming=stemming)
+    summary = {'analyzed': [], 'skipped': [], 'failed': []}
+    cache = AnalysisCache(cache_path) if cache_path else None
+    try:
+        for path, outputs in planned:
+            if not force and is_up_to_date(path, outputs):
+                logger.info(f"{path}: saídas atualizadas, pulando")
+                summary['skipped'].append(path)
+                continue
+            start = time.perf_counter()
+            try:
+                count = analyze_file(analyzer, path, outputs, workers=workers, chunksize=chunksize, cache=cache,
+                                     distinctive=distinctive, by_locale=locale is None)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Um registro malformado (sem descrição, campo de tipo inesperado) derruba só esta entrada
+                logger.error(f"{path}: erro na análise: {e}")
+                summary['failed'].append(path)
+                continue
+            logger.info(f"{path}: {count} apps analisados em {time.perf_counter() - start:.1f}s")
+            summary['analyzed'].append(path)
+    finally:
+        if cache is not None:
+            cache.close()
+    return summary
+
+
+def parse_args(argv=None):
+    """Lê as opções de linha de comando da análise em lote."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs='+', help="Arquivos ou padrões glob de catálogos (.json, .jsonl ou .ndjson)")
+    parser.add_argument("-o", "--output-dir", required=True, help="Pasta em que os relatórios serão salvos")
+    parser.add_argument("--formats", nargs='+', choices=sorted(OUTPUT_FORMATS), default=list(DEFAULT_FORMATS),
+                        help="Formatos de saída de cada entrada (padrão: md)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Número de processos para a análise (0 usa todos os núcleos)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Quantidade de apps enviada a cada processo por vez")
+    parser.add_argument("--force", action="store_true", help="Analisa também as entradas com saídas atualizadas")
+    parser.add_argument("--cache", dest="cache_path",
+                        help="Cache de análises (SQLite) compartilhado entre as entradas")
+    parser.add_argument("--distinctive", action="store_true",
+                        help="Inclui as palavras distintivas (TF-IDF) de cada app em relação ao seu catálogo")
+    parser.add_argument("--tokenizer", choices=sorted(TOKENIZERS), default=DEFAULT_TOKENIZER,
+                        help="Backend de tokenização")
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=None,
+                        help="Perfil de idioma de todos os apps (padrão: detectado pelos campos lang/country de cada app)")
+    parser.add_argument("--full-density", action="store_true",
+                        help="Guarda a densidade de todas as palavras em vez do resultado compacto (top 10)")
+    parser.add_argument("--stemming", action="store_true", help="Calcula também a densidade por radical")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging()
+    try:
+        summary = run(args.inputs, args.output_dir, formats=args.formats, workers=args.workers or None,
+                      chunksize=args.chunksize, force=args.force, cache_path=args.cache_path,
+                      distinctive=args.distinctive, tokenizer=args.tokenizer, locale=args.locale,
+                      full_density=args.full_density, stemming=args.stemming)
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+    print(f"{len(summary['analyzed'])} entradas analisadas, {len(summary['skipped'])} puladas, "
+          f"{len(summary['failed'])} com erro (relatórios em {args.output_dir})")
+    for path in summary['failed']:
+        print(f"- erro ao analisar {path} (detalhes em {LOG_PATH})", file=sys.stderr)
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+from collections import Counter
+
+from text_processing.tokenizers import DEFAULT_TOKENIZER, get_tokenizer
+
+# Campos do changeslog que guardam a descrição do app
+DESCRIPTION_FIELDS = ('description',)
+
+
+def _common_prefix_length(a, b):
+    """Tamanho do maior prefixo comum entre duas strings (busca binária com comparações de fatias)."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(a, b, limit):
+    """Tamanho do maior sufixo comum, sem passar de `limit` caracteres."""
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:len(a) - low] == b[len(b) - middle:len(b) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def text_diff(old, new):
+    """Menor trecho alterado entre dois textos, como (início, fim, substituto) em relação a `old`."""
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
+
+
+class DensityState:
+    """Contagem das palavras de uma descrição, atualizada a cada edição sem retokenizar o texto inteiro.
+
+    Guarda o texto em minúsculas, a frequência de cada palavra alfanumérica e o total de palavras,
+    os mesmos números que `ASOKeywordAnalyzer.analyze_word_density` calcula. Numa edição, só o
+    trecho alterado é tokenizado de novo, junto com o trecho entre espaços anterior (cujos tokens
+    dependem do seguinte) e o posterior (que aparece igual nas duas versões e se cancela). Com
+    tokenizadores que dependem do texto inteiro (`chunk_local` falso, como o do NLTK), cada
+    edição recalcula tudo.
+    """
+
+    __slots__ = ('tokenizer', 'text', 'counts', 'total')
+
+    def __init__(self, text='', tokenizer=DEFAULT_TOKENIZER):
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.reset(text)
+
+    def reset(self, text):
+        """Recalcula as contagens a partir do texto inteiro."""
+        self.text = text.lower()
+        self.counts = Counter(self._words(self.text))
+        self.total = sum(self.counts.values())
+        return self
+
+    def _words(self, text):
+        return [token for token in self.tokenizer.tokenize(text) if token.isalnum()]
+
+    def update(self, new_text):
+        """Atualiza as contagens para a nova versão da descrição, retokenizando só o trecho editado."""
+        new_text = new_text.lower()
+        if new_text == self.text:
+            return self
+        if not self.tokenizer.chunk_local:
+            return self.reset(new_text)
+        return self.replace(*text_diff(self.text, new_text))
+
+    def replace(self, start, end, replacement):
+        """Substitui `text[start:end]` por `replacement`, atualizando contagens e total."""
+        text = self.text
+        replacement = replacement.lower()
+        new_text = text[:start] + replacement + text[end:]
+        if not self.tokenizer.chunk_local:
+            return self.reset(new_text)
+
+        # Janela: trecho anterior à edição, trechos editados e o trecho seguinte
+        window_start = _chunk_start(text, start)
+        window_end = _chunk_end(text, end)
+        shift = len(replacement) - (end - start)
+
+        removed = self._words(text[window_start:window_end])
+        added = self._words(new_text[window_start:window_end + shift])
+        counts = self.counts
+        counts.update(added)
+        counts.subtract(removed)
+        for word in set(removed):
+            if counts[word] <= 0:
+                del counts[word]
+        self.total += len(added) - len(removed)
+        self.text = new_text
+        return self
+
+
+def _chunk_start(text, position):
+    """Início do trecho entre espaços anterior a `position` (pulando o trecho em que ela está)."""
+    while position > 0 and not text[position - 1].isspace():
+        position -= 1
+    while position > 0 and text[position - 1].isspace():
+        position -= 1
+    while position > 0 and not text[position - 1].isspace():
+        position -= 1
+    return position
+
+
+def _chunk_end(text, position):
+    """Fim do trecho entre espaços seguinte a `position` (pulando o trecho em que ela está)."""
+    length = len(text)
+    while position < length and not text[position].isspace():
+        position += 1
+    while position < length and text[position].isspace():
+        position += 1
+    while position < length and not text[position].isspace():
+        position += 1
+    return position
+
+
+def replay_description_changes(changes, analyzer=None, text=None):
+    """Reaplica as edições de descrição de um changeslog, gerando a densidade após cada uma.
+
+    `changes` são as mudanças coletadas pelo `rankmyapp_data_collector` (com `date`, `field`,
+    `previousValue` e `currentValue`), em ordem cronológica; as de outros campos são ignoradas.
+    Gera tuplas (data, densidade, recomendações), com a densidade no formato de
+    `analyze_word_density` (as contagens são as mesmas da análise completa; só a ordem entre
+    palavras empatadas pode diferir). Se o valor anterior de uma mudança não bater com o texto atual
+    (histórico incompleto), as contagens são refeitas a partir dele.
+    """
+    if analyzer is None:
+        from text_processing.AppDescriptionOptimizer import ASOKeywordAnalyzer
+        analyzer = ASOKeywordAnalyzer()
+
+    state = None if text is None else DensityState(text, analyzer.tokenizer)
+    for change in changes:
+        if change.get('field') not in DESCRIPTION_FIELDS:
+            continue
+        previous = change.get('previousValue') or ''
+        if state is None:
+            state = DensityState(previous, analyzer.tokenizer)
+        elif previous.lower() != state.text:
+            state.reset(previous)
+        state.update(change.get('currentValue') or '')
+
+        density = analyzer.density_from_counts(state.counts, state.total, full=analyzer.full_density)
+        yield change.get('date'), density, analyzer.density_recommendations(density)
@@ -0,0 +1,183 @@
+import json
+import os
+import re
+import time
+
+# Prefixo das métricas no formato do Prometheus
+METRIC_PREFIX = 'aso'
+
+
+class _Stage:
+    """Cronômetro de uma execução de etapa, usado com `with`."""
+
+    __slots__ = ('_owner', '_name', '_start')
+
+    def __init__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._owner.record(self._name, time.perf_counter() - self._start)
+
+
+class _NullStage:
+    """Cronômetro que não mede nada (instrumentação desligada)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Instrumentation:
+    """Cronômetros e contadores por etapa da análise, agregados em memória.
+
+    Cada etapa (tokenize, density, bigrams, recommendations, report...) acumula a quantidade
+    de execuções, o tempo total e o maior tempo de uma execução. Os tempos são inclusivos:
+    uma etapa que chama outra inclui o tempo dela. Ao final, `write` salva o resumo em JSON
+    ou no formato texto do Prometheus (arquivos `.prom`, para o textfile collector).
+    Nos processos workers, cada um mede as próprias etapas, e o que foi medido em cada bloco
+    de apps é somado ao processo principal com `take` e `merge`; o tempo de uma etapa passa a
+    ser a soma do tempo gasto nela em todos os processos.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        # etapa -> [execuções, segundos, maior execução]
+        self.stages = {}
+        self.counters = {}
+
+    def stage(self, name):
+        """Cronômetro da etapa `name`: `with instrumentation.stage('density'): ...`."""
+        return _Stage(self, name)
+
+    def record(self, name, seconds):
+        """Soma uma execução de `seconds` segundos à etapa `name`."""
+        stats = self.stages.get(name)
+        if stats is None:
+            self.stages[name] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+
+    def count(self, name, value=1):
+        """Incrementa o contador `name`."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def take(self):
+        """Etapas e contadores acumulados até aqui, em formato simples (para enviar entre processos), zerando-os."""
+        state = {'stages': self.stages, 'counters': self.counters}
+        self.stages = {}
+        self.counters = {}
+        return state
+
+    def merge(self, state):
+        """Soma etapas e contadores de outra instrumentação (veja `take`), como os de um processo worker."""
+        if not state:
+            return
+        for name, (calls, seconds, longest) in state['stages'].items():
+            stats = self.stages.get(name)
+            if stats is None:
+                self.stages[name] = [calls, seconds, longest]
+            else:
+                stats[0] += calls
+                stats[1] += seconds
+                if longest > stats[2]:
+                    stats[2] = longest
+        for name, value in state['counters'].items():
+            self.count(name, value)
+
+    def summary(self):
+        """Resumo das etapas (execuções, tempo total, médio e máximo) e dos contadores."""
+        return {
+            'stages': {
+                name: {
+                    'calls': calls,
+                    'seconds': seconds,
+                    'mean_ms': seconds / calls * 1000,
+                    'max_ms': longest * 1000,
+                }
+                for name, (calls, seconds, longest) in self.stages.items()
+            },
+            'counters': dict(self.counters),
+        }
+
+    def to_prometheus(self):
+        """Resumo no formato texto de exposição do Prometheus."""
+        lines = []
+
+        def metric(name, kind, description, samples):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{METRIC_PREFIX}_{name}{labels} {value}")
+
+        stages = sorted(self.stages.items())
+        if stages:
+            metric('stage_calls_total', 'counter', "Execuções de cada etapa da análise.",
+                   [(f'{{stage="{name}"}}', calls) for name, (calls, _, _) in stages])
+            metric('stage_seconds_total', 'counter', "Tempo total gasto em cada etapa da análise.",
+                   [(f'{{stage="{name}"}}', repr(seconds)) for name, (_, seconds, _) in stages])
+            metric('stage_seconds_max', 'gauge', "Maior tempo de uma execução de cada etapa.",
+                   [(f'{{stage="{name}"}}', repr(longest)) for name, (_, _, longest) in stages])
+        for name, value in sorted(self.counters.items()):
+            metric(f"{_metric_name(name)}_total", 'counter', f"Contador {name}.", [('', value)])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Salva o resumo em `path`: formato do Prometheus se terminar em `.prom`, JSON nos demais casos.
+
+        O arquivo é escrito num temporário e renomeado, para que coletores nunca leiam um arquivo pela metade.
+        """
+        if path.endswith('.prom'):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.summary(), ensure_ascii=False, indent=2) + '\n'
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.replace(temporary, path)
+        return path
+
+
+class NullInstrumentation:
+    """Instrumentação desligada (padrão): as chamadas não medem nem guardam nada."""
+
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def record(self, name, seconds):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+    def merge(self, state):
+        pass
+
+
+# Instância compartilhada usada quando a instrumentação não é pedida
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+def _metric_name(name):
+    """Converte um nome qualquer num nome de métrica válido do Prometheus."""
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
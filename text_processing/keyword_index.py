@@ -0,0 +1,147 @@
+import pickle
+from collections import namedtuple
+
+# Versão do formato salvo em disco; índices de versões diferentes precisam ser reconstruídos
+INDEX_FORMAT_VERSION = 1
+
+# Ocorrências de um termo num app: total de ocorrências, posições na descrição e se aparece no título.
+# Internamente as ocorrências são tuplas simples nessa mesma ordem, que são bem mais rápidas de salvar
+# e recarregar com pickle; as consultas devolvem Posting.
+Posting = namedtuple('Posting', ['count', 'positions', 'in_title'])
+
+
+class KeywordIndex:
+    """Índice invertido de palavras-chave e bigramas para os apps que os usam.
+
+    É montado uma única vez a partir da saída do ASOKeywordAnalyzer (`extract_keywords`) e
+    responde consultas de lacunas, sobreposição e ranking entre concorrentes com operações
+    de dicionário e conjunto, sem reanalisar nenhum texto.
+    """
+
+    def __init__(self):
+        # termo -> {app_name: (count, positions, in_title)}
+        self.postings = {}
+        # app_name -> conjunto de termos do app
+        self.terms_by_app = {}
+        self._frequency_order = None
+
+    def __len__(self):
+        return len(self.terms_by_app)
+
+    def __contains__(self, app_name):
+        return app_name in self.terms_by_app
+
+    def add(self, app_name, document, keyword_analysis, title_keywords=()):
+        """Indexa um app a partir do TokenDocument da descrição e do resultado de `extract_keywords`.
+
+        As posições de palavras são índices em `document.words`, e as de bigramas são índices
+        em `document.tokens`. `title_keywords` marca os termos que também aparecem no título.
+        """
+        if app_name in self.terms_by_app:
+            self.remove(app_name)
+
+        title_keywords = set(title_keywords)
+        keywords = set(keyword_analysis['keywords'])
+        bigrams = set(keyword_analysis['bigrams'])
+        positions = {term: [] for term in keywords | bigrams | title_keywords}
+
+        for position, word in enumerate(document.words):
+            if word in keywords:
+                positions[word].append(position)
+        if bigrams:
+            tokens = document.tokens
+            for position in range(len(tokens) - 1):
+                bigram = f"{tokens[position]} {tokens[position + 1]}"
+                if bigram in bigrams:
+                    positions[bigram].append(position)
+
+        for term, term_positions in positions.items():
+            in_title = term in title_keywords
+            self.postings.setdefault(term, {})[app_name] = (
+                len(term_positions) + in_title, tuple(term_positions), in_title
+            )
+        self.terms_by_app[app_name] = frozenset(positions)
+        self._frequency_order = None
+
+    def remove(self, app_name):
+        """Remove um app do índice."""
+        for term in self.terms_by_app.pop(app_name):
+            apps = self.postings[term]
+            del apps[app_name]
+            if not apps:
+                del self.postings[term]
+        self._frequency_order = None
+
+    def posting(self, term, app_name):
+        """Retorna as ocorrências do termo no app, ou None se o app não o usa."""
+        posting = self.postings.get(term, {}).get(app_name)
+        return Posting._make(posting) if posting is not None else None
+
+    def apps_using(self, term):
+        """Retorna o conjunto de apps que usam o termo (palavra ou bigrama)."""
+        return set(self.postings.get(term, ()))
+
+    def rank(self, term, limit=None):
+        """Quem se posiciona no termo: apps ordenados por presença no título e ocorrências.
+
+        Retorna uma lista de pares (app_name, Posting).
+        """
+        ranked = sorted(
+            self.postings.get(term, {}).items(),
+            key=lambda item: (-item[1][2], -item[1][0], item[0]),
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(app_name, Posting._make(posting)) for app_name, posting in ranked]
+
+    def overlap(self, app_name, other):
+        """Termos usados tanto por `app_name` quanto por `other`."""
+        return self.terms_by_app[app_name] & self.terms_by_app[other]
+
+    def gap(self, app_name, competitors=None, limit=None):
+        """Termos que concorrentes usam e `app_name` não, com os concorrentes que usam cada um.
+
+        Retorna uma lista de pares (termo, apps), começando pelos termos usados por mais
+        concorrentes. Sem `competitors`, todos os outros apps do índice são considerados, e a
+        busca percorre os termos já ordenados por frequência, parando ao atingir `limit`.
+        """
+        own_terms = self.terms_by_app[app_name]
+        if competitors is None:
+            missing = []
+            for term in self._terms_by_frequency():
+                if term not in own_terms:
+                    missing.append((term, list(self.postings[term])))
+                    if limit is not None and len(missing) >= limit:
+                        break
+            return missing
+
+        missing = {}
+        for competitor in competitors:
+            for term in self.terms_by_app[competitor] - own_terms:
+                missing.setdefault(term, []).append(competitor)
+        ranked = sorted(missing.items(), key=lambda item: (-len(item[1]), item[0]))
+        return ranked[:limit] if limit is not None else ranked
+
+    def _terms_by_frequency(self):
+        """Termos ordenados pelo número de apps que os usam (calculado uma vez a cada alteração)."""
+        if self._frequency_order is None:
+            self._frequency_order = sorted(self.postings, key=lambda term: (-len(self.postings[term]), term))
+        return self._frequency_order
+
+    def save(self, path):
+        """Salva o índice em disco (pickle) para ser recarregado sem reanalisar os apps."""
+        with open(path, 'wb') as file:
+            pickle.dump((INDEX_FORMAT_VERSION, self.postings, self.terms_by_app), file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Carrega um índice salvo com `save`."""
+        with open(path, 'rb') as file:
+            version, postings, terms_by_app = pickle.load(file)
+        if version != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Versão do índice incompatível: {version} (esperada {INDEX_FORMAT_VERSION})")
+        index = cls()
+        index.postings = postings
+        index.terms_by_app = terms_by_app
+        return index
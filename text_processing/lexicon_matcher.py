@@ -0,0 +1,104 @@
+import re
+from collections import namedtuple
+
+from text_processing.loader import file_path, iter_apps
+
+# Léxicos usados na auditoria das descrições (os mesmos do notebook de análise)
+DEFAULT_LEXICONS = {
+    'ctas': ["baixe agora", "aproveite", "descubra", "compre", "não perca"],
+    'promocoes': ["frete grátis", "oferta", "promoção", "desconto", "exclusivo"],
+    'locais': ["brasil", "frete", "oferta", "reais"],
+}
+
+# Ocorrência de um termo: léxico, termo e posição [start, end) no texto em minúsculas
+Match = namedtuple('Match', ['lexicon', 'term', 'start', 'end'])
+
+# Chave usada nos nós da trie para guardar os termos que terminam ali
+_TERMS = ''
+
+
+class LexiconMatcher:
+    """Busca termos de vários léxicos nomeados com uma única varredura de cada texto.
+
+    Todos os termos são reunidos numa trie, compilada numa única expressão regular com
+    lookahead. A cada posição do texto o motor de regex percorre a trie e devolve o termo
+    mais longo que começa ali; os demais termos que começam na mesma posição são prefixos
+    dele e saem da própria trie. O resultado é o mesmo de um autômato Aho-Corasick (todas as
+    ocorrências, inclusive sobrepostas, com posições), sem laço em Python por caractere.
+    A busca é feita no texto em minúsculas, como a verificação `termo in descricao` do notebook.
+    """
+
+    def __init__(self, lexicons=None):
+        self.lexicons = {name: list(dict.fromkeys(term.lower() for term in terms))
+                         for name, terms in (lexicons or DEFAULT_LEXICONS).items()}
+        self._trie = {}
+        for name, terms in self.lexicons.items():
+            for term in terms:
+                if not term:
+                    continue
+                node = self._trie
+                for char in term:
+                    node = node.setdefault(char, {})
+                node.setdefault(_TERMS, []).append((name, term))
+        pattern = _trie_pattern(self._trie)
+        self._regex = re.compile(f"(?=({pattern}))") if pattern else None
+
+    def finditer(self, text):
+        """Gera todas as ocorrências (Match) de termos dos léxicos no texto, ordenadas pela posição inicial."""
+        if self._regex is None:
+            return
+        text = text.lower()
+        trie = self._trie
+        for found in self._regex.finditer(text):
+            start = found.start()
+            node = trie
+            # Percorre a trie pelo termo mais longo, emitindo os termos que são prefixos dele
+            for offset, char in enumerate(found.group(1), start=1):
+                node = node[char]
+                for name, term in node.get(_TERMS, ()):
+                    yield Match(name, term, start, start + offset)
+
+    def scan(self, text):
+        """Agrupa as ocorrências do texto por léxico: {léxico: [Match, ...]}."""
+        matches = {name: [] for name in self.lexicons}
+        for match in self.finditer(text):
+            matches[match.lexicon].append(match)
+        return matches
+
+    def present(self, text):
+        """Termos de cada léxico presentes no texto, na ordem do léxico: {léxico: [termo, ...]}."""
+        found = {(match.lexicon, match.term) for match in self.finditer(text)}
+        return {name: [term for term in terms if (name, term) in found]
+                for name, terms in self.lexicons.items()}
+
+    def audit(self, app_items):
+        """Gera pares (app_name, termos presentes por léxico) para a descrição de cada app."""
+        for app_name, data in app_items:
+            yield app_name, self.present(data['descrição'])
+
+
+def _trie_pattern(node):
+    """Converte um nó da trie em expressão regular, preferindo sempre o caminho mais longo."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items() if char != _TERMS]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # Se um termo termina neste nó, o restante do caminho é opcional (e guloso)
+    if _TERMS in node:
+        return f"(?:{pattern})?"
+    return pattern
+
+
+def main(path=file_path):
+    """Audita CTAs, promoções e adaptações locais nas descrições de todos os apps."""
+    matcher = LexiconMatcher()
+    labels = {'ctas': "CTAs presentes", 'promocoes': "Promoções mencionadas", 'locais': "Adaptações culturais"}
+    for app, present in matcher.audit(iter_apps(path)):
+        print(f"App: {app}")
+        for name, terms in present.items():
+            print(f"{labels.get(name, name)}: {', '.join(terms) if terms else 'nenhuma'}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,143 @@ import os
 import json
 import logging
 
-# Configuração do log
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Tamanho dos blocos lidos do arquivo durante a leitura incremental
+CHUNK_SIZE = 64 * 1024
+
+# Extensões tratadas como JSON Lines (um objeto {"app_name": {...}} por linha)
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+
+_decoder = json.JSONDecoder()
+
+logger = logging.getLogger(__name__)
+
+
+class _IncrementalReader:
+    """Buffer de leitura que decodifica valores JSON conforme o arquivo é lido."""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self):
+        """Descarta o trecho já consumido e lê o próximo bloco do arquivo."""
+        pending = self.buffer[self.pos:]
+        # Valores maiores que o bloco são lidos com blocos cada vez maiores
+        if len(pending) >= self.chunk_size:
+            self.chunk_size *= 2
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+        self.buffer = pending + chunk
+        self.pos = 0
+
+    def peek(self):
+        """Retorna o próximo caractere que não seja espaço, ou '' no fim do arquivo."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._read_more()
+
+    def expect(self, char):
+        """Consome o caractere esperado ou falha com erro de decodificação."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Esperado '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode(self):
+        """Decodifica o próximo valor JSON, lendo mais blocos até que ele esteja completo."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._read_more()
+                continue
+            # Um número no fim do buffer pode estar truncado; confirma lendo mais
+            if end == len(self.buffer) and not self.eof:
+                self._read_more()
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json_object(file, chunk_size):
+    """Percorre o objeto JSON de nível superior, gerando (chave, valor) um de cada vez."""
+    reader = _IncrementalReader(file, chunk_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.decode()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Chave do objeto não é uma string", reader.buffer, reader.pos)
+        reader.expect(':')
+        yield key, reader.decode()
+        if reader.peek() == '}':
+            return
+        reader.expect(',')
+
+
+def _iter_json_lines(file):
+    """Percorre um arquivo JSON Lines em que cada linha é um objeto {"app_name": {...}}."""
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        if not isinstance(entry, dict):
+            raise json.JSONDecodeError(f"Linha {line_number} não é um objeto JSON", line, 0)
+        yield from entry.items()
+
+
+def iter_apps(path, chunk_size=CHUNK_SIZE):
+    """Gera pares (app_name, record) do arquivo de apps sem carregá-lo inteiro na memória.
+
+    Aceita o formato de `stores.json` (um único objeto com todos os apps) e a variante
+    JSON Lines (`.jsonl`/`.ndjson`), com um ou mais apps por linha.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith(JSON_LINES_EXTENSIONS):
+            yield from _iter_json_lines(f)
+        else:
+            yield from _iter_json_object(f, chunk_size)
+
 
 # Definir o caminho para o arquivo com base no diretório atual do script
 current_dir = os.path.dirname(os.path.abspath(__file__))  # Obtém o diretório do script
 file_path = os.path.join(current_dir, '..', 'data', 'stores.json')  # Caminho para o arquivo JSON
 
-# Verificar se o arquivo existe
-if os.path.exists(file_path):
-    logging.info(f"Arquivo encontrado: {file_path}")
-else:
-    logging.error(f"Arquivo não encontrado: {file_path}")
-
-# Carregar o arquivo JSON
-try:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        apps_data = json.load(f)
-        logging.info("Arquivo JSON carregado com sucesso.")
-except Exception as e:
-    logging.error(f"Erro ao carregar o arquivo JSON: {e}")
-else:
-    # Exibir os dados carregados
-    logging.info(f"Dados carregados: {apps_data}")
-    #print(apps_data)
 
+def _load_apps_data():
+    """Carrega todos os apps de `file_path` de uma vez (usado por `apps_data`)."""
+    # Verificar se o arquivo existe
+    if os.path.exists(file_path):
+        logger.info(f"Arquivo encontrado: {file_path}")
+    else:
+        logger.error(f"Arquivo não encontrado: {file_path}")
+
+    # Carregar o arquivo JSON
+    try:
+        apps_data = dict(iter_apps(file_path))
+        logger.info("Arquivo JSON carregado com sucesso.")
+    except Exception as e:
+        logger.error(f"Erro ao carregar o arquivo JSON: {e}")
+        raise
+    else:
+        # Registra só a quantidade de apps, e não o conteúdo inteiro do arquivo
+        logger.info(f"Dados carregados: {len(apps_data)} apps")
+    return apps_data
+
+
+def __getattr__(name):
+    """Carrega `apps_data` apenas no primeiro acesso, e não na importação do módulo."""
+    if name == 'apps_data':
+        globals()['apps_data'] = _load_apps_data()
+        return globals()['apps_data']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
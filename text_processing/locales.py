@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+from text_processing.nltk_resources import get_stopwords
+from text_processing.stemming import get_stemmer
+from text_processing.tokenizers import DEFAULT_TOKENIZER, TOKENIZERS, get_tokenizer
+
+# Locale usado quando o app não informa idioma nem país
+DEFAULT_LOCALE = 'pt-BR'
+
+# Quantidade máxima de apps de cada lote de um mesmo locale
+LOCALE_BATCH_SIZE = 1000
+
+# Limites de caracteres de cada loja (None: sem verificação)
+STORE_LIMITS = {
+    'apple': {'titulo': 30, 'subtitulo': 30, 'descrição': None},
+    'google': {'titulo': 50, 'subtitulo': 80, 'descrição': 4000},
+}
+
+# Nome de cada loja usado nas recomendações
+STORE_NAMES = {'apple': 'App Store', 'google': 'Google Play Store'}
+
+# Idioma das stopwords e do Punkt, abreviações (minúsculas, sem o ponto) que não encerram a
+# sentença e algoritmo de radicalização
+LOCALES = {
+    'pt-BR': {'language': 'portuguese', 'abbreviations': ('sr', 'sra', 'srta', 'dr', 'dra', 'prof', 'av'),
+              'stemmer': 'rslp'},
+    'en-US': {'language': 'english', 'abbreviations': ('mr', 'mrs', 'ms', 'dr', 'prof', 'inc', 'vs'),
+              'stemmer': 'snowball'},
+    'es-MX': {'language': 'spanish', 'abbreviations': ('sr', 'sra', 'srta', 'dr', 'dra', 'ud', 'uds', 'av'),
+              'stemmer': 'snowball'},
+}
+
+# Locale de cada país, usado quando o registro não traz o idioma
+COUNTRY_LOCALES = {'BR': 'pt-BR', 'US': 'en-US', 'MX': 'es-MX'}
+
+
+class LocaleProfile:
+    """Regras de análise de um locale: stopwords, tokenizador, radicalizador e limites de cada loja.
+
+    Os perfis são montados uma única vez por processo (veja `get_profile`); as stopwords,
+    em frozenset, são carregadas no primeiro uso e compartilhadas com os demais perfis do idioma.
+    """
+
+    __slots__ = ('locale', 'language', 'abbreviations', 'tokenizer', 'stemmer_algorithm', 'limits')
+
+    def __init__(self, locale, language, abbreviations=(), tokenizer=DEFAULT_TOKENIZER, stemmer='snowball',
+                 limits=None):
+        self.locale = locale
+        self.language = language
+        self.abbreviations = frozenset(abbreviations)
+        get_tokenizer(tokenizer)  # Valida o nome do backend
+        self.tokenizer = TOKENIZERS[tokenizer].for_locale(language, self.abbreviations)
+        self.stemmer_algorithm = stemmer
+        self.limits = limits or STORE_LIMITS
+
+    @property
+    def stop_words(self):
+        """Stopwords do idioma (frozenset)."""
+        return get_stopwords(self.language)
+
+    @property
+    def stemmer(self):
+        """Radicalizador do idioma, com memo LRU compartilhado no processo."""
+        return get_stemmer(self.language, self.stemmer_algorithm)
+
+    def store_limits(self, store):
+        """Limites de caracteres da loja (a Google Play é o padrão)."""
+        return self.limits.get(store, self.limits['google'])
+
+    def __repr__(self):
+        return f"LocaleProfile({self.locale!r}, tokenizer={self.tokenizer.name!r})"
+
+
+@lru_cache(maxsize=None)
+def get_profile(locale=DEFAULT_LOCALE, tokenizer=DEFAULT_TOKENIZER):
+    """Retorna o perfil (compartilhado) do locale para o backend de tokenização pedido."""
+    try:
+        settings = LOCALES[locale]
+    except KeyError:
+        raise ValueError(f"Locale desconhecido: {locale}. Opções: {', '.join(LOCALES)}")
+    return LocaleProfile(locale, settings['language'], settings['abbreviations'], tokenizer, settings['stemmer'])
+
+
+def _normalize(lang):
+    """Normaliza códigos como 'pt_br' ou 'PT-br' para 'pt-BR'."""
+    language, _, region = lang.replace('_', '-').partition('-')
+    return f"{language.lower()}-{region.upper()}" if region else language.lower()
+
+
+def resolve_locale(data):
+    """Locale de um app a partir dos metadados da loja (`lang` e, na falta dele, `country`)."""
+    lang = data.get('lang')
+    if lang:
+        lang = _normalize(lang)
+        if lang in LOCALES:
+            return lang
+        # Mesmo idioma com outra região (ex.: pt-PT usa o perfil pt-BR)
+        language = lang.split('-')[0]
+        for locale in LOCALES:
+            if locale.split('-')[0] == language:
+                return locale
+    country = (data.get('country') or '').upper()
+    return COUNTRY_LOCALES.get(country, DEFAULT_LOCALE)
+
+
+def iter_locale_batches(app_items, batch_size=LOCALE_BATCH_SIZE):
+    """Agrupa pares (app_name, data) em lotes de um mesmo locale, gerando pares (locale, lote).
+
+    Cada lote tem no máximo `batch_size` apps, e no máximo um lote por locale fica em memória.
+    Dentro de um locale a ordem de entrada é mantida.
+    """
+    batches = {}
+    for app_name, data in app_items:
+        locale = resolve_locale(data)
+        batch = batches.setdefault(locale, [])
+        batch.append((app_name, data))
+        if len(batch) >= batch_size:
+            yield locale, batches.pop(locale)
+    yield from batches.items()
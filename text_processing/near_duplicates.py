@@ -0,0 +1,210 @@
+import argparse
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+import numpy as np
+
+from text_processing.loader import file_path, iter_apps
+from text_processing.tokenizers import DEFAULT_TOKENIZER, get_tokenizer
+
+# Similaridade de Jaccard mínima para duas descrições serem consideradas quase duplicatas
+DEFAULT_THRESHOLD = 0.8
+
+# Quantidade de funções de hash da assinatura MinHash
+DEFAULT_NUM_PERM = 128
+
+# Quantidade de palavras de cada shingle
+DEFAULT_SHINGLE_SIZE = 3
+
+# Versão do formato salvo em disco
+INDEX_FORMAT_VERSION = 1
+
+# Primo de Mersenne 2^61 - 1 e maior valor de hash (32 bits) usados nas permutações
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(words, size=DEFAULT_SHINGLE_SIZE):
+    """Conjunto de shingles (sequências de `size` palavras) de um texto; textos curtos viram um único shingle."""
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _hash_shingles(items):
+    """Hash estável de 32 bits de cada shingle (o mesmo em qualquer processo ou execução)."""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=4).digest(), 'little') for item in items),
+        dtype=np.uint64, count=len(items),
+    )
+
+
+def _integrate(func, start, end, steps=100):
+    """Integral numérica (regra do trapézio) de `func` em [start, end]."""
+    width = (end - start) / steps
+    values = [func(start + i * width) for i in range(steps + 1)]
+    return width * (sum(values) - (values[0] + values[-1]) / 2)
+
+
+@lru_cache(maxsize=None)
+def optimal_bands(threshold, num_perm):
+    """Escolhe (bandas, linhas por banda) que minimizam falsos positivos e falsos negativos em torno do limiar.
+
+    A probabilidade de dois textos com similaridade s virarem candidatos é 1 - (1 - s^r)^b;
+    a escolha minimiza a soma das áreas abaixo (falsos positivos) e acima (falsos negativos) do limiar.
+    """
+    best, best_error = None, None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            def candidate(s, b=bands, r=rows):
+                return 1 - (1 - s ** r) ** b
+            error = (_integrate(candidate, 0.0, threshold)
+                     + _integrate(lambda s: 1 - candidate(s), threshold, 1.0))
+            if best_error is None or error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateIndex:
+    """Índice MinHash + LSH para encontrar descrições quase duplicadas sem comparar todos os pares.
+
+    Cada descrição vira uma assinatura MinHash dos seus shingles de palavras, dividida em
+    bandas; descrições que coincidem em alguma banda são candidatas e só elas têm a
+    similaridade estimada pela assinatura. Inserções e consultas custam O(bandas), então
+    agrupar o catálogo inteiro é aproximadamente linear no número de apps.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM,
+                 shingle_size=DEFAULT_SHINGLE_SIZE, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        # Tabelas das bandas: chave da banda -> chaves dos textos
+        self._buckets = [{} for _ in range(self.bands)]
+        # chave -> (assinatura, valor associado)
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def signature(self, words):
+        """Assinatura MinHash (vetor de `num_perm` inteiros) de uma lista de palavras."""
+        hashes = _hash_shingles(list(shingles(words, self.shingle_size)))
+        if not len(hashes):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # (a * h + b) mod p, limitado a 32 bits, para cada permutação e cada shingle
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+    def add(self, key, signature, value=None):
+        """Indexa uma assinatura sob `key`, substituindo a anterior, com um valor associado opcional."""
+        if key in self.entries:
+            self.remove(key)
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band_key, []).append(key)
+        self.entries[key] = (signature, value)
+
+    def remove(self, key):
+        """Remove uma chave do índice."""
+        signature, _ = self.entries.pop(key)
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            keys = bucket[band_key]
+            keys.remove(key)
+            if not keys:
+                del bucket[band_key]
+
+    @staticmethod
+    def similarity(signature, other):
+        """Similaridade de Jaccard estimada entre duas assinaturas."""
+        return float(np.count_nonzero(signature == other)) / len(signature)
+
+    def query(self, signature, exclude=None):
+        """Chaves quase duplicadas da assinatura, como pares (chave, similaridade), da mais parecida à menos."""
+        candidates = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band_key, ()))
+        candidates.discard(exclude)
+        scored = [(key, self.similarity(signature, self.entries[key][0])) for key in candidates]
+        return sorted(
+            [(key, score) for key, score in scored if score >= self.threshold],
+            key=lambda item: (-item[1], str(item[0])),
+        )
+
+    def find_duplicate(self, signature, exclude=None):
+        """A chave mais parecida acima do limiar, como par (chave, similaridade), ou None."""
+        matches = self.query(signature, exclude)
+        return matches[0] if matches else None
+
+    def clusters(self):
+        """Grupos de chaves quase duplicadas (com dois ou mais itens), unindo os pares encontrados pelo LSH."""
+        parent = {key: key for key in self.entries}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for key, (signature, _) in self.entries.items():
+            for other, _ in self.query(signature, exclude=key):
+                root, other_root = find(key), find(other)
+                if root != other_root:
+                    parent[other_root] = root
+
+        groups = {}
+        for key in self.entries:
+            groups.setdefault(find(key), []).append(key)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def save(self, path):
+        """Salva o índice em disco (pickle)."""
+        with open(path, 'wb') as file:
+            pickle.dump((INDEX_FORMAT_VERSION, self), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Carrega um índice salvo com `save`."""
+        with open(path, 'rb') as file:
+            version, index = pickle.load(file)
+        if version != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Versão do índice incompatível: {version} (esperada {INDEX_FORMAT_VERSION})")
+        return index
+
+
+def find_clusters(app_items, threshold=DEFAULT_THRESHOLD, tokenizer=DEFAULT_TOKENIZER, **kwargs):
+    """Agrupa os apps com descrições quase duplicadas (similaridade de Jaccard acima de `threshold`)."""
+    tokenize = get_tokenizer(tokenizer).tokenize
+    index = NearDuplicateIndex(threshold=threshold, **kwargs)
+    for app_name, data in app_items:
+        words = [token for token in tokenize(data['descrição'].lower()) if token.isalnum()]
+        index.add(app_name, index.signature(words))
+    return index.clusters()
+
+
+def main(path=file_path, threshold=DEFAULT_THRESHOLD):
+    """Imprime os grupos de apps com descrições quase duplicadas."""
+    clusters = find_clusters(iter_apps(path), threshold=threshold)
+    print(f"{len(clusters)} grupos de descrições quase duplicadas (Jaccard >= {threshold}):")
+    for members in sorted(clusters, key=len, reverse=True):
+        print(f"- {', '.join(sorted(members))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detecção de descrições quase duplicadas com MinHash/LSH")
+    parser.add_argument("--data", default=file_path, help="Arquivo de apps (JSON ou JSON Lines)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+    main(os.path.abspath(args.data), args.threshold)
@@ -0,0 +1,192 @@
+import heapq
+import math
+
+from text_processing.tokenizers import DEFAULT_TOKENIZER, get_tokenizer
+
+# Quantidade máxima de n-gramas acompanhados por ordem (bigramas, trigramas) em cada grupo
+DEFAULT_CAPACITY = 50_000
+
+# Quantidade máxima de palavras acompanhadas em cada grupo (usadas no cálculo do PMI)
+DEFAULT_UNIGRAM_CAPACITY = 100_000
+
+# Ordens de n-grama contadas por padrão
+DEFAULT_ORDERS = (2, 3)
+
+# Grupo que reúne o corpus inteiro, além dos grupos por loja
+ALL_GROUP = 'todos'
+
+
+class SpaceSaving:
+    """Sketch Space-Saving: conta os itens mais frequentes de um fluxo com memória limitada.
+
+    Acompanha no máximo `capacity` itens. Quando um item novo chega com a tabela cheia, ele
+    substitui o item de menor contagem e herda essa contagem como erro máximo. Todo item com
+    frequência real acima de total/capacity está garantidamente na tabela, e a contagem de
+    cada item superestima a real em no máximo `error(item)`.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.total = 0
+        self._counts = {}
+        self._errors = {}
+        # Heap com uma entrada (contagem, item) por item acompanhado, usado para achar o mínimo.
+        # As contagens só crescem, então uma entrada pode estar desatualizada, mas nunca acima da real.
+        self._heap = []
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __contains__(self, item):
+        return item in self._counts
+
+    def __getitem__(self, item):
+        """Contagem estimada do item (0 se ele não estiver sendo acompanhado)."""
+        return self._counts.get(item, 0)
+
+    def error(self, item):
+        """Erro máximo da contagem do item (0 enquanto a tabela nunca transbordou)."""
+        return self._errors.get(item, 0)
+
+    def add(self, item, count=1):
+        """Registra `count` ocorrências do item."""
+        self.total += count
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+            return
+        if len(counts) < self.capacity:
+            counts[item] = count
+            heapq.heappush(self._heap, (count, item))
+            return
+
+        # Tabela cheia: o item novo substitui o de menor contagem
+        heap = self._heap
+        while True:
+            minimum, evicted = heap[0]
+            current = counts[evicted]
+            if current == minimum:
+                break
+            # Entrada desatualizada: atualiza a contagem e procura o mínimo de novo
+            heapq.heapreplace(heap, (current, evicted))
+        del counts[evicted]
+        self._errors.pop(evicted, None)
+        counts[item] = minimum + count
+        self._errors[item] = minimum
+        heapq.heapreplace(heap, (minimum + count, item))
+
+    def items(self):
+        """Pares (item, contagem estimada) acompanhados."""
+        return self._counts.items()
+
+    def most_common(self, n=None):
+        """Os `n` itens de maior contagem, como pares (item, contagem)."""
+        if n is None:
+            return sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return heapq.nsmallest(n, self._counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+class NgramStats:
+    """Contagens de palavras e n-gramas de um grupo de descrições, cada uma num sketch limitado."""
+
+    def __init__(self, orders=DEFAULT_ORDERS, capacity=DEFAULT_CAPACITY,
+                 unigram_capacity=DEFAULT_UNIGRAM_CAPACITY):
+        self.documents = 0
+        self.unigrams = SpaceSaving(unigram_capacity)
+        self.ngrams = {order: SpaceSaving(capacity) for order in orders}
+
+    def add(self, runs):
+        """Conta as palavras e n-gramas de um documento já dividido em trechos sem pontuação."""
+        self.documents += 1
+        for words, ngrams in runs:
+            for word in words:
+                self.unigrams.add(word)
+            for order, grams in ngrams.items():
+                sketch = self.ngrams[order]
+                for gram in grams:
+                    sketch.add(gram)
+
+    def top_frequent(self, order, n=20):
+        """N-gramas mais frequentes da ordem pedida, como pares (n-grama, contagem)."""
+        return self.ngrams[order].most_common(n)
+
+    def pmi(self, ngram):
+        """PMI do n-grama: log2(c(w1..wn) * N^(n-1) / (c(w1) * ... * c(wn))), com N o total de palavras."""
+        total = self.unigrams.total
+        count = self.ngrams[len(ngram)][ngram]
+        score = math.log2(count) + (len(ngram) - 1) * math.log2(total)
+        for word in ngram:
+            score -= math.log2(self.unigrams[word] or 1)
+        return score
+
+    def top_pmi(self, order, n=20, min_count=3):
+        """N-gramas de maior PMI entre os que ocorrem ao menos `min_count` vezes, como pares (n-grama, PMI)."""
+        candidates = [gram for gram, count in self.ngrams[order].items() if count >= min_count]
+        scored = ((gram, self.pmi(gram)) for gram in candidates)
+        return heapq.nsmallest(n, scored, key=lambda item: (-item[1], item[0]))
+
+
+class CorpusNgramCounter:
+    """Contador de bigramas e trigramas do corpus inteiro e por loja, processando uma descrição por vez.
+
+    Os n-gramas não atravessam pontuação e não começam nem terminam em stopword. A memória
+    fica limitada pela capacidade dos sketches, independentemente do tamanho do catálogo.
+    """
+
+    def __init__(self, orders=DEFAULT_ORDERS, capacity=DEFAULT_CAPACITY,
+                 unigram_capacity=DEFAULT_UNIGRAM_CAPACITY, tokenizer=DEFAULT_TOKENIZER,
+                 stop_words=frozenset()):
+        self.orders = tuple(orders)
+        self.capacity = capacity
+        self.unigram_capacity = unigram_capacity
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.stop_words = frozenset(stop_words)
+        self.groups = {}
+
+    def group(self, name=ALL_GROUP):
+        """Estatísticas de um grupo (`ALL_GROUP` ou o nome da loja), criadas no primeiro uso."""
+        stats = self.groups.get(name)
+        if stats is None:
+            stats = self.groups[name] = NgramStats(self.orders, self.capacity, self.unigram_capacity)
+        return stats
+
+    def add(self, tokens, store=None):
+        """Conta os n-gramas de um documento (lista de tokens em minúsculas) no corpus e na loja."""
+        runs = [(run, self._ngrams(run)) for run in _alnum_runs(tokens)]
+        self.group(ALL_GROUP).add(runs)
+        if store is not None:
+            self.group(store).add(runs)
+
+    def add_text(self, text, store=None):
+        """Tokeniza e conta uma descrição."""
+        self.add(self.tokenizer.tokenize(text.lower()), store)
+
+    def add_apps(self, app_items):
+        """Conta as descrições de pares (app_name, data), agrupando também pela loja de cada app."""
+        for _, data in app_items:
+            self.add_text(data["descrição"], data.get("store", "google"))
+        return self
+
+    def _ngrams(self, words):
+        """N-gramas de cada ordem de um trecho, sem stopwords nas pontas."""
+        stop_words = self.stop_words
+        ngrams = {}
+        for order in self.orders:
+            ngrams[order] = [
+                gram for gram in zip(*(words[i:] for i in range(order)))
+                if gram[0] not in stop_words and gram[-1] not in stop_words
+            ]
+        return ngrams
+
+
+def _alnum_runs(tokens):
+    """Divide os tokens em trechos de palavras alfanuméricas consecutivas (a pontuação separa os trechos)."""
+    run = []
+    for token in tokens:
+        if token.isalnum():
+            run.append(token)
+        elif run:
+            yield run
+            run = []
+    if run:
+        yield run
@@ -0,0 +1,30 @@
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def ensure_nltk_data(resource_path):
+    """Garante que um recurso do NLTK (ex.: 'corpora/stopwords') esteja disponível, baixando-o se preciso.
+
+    A verificação é feita uma única vez por processo; as chamadas seguintes não acessam o disco.
+    """
+    import nltk
+
+    try:
+        nltk.data.find(resource_path)
+    except LookupError:
+        package = resource_path.rsplit('/', 1)[-1]
+        logger.info(f"Baixando recurso do NLTK: {package}")
+        nltk.download(package, quiet=True)
+    return resource_path
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language='portuguese'):
+    """Retorna as stopwords do idioma, carregadas no primeiro uso e compartilhadas depois."""
+    ensure_nltk_data('corpora/stopwords')
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words(language))
@@ -0,0 +1,165 @@
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# Quantidade padrão de itens enviados a cada worker por vez
+DEFAULT_CHUNKSIZE = 64
+
+# Quantidade padrão de itens em trânsito entre duas etapas de um pipeline com threads
+DEFAULT_QUEUE_SIZE = 256
+
+# Intervalo (s) em que uma thread bloqueada numa fila confere se o pipeline foi interrompido
+_POLL_INTERVAL = 0.1
+
+# Marca o fim dos itens numa fila do pipeline
+_DONE = object()
+
+
+def chunked(iterable, size):
+    """Divide um iterável em listas de até `size` itens, sem materializá-lo por inteiro."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _apply_chunk(func, chunk, chunk_summary=None):
+    """Executa `func` sobre um bloco de itens dentro do processo worker.
+
+    Retorna os resultados e, se houver `chunk_summary`, o que ele devolver ao fim do bloco.
+    """
+    results = [func(item) for item in chunk]
+    return results, chunk_summary() if chunk_summary is not None else None
+
+
+def imap_ordered(func, iterable, workers=None, chunksize=DEFAULT_CHUNKSIZE,
+                 initializer=None, initargs=(), max_pending=None, chunk_summary=None, on_summary=None):
+    """Aplica `func` a cada item num pool de processos, devolvendo os resultados na ordem de entrada.
+
+    Os itens são enviados em blocos de `chunksize` para reduzir o custo de IPC, e no máximo
+    `max_pending` blocos ficam em processamento ao mesmo tempo, de modo que a entrada pode ser
+    um gerador consumido aos poucos. Com `chunk_summary` (função do worker, chamada ao fim de
+    cada bloco, como a coleta de métricas), `on_summary` recebe no processo principal o
+    resultado de cada bloco, antes dos resultados dos seus itens.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    def results(future):
+        items, summary = future.result()
+        if on_summary is not None:
+            on_summary(summary)
+        return items
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        pending = deque()
+        for chunk in chunked(iterable, chunksize):
+            pending.append(executor.submit(_apply_chunk, func, chunk, chunk_summary))
+            if len(pending) >= max_pending:
+                yield from results(pending.popleft())
+        while pending:
+            yield from results(pending.popleft())
+
+
+class _Failure:
+    """Exceção levantada numa thread do pipeline, repassada à thread que consome a fila."""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(items, item, stop):
+    """Coloca `item` na fila, desistindo se `stop` for sinalizado enquanto ela estiver cheia."""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(items):
+    """Gera os itens da fila até a marca de fim, relançando a falha da thread produtora."""
+    while True:
+        item = items.get()
+        if item is _DONE:
+            return
+        if isinstance(item, _Failure):
+            raise item.error
+        yield item
+
+
+def prefetch(iterable, maxsize=DEFAULT_QUEUE_SIZE):
+    """Consome `iterable` numa thread, mantendo até `maxsize` itens prontos à frente de quem itera.
+
+    Serve para sobrepor leitura de arquivo (que libera o GIL) e processamento. Exceções do
+    iterável são relançadas na thread que consome; se o consumo parar antes do fim, a
+    thread produtora é encerrada.
+    """
+    items = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in iterable:
+                if not _put(items, item, stop):
+                    return
+        except BaseException as e:
+            _put(items, _Failure(e), stop)
+        else:
+            _put(items, _DONE, stop)
+
+    thread = threading.Thread(target=produce, name='prefetch', daemon=True)
+    thread.start()
+    try:
+        yield from _drain(items)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def consume_in_thread(func, iterable, maxsize=DEFAULT_QUEUE_SIZE):
+    """Executa `func` numa thread sobre os itens de `iterable`, que é consumido na thread atual.
+
+    É o inverso de `prefetch`: a etapa final do pipeline (por exemplo, a escrita dos relatórios)
+    roda em segundo plano enquanto a thread atual produz os itens, com no máximo `maxsize` em
+    trânsito. Retorna o resultado de `func`; uma exceção em `func` interrompe a produção e é
+    relançada aqui.
+    """
+    items = queue.Queue(maxsize)
+    stop = threading.Event()
+    outcome = {}
+
+    def consume():
+        try:
+            outcome['result'] = func(_drain(items))
+        except BaseException as e:
+            outcome['error'] = e
+        finally:
+            # Libera a thread produtora caso `func` pare antes do fim
+            stop.set()
+
+    thread = threading.Thread(target=consume, name='consume', daemon=True)
+    thread.start()
+    try:
+        for item in iterable:
+            if not _put(items, item, stop):
+                break
+    except BaseException as e:
+        _put(items, _Failure(e), stop)
+        thread.join()
+        raise
+    else:
+        _put(items, _DONE, stop)
+        thread.join()
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
@@ -0,0 +1,208 @@
+import csv
+import json
+import os
+
+# Tamanho do buffer de escrita de cada arquivo do relatório
+BUFFER_SIZE = 1 << 16
+
+# Linhas acumuladas antes de gravar um bloco (row group) no Parquet
+PARQUET_BATCH_SIZE = 1000
+
+# Colunas da tabela do relatório (CSV ou Parquet), uma linha por app
+TABLE_COLUMNS = (
+    'app', 'titulo_caracteres', 'titulo_keywords', 'descricao_caracteres', 'total_palavras',
+    'keywords', 'bigramas', 'top_densidade', 'palavras_distintivas', 'recomendacoes',
+)
+
+# Separador dos valores em colunas de lista na tabela
+LIST_SEPARATOR = '; '
+
+
+def render_markdown(app_name, analysis, distinctive=None):
+    """Formata a análise de um app como markdown.
+
+    `distinctive` são as palavras distintivas do app no corpus, como pares (termo, peso).
+    """
+    lines = [
+        f"\n{'=' * 50}",
+        f"Análise do App: {app_name}",
+        f"{'=' * 50}",
+        "\n### Análise do Título:",
+        f"- Caracteres: {analysis['título']['caracteres']}",
+        f"- Palavras-chave: {', '.join(analysis['título']['análise_keywords']['keywords'])}",
+        "\n### Análise da Descrição:",
+        f"- Caracteres: {analysis['descrição']['caracteres']}",
+        f"- Total de palavras: {analysis['descrição']['análise_densidade']['total_palavras']}",
+        "\n### Densidade de Palavras (Top 10):",
+    ]
+    for palavra, info in _top_density(analysis):
+        lines.append(f"- {palavra}: {info['contagem']} ocorrências ({info['densidade']:.2f}%)")
+
+    radicais = analysis['descrição'].get('análise_densidade_radicais')
+    if radicais:
+        lines.append("\n### Densidade por Radical (Top 10):")
+        for radical, info in list(radicais['densidades'].items())[:10]:
+            lines.append(f"- {radical} ({', '.join(info['formas'])}): "
+                         f"{info['contagem']} ocorrências ({info['densidade']:.2f}%)")
+
+    if distinctive:
+        lines.append("\n### Palavras Distintivas no Corpus (TF-IDF):")
+        for palavra, peso in distinctive:
+            lines.append(f"- {palavra}: {peso:.3f}")
+
+    if analysis['recomendações']:
+        lines.append("\n### Recomendações:")
+        for rec in analysis['recomendações']:
+            lines.append(f"- {rec}")
+    return '\n'.join(lines) + '\n'
+
+
+def table_row(app_name, analysis, distinctive=None):
+    """Achata a análise de um app numa linha da tabela do relatório (colunas de TABLE_COLUMNS)."""
+    titulo = analysis['título']
+    descricao = analysis['descrição']
+    return {
+        'app': app_name,
+        'titulo_caracteres': titulo['caracteres'],
+        'titulo_keywords': LIST_SEPARATOR.join(titulo['análise_keywords']['keywords']),
+        'descricao_caracteres': descricao['caracteres'],
+        'total_palavras': descricao['análise_densidade']['total_palavras'],
+        'keywords': LIST_SEPARATOR.join(descricao['análise_keywords']['keywords']),
+        'bigramas': LIST_SEPARATOR.join(descricao['análise_keywords']['bigrams']),
+        'top_densidade': LIST_SEPARATOR.join(
+            f"{palavra}:{info['densidade']:.2f}" for palavra, info in _top_density(analysis)
+        ),
+        'palavras_distintivas': LIST_SEPARATOR.join(palavra for palavra, _ in distinctive or ()),
+        'recomendacoes': LIST_SEPARATOR.join(analysis['recomendações']),
+    }
+
+
+def _top_density(analysis, top=10):
+    """As `top` primeiras palavras da densidade (já ordenada), sem copiar o dicionário inteiro."""
+    densidades = analysis['descrição']['análise_densidade']['densidades']
+    return [item for item, _ in zip(densidades.items(), range(top))]
+
+
+class ReportWriter:
+    """Escreve o relatório de ASO em markdown, JSON Lines e tabela (CSV ou Parquet) numa única passada.
+
+    Cada análise é escrita assim que chega e descartada em seguida, então a memória não cresce
+    com a quantidade de apps. Só os formatos com caminho definido são gerados; a tabela é salva
+    em Parquet quando o caminho termina em `.parquet` (requer `pyarrow`) e em CSV nos demais casos.
+    """
+
+    def __init__(self, markdown_path=None, jsonl_path=None, table_path=None, buffer_size=BUFFER_SIZE):
+        self.markdown_path = markdown_path
+        self.jsonl_path = jsonl_path
+        self.table_path = table_path
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._markdown = None
+        self._jsonl = None
+        self._table = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self):
+        """Abre os arquivos de saída configurados."""
+        try:
+            if self.markdown_path:
+                self._markdown = self._open_text(self.markdown_path)
+            if self.jsonl_path:
+                self._jsonl = self._open_text(self.jsonl_path)
+            if self.table_path:
+                if self.table_path.lower().endswith('.parquet'):
+                    self._table = _ParquetTable(self.table_path)
+                else:
+                    self._table = _CsvTable(self._open_text(self.table_path, newline=''))
+        except BaseException:
+            # `__exit__` não roda quando `open` falha: fecha os arquivos que já tinham sido abertos
+            self.close()
+            raise
+        return self
+
+    def _open_text(self, path, newline=None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return open(path, 'w', encoding='utf-8', buffering=self.buffer_size, newline=newline)
+
+    def write(self, app_name, analysis, distinctive=None):
+        """Escreve a análise de um app em todos os formatos configurados."""
+        if self._markdown is not None:
+            self._markdown.write(render_markdown(app_name, analysis, distinctive))
+        if self._jsonl is not None:
+            record = {'app': app_name, 'análise': analysis}
+            if distinctive is not None:
+                record['palavras_distintivas'] = [[palavra, peso] for palavra, peso in distinctive]
+            self._jsonl.write(json.dumps(record, ensure_ascii=False) + '\n')
+        if self._table is not None:
+            self._table.write(table_row(app_name, analysis, distinctive))
+        self.count += 1
+
+    def write_all(self, results, distinctive_keywords=None):
+        """Escreve um dicionário ou iterável de pares (app_name, analysis) conforme é consumido."""
+        items = results.items() if isinstance(results, dict) else results
+        for app_name, analysis in items:
+            self.write(app_name, analysis, distinctive_keywords.get(app_name) if distinctive_keywords else None)
+        return self.count
+
+    def close(self):
+        """Grava o que estiver em buffer e fecha os arquivos."""
+        for output in (self._markdown, self._jsonl, self._table):
+            if output is not None:
+                output.close()
+        self._markdown = self._jsonl = self._table = None
+
+
+class _CsvTable:
+    """Tabela do relatório em CSV, escrita linha a linha."""
+
+    def __init__(self, file):
+        self.file = file
+        self.writer = csv.DictWriter(file, fieldnames=TABLE_COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetTable:
+    """Tabela do relatório em Parquet, gravada em blocos de PARQUET_BATCH_SIZE linhas."""
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("O relatório em Parquet requer o pacote pyarrow (pip install pyarrow)") from e
+        self._pa = pa
+        self.schema = pa.schema([
+            (column, pa.int64() if column in ('titulo_caracteres', 'descricao_caracteres', 'total_palavras')
+             else pa.string())
+            for column in TABLE_COLUMNS
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.writer.write_table(self._pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
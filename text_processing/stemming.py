@@ -0,0 +1,79 @@
+from functools import lru_cache
+
+from text_processing.nltk_resources import ensure_nltk_data
+
+# Quantidade máxima de palavras guardadas no memo de radicais
+DEFAULT_MEMO_SIZE = 50_000
+
+# Algoritmos disponíveis: RSLP (só português, requer o recurso 'rslp' do NLTK) e Snowball
+STEMMERS = ('rslp', 'snowball')
+
+
+class MemoStemmer:
+    """Radicalizador com memo LRU limitado de palavra para radical.
+
+    O vocabulário de um catálogo é pequeno perto do volume de tokens, então quase todas as
+    chamadas são respondidas pelo memo; `hit_rate` mostra a fração delas. O radicalizador do
+    NLTK só é carregado no primeiro uso.
+    """
+
+    def __init__(self, language='portuguese', algorithm='rslp', memo_size=DEFAULT_MEMO_SIZE):
+        if algorithm not in STEMMERS:
+            raise ValueError(f"Radicalizador desconhecido: {algorithm}. Opções: {', '.join(STEMMERS)}")
+        self.language = language
+        self.algorithm = algorithm
+        self.memo_size = memo_size
+        self._stemmer = None
+        # Memo próprio da instância, limitado a `memo_size` palavras
+        self.stem = lru_cache(maxsize=memo_size)(self._stem)
+
+    @property
+    def stemmer(self):
+        """Radicalizador do NLTK, criado uma única vez."""
+        if self._stemmer is None:
+            if self.algorithm == 'rslp':
+                ensure_nltk_data('stemmers/rslp')
+                from nltk.stem import RSLPStemmer
+                self._stemmer = RSLPStemmer()
+            else:
+                from nltk.stem.snowball import SnowballStemmer
+                self._stemmer = SnowballStemmer(self.language)
+        return self._stemmer
+
+    def _stem(self, word):
+        return self.stemmer.stem(word)
+
+    def cache_info(self):
+        """Estatísticas do memo (acertos, falhas, tamanho máximo e atual)."""
+        return self.stem.cache_info()
+
+    @property
+    def hit_rate(self):
+        """Fração das chamadas respondidas pelo memo (0.0 se nenhuma foi feita)."""
+        info = self.stem.cache_info()
+        total = info.hits + info.misses
+        return info.hits / total if total else 0.0
+
+    def stem_counts(self, word_counts):
+        """Soma as contagens das formas de cada radical.
+
+        Recebe pares (palavra, contagem) e devolve {radical: [contagem, {forma: contagem}]},
+        com as formas na ordem em que aparecem.
+        """
+        stems = {}
+        stem = self.stem
+        for word, count in word_counts:
+            root = stem(word)
+            entry = stems.get(root)
+            if entry is None:
+                stems[root] = [count, {word: count}]
+            else:
+                entry[0] += count
+                entry[1][word] = count
+        return stems
+
+
+@lru_cache(maxsize=None)
+def get_stemmer(language='portuguese', algorithm='rslp'):
+    """Retorna o radicalizador (compartilhado no processo) do idioma e algoritmo pedidos."""
+    return MemoStemmer(language, algorithm)
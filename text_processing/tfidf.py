@@ -0,0 +1,222 @@
+import hashlib
+import pickle
+
+import numpy as np
+
+from text_processing.tokenizers import DEFAULT_TOKENIZER, get_tokenizer
+from text_processing.tokens import TokenDocument
+
+# Quantidade padrão de palavras distintivas por app
+DEFAULT_TOP_K = 10
+
+# Versão do formato salvo em disco
+INDEX_FORMAT_VERSION = 1
+
+
+def _digest(text):
+    """Hash do texto de uma descrição, usado para saber se ela mudou desde a última indexação."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class TfidfIndex:
+    """Índice do corpus com vocabulário e matriz documento-termo esparsa para TF-IDF.
+
+    Cada app é guardado como uma linha esparsa (ids dos termos e contagens), e a frequência
+    de documentos de cada termo é mantida de forma incremental: adicionar, atualizar ou
+    remover um app só mexe na sua própria linha. A matriz no formato CSR é montada sob
+    demanda a partir das linhas, sem tokenizar o corpus de novo.
+    """
+
+    def __init__(self, tokenizer=DEFAULT_TOKENIZER, stop_words=frozenset()):
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.stop_words = frozenset(stop_words)
+        # Vocabulário: termo -> id, e a lista inversa id -> termo
+        self.vocabulary = {}
+        self.terms = []
+        # Linha de cada app: app_name -> (ids dos termos, contagens)
+        self._rows = {}
+        # Hash do texto indexado de cada app: app_name -> digest
+        self._digests = {}
+        self._df = np.zeros(0, dtype=np.int64)
+        self._csr = None
+
+    @classmethod
+    def from_apps(cls, app_items, **kwargs):
+        """Monta o índice a partir de pares (app_name, data), usando a descrição de cada app."""
+        index = cls(**kwargs)
+        for app_name, data in app_items:
+            index.add(app_name, data["descrição"])
+        return index
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, app_name):
+        return app_name in self._rows
+
+    def add(self, app_name, text):
+        """Adiciona (ou atualiza) um app a partir do texto bruto ou de um TokenDocument."""
+        if not isinstance(text, TokenDocument):
+            text = TokenDocument(text, self.tokenizer.tokenize(text.lower()))
+        if app_name in self._rows:
+            self.remove(app_name)
+
+        counts = {}
+        for word in text.words:
+            if word not in self.stop_words:
+                term_id = self.vocabulary.get(word)
+                if term_id is None:
+                    term_id = self.vocabulary[word] = len(self.terms)
+                    self.terms.append(word)
+                counts[term_id] = counts.get(term_id, 0) + 1
+
+        ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        order = np.argsort(ids)
+        ids = ids[order]
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))[order]
+
+        if len(self.terms) > len(self._df):
+            # Cresce a frequência de documentos em blocos para não realocar a cada termo novo
+            df = np.zeros(max(len(self.terms), 2 * len(self._df)), dtype=np.int64)
+            df[:len(self._df)] = self._df
+            self._df = df
+        self._df[ids] += 1
+        self._rows[app_name] = (ids, values)
+        self._digests[app_name] = _digest(text.text)
+        self._csr = None
+
+    def remove(self, app_name):
+        """Remove um app do índice."""
+        ids, _ = self._rows.pop(app_name)
+        del self._digests[app_name]
+        self._df[ids] -= 1
+        self._csr = None
+
+    def is_current(self, app_name, text):
+        """Indica se o app já está indexado com exatamente este texto."""
+        return self._digests.get(app_name) == _digest(text)
+
+    def sync(self, app_items):
+        """Atualiza o índice para o corpus de pares (app_name, data), mexendo só no que mudou.
+
+        Só descrições novas ou alteradas são tokenizadas; apps que saíram do corpus são removidos.
+        Retorna a quantidade de apps (adicionados ou atualizados, removidos).
+        """
+        seen = set()
+        updated = 0
+        for app_name, data in app_items:
+            seen.add(app_name)
+            if not self.is_current(app_name, data["descrição"]):
+                self.add(app_name, data["descrição"])
+                updated += 1
+        removed = [app_name for app_name in self._rows if app_name not in seen]
+        for app_name in removed:
+            self.remove(app_name)
+        return updated, len(removed)
+
+    def save(self, path):
+        """Salva o índice em disco (pickle)."""
+        with open(path, 'wb') as file:
+            pickle.dump((INDEX_FORMAT_VERSION, self), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Carrega um índice salvo com `save`."""
+        with open(path, 'rb') as file:
+            version, index = pickle.load(file)
+        if version != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Versão do índice incompatível: {version} (esperada {INDEX_FORMAT_VERSION})")
+        return index
+
+    def idf(self):
+        """IDF suavizado de cada termo do vocabulário: log((1 + N) / (1 + df)).
+
+        Termos presentes em todos os apps recebem peso zero, já que não distinguem nenhum deles.
+        """
+        df = self._df[:len(self.terms)]
+        return np.log((1 + len(self._rows)) / (1 + df))
+
+    def term_matrix(self):
+        """Retorna a matriz documento-termo de contagens no formato CSR.
+
+        O resultado é (app_names, indptr, indices, data), com a linha `i` de `app_names[i]`
+        nas posições `indptr[i]:indptr[i + 1]` de `indices` (ids dos termos) e `data` (contagens).
+        """
+        if self._csr is None:
+            app_names = list(self._rows)
+            rows = list(self._rows.values())
+            lengths = np.fromiter((len(ids) for ids, _ in rows), dtype=np.int64, count=len(rows))
+            indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            indices = np.concatenate([ids for ids, _ in rows]) if rows else np.zeros(0, dtype=np.int64)
+            data = np.concatenate([values for _, values in rows]) if rows else np.zeros(0)
+            self._csr = (app_names, indptr, indices, data)
+        return self._csr
+
+    def tfidf_matrix(self):
+        """Retorna a matriz TF-IDF (normalizada por L2 em cada linha) no mesmo formato de `term_matrix`."""
+        app_names, indptr, indices, data = self.term_matrix()
+        weights = data * self.idf()[indices]
+        # Norma de cada linha, calculada de uma vez para todo o corpus
+        row_ids = np.repeat(np.arange(len(app_names)), np.diff(indptr))
+        norms = np.sqrt(np.bincount(row_ids, weights=weights ** 2, minlength=len(app_names)))
+        norms[norms == 0] = 1.0
+        return app_names, indptr, indices, weights / norms[row_ids]
+
+    def distinctive_keywords(self, app_name, top_k=DEFAULT_TOP_K, idf=None):
+        """Retorna as `top_k` palavras mais distintivas de um app, como pares (termo, peso).
+
+        `idf` permite reaproveitar o resultado de `idf()` ao consultar vários apps seguidos.
+        """
+        ids, counts = self._rows[app_name]
+        weights = counts * (self.idf() if idf is None else idf)[ids]
+        norm = np.sqrt(np.dot(weights, weights)) or 1.0
+        return self._top_terms(ids, weights / norm, top_k)
+
+    def distinctive_lookup(self, top_k=DEFAULT_TOP_K):
+        """Palavras distintivas calculadas app a app sob demanda (veja `DistinctiveKeywords`)."""
+        return DistinctiveKeywords(self, top_k)
+
+    def all_distinctive_keywords(self, top_k=DEFAULT_TOP_K):
+        """Retorna um dicionário app_name -> palavras distintivas, calculadas sobre a matriz inteira."""
+        app_names, indptr, indices, weights = self.tfidf_matrix()
+        return {
+            app_name: self._top_terms(indices[start:end], weights[start:end], top_k)
+            for app_name, start, end in zip(app_names, indptr[:-1], indptr[1:])
+        }
+
+    def _top_terms(self, ids, weights, top_k):
+        """Seleciona os `top_k` maiores pesos positivos (empates resolvidos pela ordem alfabética do termo)."""
+        positive = weights > 0
+        ids, weights = ids[positive], weights[positive]
+        if len(weights) > top_k:
+            # Mantém todos os empatados com o k-ésimo peso antes da ordenação final
+            threshold = np.partition(weights, -top_k)[-top_k]
+            keep = weights >= threshold
+            ids, weights = ids[keep], weights[keep]
+        ranked = sorted(zip(weights.tolist(), (self.terms[i] for i in ids.tolist())), key=lambda x: (-x[0], x[1]))
+        return [(term, weight) for weight, term in ranked[:top_k]]
+
+
+class DistinctiveKeywords:
+    """Consulta app_name -> palavras distintivas, calculadas só quando pedidas.
+
+    Substitui o dicionário de `all_distinctive_keywords` na escrita dos relatórios: o IDF é
+    calculado uma única vez e nada além do próprio índice fica em memória.
+    """
+
+    def __init__(self, index, top_k=DEFAULT_TOP_K):
+        self.index = index
+        self.top_k = top_k
+        self._idf = index.idf()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, app_name):
+        return app_name in self.index
+
+    def get(self, app_name, default=None):
+        if app_name not in self.index:
+            return default
+        return self.index.distinctive_keywords(app_name, self.top_k, idf=self._idf)
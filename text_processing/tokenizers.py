@@ -0,0 +1,228 @@
+import re
+from functools import lru_cache
+
+from text_processing.nltk_resources import ensure_nltk_data
+
+# Backend usado quando nenhum outro é pedido explicitamente
+DEFAULT_TOKENIZER = 'regex'
+
+# Pontuação que o tokenizador Treebank do NLTK sempre separa das palavras
+_SEPARATORS = "\\[\\](){}<>;@#$%&?!*«»“”‘’„\"`‒-―"
+
+# Divide um trecho sem espaços em tokens, seguindo as regras do Treebank
+_CHUNK_TOKEN_RE = re.compile(rf"""
+    \.{{2,}}                                        # reticências
+  | --                                              # travessão duplo
+  | `+ | ''                                         # aspas no estilo Treebank
+  | [{_SEPARATORS}]                                 # pontuação sempre separada
+  | [:,](?!\d)                                      # vírgula e dois-pontos fora de números
+  | (?:[^{_SEPARATORS}:,.'\-]|[:,](?=\d)|\.(?!\.)|-(?!-)|'(?!'))+   # corpo da palavra
+""", re.VERBOSE)
+
+# Pontuação final que, depois de uma palavra alfanumérica, sempre vira um token separado
+# (o ponto depende ainda da decisão de fim de sentença)
+_SIMPLE_TRAILING = frozenset(".,;:!?)]}%")
+
+# Ponto final de sentença, opcionalmente seguido de fechamento de parênteses ou aspas
+_FINAL_PERIOD_RE = re.compile(r"^(.*[^.])\.([\]\)}>\"'»”’]*)$", re.DOTALL)
+
+# Aspas simples de abertura e contrações em inglês tratadas pelo Treebank
+_STARTING_QUOTE_RE = re.compile(r"(?i)(?<!\w)(')(?!(?:re|ve|ll|m|t|s|d|n)\b)(?=\w)")
+_ENDING_QUOTE_RES = (
+    re.compile(r"([^'])' "),
+    re.compile(r"([^' ])('[sS]|'[mM]|'[dD]|') "),
+    re.compile(r"([^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T) "),
+)
+
+# Contrações em inglês que o Treebank separa (lista de Robert MacIntyre)
+_CONTRACTIONS = {
+    'cannot': ['can', 'not'],
+    'gimme': ['gim', 'me'],
+    'gonna': ['gon', 'na'],
+    'gotta': ['got', 'ta'],
+    'lemme': ['lem', 'me'],
+    'wanna': ['wan', 'na'],
+}
+_CONTRACTION_HINT_RE = re.compile(r"(?i)cannot|d'ye|gimme|gonna|gotta|lemme|more'n|wanna|'tis|'twas")
+_CONTRACTION_RES = tuple(re.compile(pattern) for pattern in (
+    r"(?i)\b(can)(not)\b",
+    r"(?i)\b(d)('ye)\b",
+    r"(?i)\b(gim)(me)\b",
+    r"(?i)\b(gon)(na)\b",
+    r"(?i)\b(got)(ta)\b",
+    r"(?i)\b(lem)(me)\b",
+    r"(?i)\b(more)('n)\b",
+    r"(?i)\b(wan)(na)(?=\s)",
+    r"(?i) ('t)(is)\b",
+    r"(?i) ('t)(was)\b",
+))
+
+# Regras do Punkt usadas para decidir se um ponto encerra a sentença
+_PUNKT_NON_WORD = r"(?:[)\";}\]\*:@'\({\[‘’“”«»!?])"
+_PUNKT_MULTI_CHAR = r"(?:\-{2,}|\.{2,}|(?:\.\s){2,}\.)"
+_PUNKT_WORD_RE = re.compile(rf"""(
+    {_PUNKT_MULTI_CHAR}
+  | (?=[^\(\"\`{{\[:;&\#\*@\)}}\]\-,])\S+?
+    (?=\s|$|{_PUNKT_NON_WORD}|{_PUNKT_MULTI_CHAR}|,(?=$|\s|{_PUNKT_NON_WORD}|{_PUNKT_MULTI_CHAR}))
+  | \S
+)""", re.VERBOSE)
+_PUNKT_NUMERIC_RE = re.compile(r"^-?[\.,]?\d[\d,\.-]*\.?$")
+_PUNKT_INITIAL_RE = re.compile(r"[^\W\d]\.$")
+_PUNKT_SENTENCE_INTERNAL = frozenset(";:,.!?")
+# Fechamentos que o Punkt devolve à sentença anterior quando aparecem isolados
+_PUNKT_REALIGNMENT_RE = re.compile(r"[\"')\]}‘’“”«»]+")
+# Fechamentos que o Treebank aceita depois do ponto final da sentença
+_TREEBANK_CLOSERS = frozenset("])}'»”’")
+
+
+class RegexTokenizer:
+    """Tokenizador pré-compilado e Unicode, equivalente ao `word_tokenize` do NLTK para as palavras alfanuméricas.
+
+    O texto é dividido em espaços e cada trecho que não é puramente alfanumérico passa por uma
+    única expressão regular com as regras do Treebank. A segmentação em sentenças do Punkt é
+    substituída pelas mesmas heurísticas locais que ele aplica a números, iniciais e abreviações.
+    Diferenças conhecidas: abreviações do modelo Punkt só são reconhecidas quando informadas em
+    `abbreviations`, e contrações em inglês só são separadas quando formam a palavra inteira.
+    """
+
+    name = 'regex'
+    # Os tokens de cada trecho entre espaços dependem só dele e do trecho seguinte
+    chunk_local = True
+
+    def __init__(self, abbreviations=frozenset()):
+        self.abbreviations = frozenset(abbreviations)
+
+    @classmethod
+    def for_locale(cls, language, abbreviations=frozenset()):
+        """Tokenizador com as abreviações do idioma (em minúsculas, sem o ponto)."""
+        return cls(abbreviations)
+
+    def tokenize(self, text):
+        """Divide o texto em tokens (palavras e pontuação)."""
+        chunks = text.split()
+        tokens = []
+        append = tokens.append
+        last = len(chunks) - 1
+        for index, chunk in enumerate(chunks):
+            if chunk.isalnum():
+                if chunk in _CONTRACTIONS:
+                    tokens.extend(_CONTRACTIONS[chunk])
+                else:
+                    append(chunk)
+            else:
+                tokens.extend(self._split_chunk(chunk, chunks[index + 1] if index < last else None))
+        return tokens
+
+    def _split_chunk(self, chunk, next_chunk):
+        """Separa a pontuação de um trecho sem espaços."""
+        head, tail = chunk[:-1], chunk[-1]
+        if tail in _SIMPLE_TRAILING and head.isalnum():
+            # Caso mais comum: palavra seguida de um único sinal de pontuação
+            if tail != '.' or self._is_sentence_break(chunk, next_chunk):
+                return _CONTRACTIONS.get(head, [head]) + [tail]
+            return [chunk]
+        match = _FINAL_PERIOD_RE.match(chunk)
+        if match and self._is_sentence_break(chunk, next_chunk):
+            return self._split_body(match.group(1)) + ['.'] + self._split_body(match.group(2), previous='.')
+        return self._split_body(chunk, at_end=next_chunk is None)
+
+    def _split_body(self, body, previous=' ', at_end=False):
+        """Aplica a expressão regular do Treebank e trata aspas, apóstrofos e contrações."""
+        tokens = []
+        pieces = _CHUNK_TOKEN_RE.findall(body)
+        last = len(pieces) - 1
+        for index, token in enumerate(pieces):
+            if token == '"' or token == "''":
+                # Aspas duplas viram `` na abertura e '' no fechamento, como no Treebank
+                tokens.append('``' if previous in ' ([{<' else "''")
+            else:
+                tokens.extend(_split_word(token, at_end and index == last))
+            previous = token[-1]
+        return tokens
+
+    def _is_sentence_break(self, chunk, next_chunk):
+        """Decide, como o Punkt, se o ponto no fim do trecho encerra a sentença."""
+        if next_chunk is None:
+            return True
+        if not self._punkt_sentence_break(chunk, next_chunk):
+            return False
+        if _PUNKT_REALIGNMENT_RE.fullmatch(next_chunk):
+            # Fechamentos isolados voltam para a sentença, e o Treebank só separa o ponto
+            # se todos forem fechamentos que ele aceita depois do ponto final
+            return set(next_chunk) <= _TREEBANK_CLOSERS and "''" not in next_chunk
+        return True
+
+    def _punkt_sentence_break(self, chunk, next_chunk):
+        """Aplica as heurísticas do Punkt para abreviações, números e iniciais."""
+        last_token = _PUNKT_WORD_RE.findall(chunk)[-1]
+        stem = last_token[:-1]
+        is_initial = _PUNKT_INITIAL_RE.match(last_token)
+        if stem in self.abbreviations or stem.split('-')[-1] in self.abbreviations:
+            return False
+        if not (is_initial or _PUNKT_NUMERIC_RE.match(last_token)):
+            return True
+        # Números e iniciais só encerram a sentença se a próxima palavra puder iniciá-la
+        next_token = _PUNKT_WORD_RE.match(next_chunk).group()
+        if next_token in _PUNKT_SENTENCE_INTERNAL or next_token[0].islower():
+            return False
+        if is_initial and next_token[0].isupper():
+            return False
+        return True
+
+
+def _split_word(token, at_end=False):
+    """Separa aspas simples e contrações em inglês de um token, na mesma ordem do Treebank.
+
+    `at_end` indica que o token encerra o texto, onde o Treebank não separa o apóstrofo final.
+    """
+    if "'" not in token or len(token) == 1:
+        if token in _CONTRACTIONS:
+            return _CONTRACTIONS[token]
+        if not _CONTRACTION_HINT_RE.search(token):
+            return [token]
+    text = ' ' + _STARTING_QUOTE_RE.sub(r"\1 ", token) + ' '
+    for regexp in _ENDING_QUOTE_RES[1:] if at_end else _ENDING_QUOTE_RES:
+        text = regexp.sub(r"\1 \2 " if regexp.groups == 2 else r"\1 ' ", text)
+    if _CONTRACTION_HINT_RE.search(text):
+        for regexp in _CONTRACTION_RES:
+            text = regexp.sub(r" \1 \2 ", text)
+    return text.split()
+
+
+class NLTKTokenizer:
+    """Tokenizador de referência: `word_tokenize` do NLTK (Punkt e Treebank)."""
+
+    name = 'nltk'
+    # A segmentação em sentenças do Punkt depende do texto inteiro
+    chunk_local = False
+
+    def __init__(self, language='english'):
+        self.language = language
+
+    @classmethod
+    def for_locale(cls, language, abbreviations=frozenset()):
+        """Tokenizador com o modelo Punkt do idioma (que já traz as próprias abreviações)."""
+        return cls(language)
+
+    def tokenize(self, text):
+        """Divide o texto em tokens usando o NLTK (o modelo Punkt é carregado no primeiro uso)."""
+        ensure_nltk_data('tokenizers/punkt_tab')
+        from nltk.tokenize import word_tokenize
+        return word_tokenize(text, language=self.language)
+
+
+TOKENIZERS = {
+    RegexTokenizer.name: RegexTokenizer,
+    NLTKTokenizer.name: NLTKTokenizer,
+}
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(name=DEFAULT_TOKENIZER):
+    """Retorna a instância (compartilhada) do backend de tokenização pedido; instâncias são devolvidas como estão."""
+    if not isinstance(name, str):
+        return name
+    try:
+        return TOKENIZERS[name]()
+    except KeyError:
+        raise ValueError(f"Tokenizador desconhecido: {name}. Opções: {', '.join(TOKENIZERS)}")
@@ -0,0 +1,26 @@
+from collections import Counter
+
+
+class TokenDocument:
+    """Texto tokenizado uma única vez e reaproveitado por todas as etapas da análise."""
+
+    __slots__ = ('text', 'tokens', 'words', '_word_counts')
+
+    def __init__(self, text, tokens):
+        """Guarda o texto original, os tokens em minúsculas e as palavras alfanuméricas."""
+        self.text = text
+        # Tokens completos (inclui pontuação), usados na busca de bigramas
+        self.tokens = tokens
+        # Apenas palavras alfanuméricas, usadas na densidade e nas palavras-chave
+        self.words = [token for token in tokens if token.isalnum()]
+        self._word_counts = None
+
+    @property
+    def word_counts(self):
+        """Frequência de cada palavra, calculada na primeira consulta e reaproveitada depois."""
+        if self._word_counts is None:
+            self._word_counts = Counter(self.words)
+        return self._word_counts
+
+    def __len__(self):
+        return len(self.words)